@@ -1 +1,24 @@
 """PyFlyt - Multi UAV simulation environment for reinforcement learning research."""
+
+
+def warmup() -> dict[str, int]:
+    """Compiles every PyFlyt kernel ahead of time, those of the core and of the environment packages.
+
+    Returns:
+        dict[str, int]: the number of compiled signatures of each kernel, keyed by qualified name.
+
+    """
+    import numpy as np
+
+    from PyFlyt.core.utils import compile_helpers
+
+    compile_helpers.warmup()
+
+    # the environments' own kernels, these live outside of the core
+    from PyFlyt.pz_envs.fixedwing_envs.ma_fixedwing_base_env import (
+        MAFixedwingBaseEnv,
+    )
+
+    MAFixedwingBaseEnv.compute_rotation_forward(np.zeros((2, 3)))
+
+    return compile_helpers.compiled_signatures()
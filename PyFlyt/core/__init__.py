@@ -1,4 +1,20 @@
 """Class implementations for creating custom UAVs in the PyBullet simulation environment."""
 
-from .aviary import Aviary
-from .utils.load_objs import loadOBJ, obj_collision, obj_visual
+from typing import TYPE_CHECKING
+
+from PyFlyt.core.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .aviary import Aviary
+    from .utils.load_objs import load_objs_batch, loadOBJ, obj_collision, obj_visual
+
+# members are imported on first use, so `import PyFlyt.core` does not pull in pybullet or numba
+_MEMBERS = {
+    "Aviary": (".aviary", "Aviary"),
+    "loadOBJ": (".utils.load_objs", "loadOBJ"),
+    "load_objs_batch": (".utils.load_objs", "load_objs_batch"),
+    "obj_collision": (".utils.load_objs", "obj_collision"),
+    "obj_visual": (".utils.load_objs", "obj_visual"),
+}
+__all__ = list(_MEMBERS)
+__getattr__, __dir__ = lazy_imports(__name__, _MEMBERS)
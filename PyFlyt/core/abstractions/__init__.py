@@ -1,12 +1,36 @@
 """Abstractions for PyFlyt drones."""
 
-from .base_controller import ControlClass
-from .base_drone import DroneClass
-from .base_wind_field import WindFieldClass
-from .boosters import Boosters
-from .boring_bodies import BoringBodies
-from .camera import Camera
-from .gimbals import Gimbals
-from .lifting_surfaces import LiftingSurface, LiftingSurfaces
-from .motors import Motors
-from .pid import PID
+from typing import TYPE_CHECKING
+
+from PyFlyt.core.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .base_controller import ControlClass
+    from .base_drone import DroneClass
+    from .base_wind_field import WindFieldClass
+    from .boosters import Boosters
+    from .boring_bodies import BoringBodies
+    from .camera import Camera
+    from .gimbals import Gimbals
+    from .lifting_surfaces import AeroTable, LiftingSurface, LiftingSurfaces
+    from .link_state_cache import LinkStateCache
+    from .motors import Motors
+    from .pid import PID
+
+_MEMBERS = {
+    "ControlClass": (".base_controller", "ControlClass"),
+    "DroneClass": (".base_drone", "DroneClass"),
+    "WindFieldClass": (".base_wind_field", "WindFieldClass"),
+    "Boosters": (".boosters", "Boosters"),
+    "BoringBodies": (".boring_bodies", "BoringBodies"),
+    "Camera": (".camera", "Camera"),
+    "Gimbals": (".gimbals", "Gimbals"),
+    "AeroTable": (".lifting_surfaces", "AeroTable"),
+    "LiftingSurface": (".lifting_surfaces", "LiftingSurface"),
+    "LiftingSurfaces": (".lifting_surfaces", "LiftingSurfaces"),
+    "LinkStateCache": (".link_state_cache", "LinkStateCache"),
+    "Motors": (".motors", "Motors"),
+    "PID": (".pid", "PID"),
+}
+__all__ = list(_MEMBERS)
+__getattr__, __dir__ = lazy_imports(__name__, _MEMBERS)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from abc import ABC, abstractmethod
+from typing import Callable
 
 import numpy as np
 from pybullet_utils import bullet_client
@@ -55,12 +56,11 @@ class DroneClass(ABC):
         >>>         drone_model=drone_model,
         >>>         np_random=np_random,
         >>>     )
-        >>>     with open(self.param_path, "rb") as f:
-        >>>         # load all params from yaml into components
-        >>>         all_params = yaml.safe_load(f)
+        >>>     # load all params from yaml into components, files are only parsed once per process
+        >>>     all_params = load_params(self.param_path)
         >>>
-        >>>         self.lifting_surfaces = LiftingSurfaces(...)
-        >>>         self.boosters = Boosters(...)
+        >>>     self.lifting_surfaces = LiftingSurfaces(...)
+        >>>     self.boosters = Boosters(...)
         >>>
         >>>     self.use_camera = use_camera
         >>>     if self.use_camera:
@@ -68,6 +68,10 @@ class DroneClass(ABC):
 
     """
 
+    # optional class that runs `update_physics` for many drones of this type at once, see `QuadXFleet`
+    # it stands in for the `update_physics` of the class that declares it, so subclasses or instances overriding that are never batched
+    fleet_class: None | type = None
+
     def __init__(
         self,
         p: bullet_client.BulletClient,
@@ -113,18 +117,27 @@ class DroneClass(ABC):
         """DEFINE SPAWN"""
         self.start_pos = start_pos
         self.start_orn = self.p.getQuaternionFromEuler(start_orn)
-        self.Id = self.p.loadURDF(
-            self.drone_path,
-            basePosition=self.start_pos,
-            baseOrientation=self.start_orn,
-            useFixedBase=False,
-            flags=self.p.URDF_USE_INERTIA_FROM_FILE,
-        )
+        body_pool = getattr(self.p, "body_pool", None)
+        if body_pool is not None:
+            # reuse a parked body instead of parsing the URDF and meshes again
+            self.Id = body_pool.acquire(self.drone_path, self.start_pos, self.start_orn)
+        else:
+            self.Id = self.p.loadURDF(
+                self.drone_path,
+                basePosition=self.start_pos,
+                baseOrientation=self.start_orn,
+                useFixedBase=False,
+                flags=self.p.URDF_USE_INERTIA_FROM_FILE,
+            )
 
         """DEFINE STATE AND SETPOINT"""
-        self.state: np.ndarray
+        self._state: np.ndarray = np.zeros((4, 3), dtype=np.float64)
+        self.quaternion: np.ndarray = np.array([0.0, 0.0, 0.0, 1.0])
+        self.rotation: np.ndarray = np.eye(3)
+        self._state_bound = False
         self.aux_state: np.ndarray
-        self.setpoint: np.ndarray
+        self._setpoint: np.ndarray = np.zeros((0,), dtype=np.float64)
+        self._on_setpoint_reshape: None | Callable[[], None] = None
 
         """DEFINE CONTROLLERS"""
         self.registered_controllers: dict[int, type[ControlClass]] = dict()
@@ -136,6 +149,131 @@ class DroneClass(ABC):
         self.depthImg: np.ndarray
         self.segImg: np.ndarray
 
+    @property
+    def state(self) -> np.ndarray:
+        """The `(4, 3)` state of the drone, this is a view into the `Aviary`'s fleet state buffer once bound.
+
+        The rows correspond to:
+            - `state[0, :]` represents body frame angular velocity
+            - `state[1, :]` represents ground frame angular position
+            - `state[2, :]` represents body frame linear velocity
+            - `state[3, :]` represents ground frame linear position
+
+        Returns:
+            np.ndarray:
+
+        """
+        return self._state
+
+    @state.setter
+    def state(self, state: np.ndarray) -> None:
+        """Writes the state in place, so that any bound fleet state buffer stays in sync.
+
+        Args:
+            state (np.ndarray): a `(4, 3)` array.
+
+        """
+        self._state[...] = state
+
+    def bind_state_buffers(
+        self, state: np.ndarray, quaternion: np.ndarray, rotation: np.ndarray
+    ) -> None:
+        """Binds the drone's state, quaternion and rotation matrix to views of the `Aviary`'s fleet buffers.
+
+        The current values are copied into the new buffers, so this can also be used to rebind after the drone's attributes have been replaced.
+
+        Args:
+            state (np.ndarray): a `(4, 3)` view to hold the state.
+            quaternion (np.ndarray): a `(4,)` view to hold the ground frame orientation quaternion.
+            rotation (np.ndarray): a `(3, 3)` view to hold the rotation matrix from the ground frame to the body frame.
+
+        """
+        state[...] = self._state
+        quaternion[...] = self.quaternion
+        rotation[...] = self.rotation
+        self._state = state
+        self.quaternion = quaternion
+        self.rotation = rotation
+        self._state_bound = True
+
+    def update_base_state(self) -> None:
+        """Reads the base state, quaternion and rotation matrix of the drone from PyBullet.
+
+        The `Aviary` does this for all its drones at once, so this is only called by drones whose state buffers are not bound, such as when a drone is used with a plain `BulletClient`.
+        """
+        lin_pos, quaternion = self.p.getBasePositionAndOrientation(self.Id)
+        lin_vel, ang_vel = self.p.getBaseVelocity(self.Id)
+
+        # express vels in local frame
+        rotation = np.array(self.p.getMatrixFromQuaternion(quaternion)).reshape(3, 3).T
+        self.quaternion[...] = quaternion
+        self.rotation[...] = rotation
+        self.state = np.stack(
+            [
+                rotation @ ang_vel,
+                self.p.getEulerFromQuaternion(quaternion),
+                rotation @ lin_vel,
+                lin_pos,
+            ],
+            axis=0,
+        )
+
+    def _in_contact(self) -> bool:
+        """Checks whether the drone touched anything on the last physics step, using the `Aviary`'s contact records when available.
+
+        Returns:
+            bool:
+
+        """
+        in_contact = getattr(self.p, "in_contact", None)
+        if in_contact is not None:
+            return in_contact(self.Id)
+        return len(self.p.getContactPoints(bodyA=self.Id)) > 0
+
+    @property
+    def setpoint(self) -> np.ndarray:
+        """The setpoint of the drone, this is a view into the `Aviary`'s shared setpoint buffer once bound.
+
+        Returns:
+            np.ndarray:
+
+        """
+        return self._setpoint
+
+    @setpoint.setter
+    def setpoint(self, setpoint: np.ndarray) -> None:
+        """Writes the setpoint in place if the shape is unchanged, otherwise replaces it and notifies the `Aviary` to rebind.
+
+        Args:
+            setpoint (np.ndarray): setpoint
+
+        """
+        if np.shape(setpoint) == self._setpoint.shape:
+            self._setpoint[...] = setpoint
+            return
+
+        self._setpoint = np.array(setpoint, dtype=np.float64)
+        if self._on_setpoint_reshape is not None:
+            self._on_setpoint_reshape()
+
+    def bind_setpoint_buffer(
+        self,
+        setpoint: np.ndarray,
+        on_reshape: None | Callable[[], None] = None,
+    ) -> None:
+        """Binds the drone's setpoint to a view of the `Aviary`'s shared setpoint buffer.
+
+        The current setpoint is copied into the new buffer.
+
+        Args:
+            setpoint (np.ndarray): a view of the same shape as the current setpoint.
+            on_reshape (None | Callable[[], None]): called whenever a setpoint of a different shape is assigned, which unbinds the setpoint.
+
+        """
+        setpoint[...] = self._setpoint
+        self._setpoint = setpoint
+        self._on_setpoint_reshape = on_reshape
+
     @abstractmethod
     def reset(self) -> None:
         """Resets the vehicle to the initial state.
@@ -161,6 +299,8 @@ class DroneClass(ABC):
     def update_control(self, physics_step: int) -> None:
         """Updates onboard flight control laws at a rate specified by `control_hz`.
 
+        The `Aviary` only calls this on physics steps where `physics_step % self.physics_control_ratio == 0`.
+
         Example Implementation:
             >>> def update_control(self, physics_step: int) -> None:
             >>>     # skip control if we have not enough physics steps
@@ -170,7 +310,8 @@ class DroneClass(ABC):
             >>>     # depending on the flight control mode, do things
             >>>     if self.mode == 0:
             >>>         # assign the actuator commands to be some function of the setpoint
-            >>>         self.cmd = self.setpoint
+            >>>         # the setpoint is a view into the `Aviary`'s shared buffer, so copy it rather than alias it
+            >>>         self.cmd = self.setpoint.copy()
             >>>         return
             >>>
             >>>     # otherwise, check that we have a custom controller
@@ -179,11 +320,27 @@ class DroneClass(ABC):
             >>>             f"Don't have other modes aside from 0, received {self.mode}."
             >>>         )
             >>>
-            >>>     # run custom controllers if any
-            >>>     self.cmd = self.instanced_controllers[self.mode].step(self.state, self.setpoint)
+            >>>     # run custom controllers if any, copying their output in case it is the setpoint itself
+            >>>     self.cmd = np.array(
+            >>>         self.instanced_controllers[self.mode].step(self.state, self.setpoint),
+            >>>         dtype=np.float64,
+            >>>     )
         """
         raise NotImplementedError
 
+    def check_command(self) -> None:
+        """Checks that the output of the last control update is within what the components accept, raising a ValueError otherwise.
+
+        The `Aviary` calls this right after every `update_control`.
+        Components only check their own inputs on every physics step when the `Aviary` is in strict mode, so this is where bad commands get caught otherwise.
+        By default, this does nothing.
+
+        Example Implementation:
+            >>> def check_command(self) -> None:
+            >>>     check_bounds("cmd", self.cmd, self.cmd_low, self.cmd_high)
+        """
+        pass
+
     @abstractmethod
     def update_physics(self) -> None:
         """Updates all physics on the vehicle at a rate specified by `physics_hz`.
@@ -200,25 +357,18 @@ class DroneClass(ABC):
     def update_state(self) -> None:
         """Updates the vehicle's state values at a rate specified by `phyiscs_hz`.
 
+        Before this is called, the `Aviary` fills in `self.state`, `self.quaternion` and `self.rotation` for all armed drones at once.
+        Drones that need a different state can still compute it here and assign it to `self.state`.
+        Drones that may be used outside of an `Aviary` should call `update_base_state` here when their state buffers are not bound.
+
         Example Implementation:
             >>> def update_state(self) -> None:
-            >>>     # get all relevant information from PyBullet backend
-            >>>     lin_pos, ang_pos = self.p.getBasePositionAndOrientation(self.Id)
-            >>>     lin_vel, ang_vel = self.p.getBaseVelocity(self.Id)
-            >>>
-            >>>     # express vels in local frame
-            >>>     rotation = np.array(self.p.getMatrixFromQuaternion(ang_pos)).reshape(3, 3).T
-            >>>     lin_vel = np.matmul(rotation, lin_vel)
-            >>>     ang_vel = np.matmul(rotation, ang_vel)
-            >>>
-            >>>     # ang_pos in euler form
-            >>>     ang_pos = self.p.getEulerFromQuaternion(ang_pos)
-            >>>
-            >>>     # create the state, this is accessed from the aviary
-            >>>     self.state = np.stack([ang_vel, ang_pos, lin_vel, lin_pos], axis=0)
+            >>>     # outside of an `Aviary`, nothing fills in the base state for us
+            >>>     if not self._state_bound:
+            >>>         self.update_base_state()
             >>>
             >>>     # update all relevant components as required
-            >>>     self.lifting_surfaces.state_update(rotation)
+            >>>     self.lifting_surfaces.state_update(self.rotation)
             >>>     ...
             >>>
             >>>     # update auxiliary information
@@ -232,6 +382,9 @@ class DroneClass(ABC):
     def update_last(self, physics_step: int) -> None:
         """Update that happens at the end of `Aviary.step()`, usually reserved for camera updates.
 
+        For drones that define `use_camera` and `physics_camera_ratio`, the `Aviary` only calls this on physics steps where `use_camera` is set and `physics_step % self.physics_camera_ratio == 0`.
+        Drones that do not define these attributes have this called on every physics step.
+
         Example Implementation:
             >>> def update_last(self, physics_step: int) -> None:
             >>>
@@ -7,6 +7,8 @@ import warnings
 import numpy as np
 from pybullet_utils import bullet_client
 
+from PyFlyt.core.utils.compile_helpers import jitter
+
 
 class Boosters:
     """Vectorized implementation of a series of fueled boosters.
@@ -32,6 +34,8 @@ class Boosters:
         thrust_unit (np.ndarray): an `(n, 3)` array representing the unit vector pointing in the direction of force for each booster, relative to the booster link's body frame.
         reignitable (np.ndarray | list[bool]): a list of booleans representing whether the booster can be extinguished and then reignited.
         noise_ratio (np.ndarray): a list of floats representing the percent amount of fluctuation present in each booster.
+        mass_update_tolerance (float): how far the mass of a fuel tank in the physics engine may drift from its true mass before it is updated, as a fraction of the full fuel mass.
+        mass_update_period (None | int): if given, fuel tanks whose mass has drifted at all are also updated at least once every this many physics steps.
 
     """
 
@@ -52,6 +56,8 @@ class Boosters:
         thrust_unit: np.ndarray,
         reignitable: np.ndarray | list[bool],
         noise_ratio: np.ndarray,
+        mass_update_tolerance: float = 0.0,
+        mass_update_period: None | int = None,
     ):
         """Used for simulating an array of boosters.
 
@@ -71,12 +77,20 @@ class Boosters:
             thrust_unit (np.ndarray): an `(n, 3)` array representing the unit vector pointing in the direction of force for each booster, relative to the booster link's body frame.
             reignitable (np.ndarray | list[bool]): a list of booleans representing whether the booster can be extinguished and then reignited.
             noise_ratio (np.ndarray): a list of floats representing the percent amount of fluctuation present in each booster.
+            mass_update_tolerance (float): how far the mass of a fuel tank in the physics engine may drift from its true mass before it is updated, as a fraction of the full fuel mass.
+            mass_update_period (None | int): if given, fuel tanks whose mass has drifted at all are also updated at least once every this many physics steps.
 
         """
         self.p = p
         self.physics_period = physics_period
         self.np_random = np_random
 
+        # draw noise from the simulation's shared pool if there is one
+        self.noise_pool = getattr(p, "noise_pool", np_random)
+
+        # inputs are checked on every physics step only in strict mode
+        self.strict = getattr(p, "strict", True)
+
         # store IDs
         self.uav_id = uav_id
         self.booster_ids = booster_ids
@@ -97,6 +111,12 @@ class Boosters:
         assert all(
             tau >= 0.0 / physics_period
         ), f"Setting `tau = 1 / physics_period` is equivalent to 0, 0 is not a valid option, got {tau}."
+        assert (
+            mass_update_tolerance >= 0.0
+        ), f"`mass_update_tolerance` must not be negative, got {mass_update_tolerance}."
+        assert (
+            mass_update_period is None or mass_update_period > 0
+        ), f"`mass_update_period` must be None or more than 0, got {mass_update_period}."
 
         # check that the thrust_axis is normalized
         if np.linalg.norm(thrust_unit) != 1.0:
@@ -116,6 +136,12 @@ class Boosters:
         self.ratio_throttleable = 1.0 - self.ratio_min_throttle
         self.ratio_fuel_rate = self.max_fuel_rate / self.total_fuel_mass
         self.noise_ratio = noise_ratio
+        self.noisy = bool(np.any(noise_ratio))
+
+        # fuel tank masses are only pushed to bullet when they drift too far, `changeDynamics` is expensive
+        self.mass_update_tolerance = mass_update_tolerance
+        self.mass_update_period = mass_update_period
+        self.has_fueltank = np.array([i is not None for i in fueltank_ids], dtype=bool)
 
     def reset(self, starting_fuel_ratio: float | np.ndarray = 1.0):
         """Reset the boosters.
@@ -131,6 +157,13 @@ class Boosters:
         self.throttle = np.zeros((self.num_boosters,), dtype=np.float64)
         self.ignition_state = np.zeros((self.num_boosters,), dtype=bool)
 
+        # the masses in bullet are unknown until the first update
+        self.applied_mass = np.full((self.num_boosters,), np.nan)
+        self.steps_since_mass_update = np.zeros((self.num_boosters,), dtype=int)
+        self.mass_drift = np.zeros((self.num_boosters,), dtype=np.float64)
+        self.max_mass_drift = 0.0
+        self._state_restores = getattr(self.p, "state_restores", 0)
+
     def get_states(self) -> np.ndarray:
         """Gets the current state of the components.
 
@@ -166,18 +199,19 @@ class Boosters:
             rotation (np.ndarray): (num_boosters, 3, 3) rotation matrices to rotate each booster's thrust axis around, this is readily obtained from the `gimbals` component.
 
         """
-        assert np.all(ignition >= 0.0) and np.all(
-            ignition <= 1.0
-        ), f"{ignition=} has values out of bounds of 0.0 and 1.0."
-        assert np.all(pwm >= 0.0) and np.all(
-            pwm <= 1.0
-        ), f"{pwm=} has values out of bounds of 0.0 and 1.0."
-        if rotation is not None:
-            assert rotation.shape == (
-                self.num_boosters,
-                3,
-                3,
-            ), f"`rotation` should be of shape (num_boosters, 3, 3), got {rotation.shape}"
+        if self.strict:
+            assert np.all(ignition >= 0.0) and np.all(
+                ignition <= 1.0
+            ), f"{ignition=} has values out of bounds of 0.0 and 1.0."
+            assert np.all(pwm >= 0.0) and np.all(
+                pwm <= 1.0
+            ), f"{pwm=} has values out of bounds of 0.0 and 1.0."
+            if rotation is not None:
+                assert rotation.shape == (
+                    self.num_boosters,
+                    3,
+                    3,
+                ), f"`rotation` should be of shape (num_boosters, 3, 3), got {rotation.shape}"
 
         # compute thrust mass inertia
         (thrust, mass, inertia) = self._compute_thrust_mass_inertia(ignition, pwm)
@@ -190,6 +224,9 @@ class Boosters:
         # final thrust vector is unit vector * scalar
         thrust_vector = (thrust_unit * thrust).reshape((-1, 3))
 
+        # only fueltanks that have drifted far enough need their inertia updated
+        update_mass = self._mass_update_mask(mass)
+
         # apply the forces and fueltanks
         for i in range(self.num_boosters):
             self.p.applyExternalForce(
@@ -200,8 +237,7 @@ class Boosters:
                 self.p.LINK_FRAME,
             )
 
-            # no need to update inertia if no fueltank
-            if self.fueltank_ids[i] is None:
+            if not update_mass[i]:
                 continue
 
             self.p.changeDynamics(
@@ -211,6 +247,99 @@ class Boosters:
                 localInertiaDiagonal=inertia[i],
             )
 
+    def _mass_update_mask(self, mass: np.ndarray) -> np.ndarray:
+        """Decides which fuel tanks need their mass updated in bullet, and tracks the drift of the ones that do not.
+
+        The drift of each tank is the difference between its true mass and the mass last pushed to bullet, as a fraction of its full fuel mass.
+        It is kept within `mass_update_tolerance`, and is available as `mass_drift`, with the largest drift since the last reset in `max_mass_drift`.
+
+        Args:
+            mass (np.ndarray): (num_boosters,) array of the true fuel tank masses.
+
+        Returns:
+            np.ndarray: (num_boosters,) boolean array of the fuel tanks to update.
+
+        """
+        # bullet does not restore masses with snapshots, so push everything again after one
+        state_restores = getattr(self.p, "state_restores", 0)
+        if state_restores != self._state_restores:
+            self._state_restores = state_restores
+            self.applied_mass[:] = np.nan
+
+        (update_mass, self.max_mass_drift) = self._jitted_mass_update_mask(
+            mass,
+            self.applied_mass,
+            self.steps_since_mass_update,
+            self.mass_drift,
+            self.max_mass_drift,
+            self.total_fuel_mass,
+            self.has_fueltank,
+            self.mass_update_tolerance,
+            self.mass_update_period or 0,
+        )
+
+        return update_mass
+
+    @staticmethod
+    @jitter
+    def _jitted_mass_update_mask(
+        mass: np.ndarray,
+        applied_mass: np.ndarray,
+        steps_since_mass_update: np.ndarray,
+        mass_drift: np.ndarray,
+        max_mass_drift: float,
+        total_fuel_mass: np.ndarray,
+        has_fueltank: np.ndarray,
+        mass_update_tolerance: float,
+        mass_update_period: int,
+    ) -> tuple[np.ndarray, float]:
+        """Computes which fuel tanks to update, updating `applied_mass`, `steps_since_mass_update` and `mass_drift` in place.
+
+        Args:
+            mass (np.ndarray): (num_boosters,) true fuel tank masses
+            applied_mass (np.ndarray): (num_boosters,) fuel tank masses in bullet, NaN if unknown
+            steps_since_mass_update (np.ndarray): (num_boosters,) physics steps since each fuel tank was updated
+            mass_drift (np.ndarray): (num_boosters,) drift of each fuel tank as a fraction of its full fuel mass
+            max_mass_drift (float): largest drift so far
+            total_fuel_mass (np.ndarray): (num_boosters,) full fuel masses
+            has_fueltank (np.ndarray): (num_boosters,) whether each booster has a fuel tank
+            mass_update_tolerance (float): largest allowed drift
+            mass_update_period (int): update drifted tanks at least this often, 0 to disable
+
+        Returns:
+            tuple[np.ndarray, float]: the fuel tanks to update and the new largest drift
+
+        """
+        update_mass = np.zeros(mass.shape, dtype=np.bool_)
+        for i in range(mass.shape[0]):
+            mass_drift[i] = 0.0
+            if not has_fueltank[i]:
+                continue
+
+            # NaN means the mass in bullet is unknown
+            steps_since_mass_update[i] += 1
+            if np.isnan(applied_mass[i]):
+                update_mass[i] = True
+            else:
+                drift = abs(mass[i] - applied_mass[i])
+                if total_fuel_mass[i] > 0.0:
+                    drift /= total_fuel_mass[i]
+                update_mass[i] = drift > mass_update_tolerance or (
+                    drift > 0.0
+                    and mass_update_period > 0
+                    and steps_since_mass_update[i] >= mass_update_period
+                )
+                if not update_mass[i]:
+                    mass_drift[i] = drift
+                    max_mass_drift = max(max_mass_drift, drift)
+
+            # track what bullet now has
+            if update_mass[i]:
+                applied_mass[i] = mass[i]
+                steps_since_mass_update[i] = 0
+
+        return update_mass, max_mass_drift
+
     def _compute_thrust_mass_inertia(
         self, ignition: np.ndarray, pwm: np.ndarray
     ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -237,12 +366,13 @@ class Boosters:
             target_throttle - self.throttle
         )
 
-        # noise in the motor
-        self.throttle += (
-            self.np_random.normal(*self.throttle.shape)
-            * self.throttle
-            * self.noise_ratio
-        )
+        # noise in the motor, noiseless boosters skip the draw entirely
+        if self.noisy:
+            self.throttle += (
+                self.noise_pool.normal(*self.throttle.shape)
+                * self.throttle
+                * self.noise_ratio
+            )
 
         # if no fuel, hard cutoff
         self.throttle *= self.ratio_fuel_remaining > 0.0
@@ -7,6 +7,8 @@ from typing import Sequence
 import numpy as np
 from pybullet_utils import bullet_client
 
+from PyFlyt.core.abstractions.link_state_cache import LinkStateCache
+
 
 class BoringBodies:
     """Vectorized implementation of a series of plain bodies affected by aerodynamics.
@@ -62,12 +64,28 @@ class BoringBodies:
         # constants
         self.drag_consts = 0.5 * 1.225 * drag_coefs * normal_areas
 
-        # runtime parameters
+        # runtime parameters, only ever written in place so views of them stay valid
         self.local_body_velocities = np.zeros((len(self.body_ids), 3))
 
+        # link states are fetched by the component itself unless a shared cache is used
+        self.link_state_cache: None | LinkStateCache = None
+        self._cache_indices = np.zeros((0,), dtype=int)
+
+    def use_link_state_cache(self, link_state_cache: LinkStateCache) -> None:
+        """Reads link states from a cache shared with other components of the drone, instead of fetching them in `state_update`.
+
+        The drone must call `link_state_cache.update()` before `state_update`.
+
+        Args:
+            link_state_cache (LinkStateCache): the drone's link state cache.
+
+        """
+        self.link_state_cache = link_state_cache
+        self._cache_indices = link_state_cache.register(self.body_ids)
+
     def reset(self):
         """Reset the boring bodies."""
-        self.local_body_velocities = np.zeros((len(self.body_ids), 3))
+        self.local_body_velocities[...] = 0.0
 
     def get_states(self):
         """`get_states` does not exist for boring bodies, they're boring."""
@@ -82,18 +100,25 @@ class BoringBodies:
             rotation_matrix (np.ndarray): (3, 3) rotation_matrix of the main body
 
         """
-        # get all the states for all the bodies
-        link_states = self.p.getLinkStates(
-            self.uav_id, self.body_ids, computeLinkVelocity=True
-        )
+        if self.link_state_cache is not None:
+            # the wind has already been accounted for in the cache
+            body_velocities = self.link_state_cache.relative_velocities[
+                self._cache_indices
+            ]
+        else:
+            # get all the states for all the bodies
+            link_states = self.p.getLinkStates(
+                self.uav_id, self.body_ids, computeLinkVelocity=True
+            )
 
-        # get all the velocities
-        body_velocities = np.array([item[-2] for item in link_states])
+            # get all the velocities
+            body_velocities = np.array([item[-2] for item in link_states])
 
-        # query for wind if available and add to surface velocities
-        if self.p.wind_field is not None:
-            body_positions = np.array([item[0] for item in link_states])
-            body_velocities -= self.p.wind_field(self.p.elapsed_time, body_positions)
+            # query for wind if available and add to surface velocities
+            wind_field = getattr(self.p, "wind_field", None)
+            if wind_field is not None:
+                body_positions = np.array([item[0] for item in link_states])
+                body_velocities -= wind_field(self.p.elapsed_time, body_positions)
 
         # rotate all velocities to be in body frame
         if rotation_matrix.shape == (len(self.body_ids), 3, 3):
@@ -108,7 +133,7 @@ class BoringBodies:
             )
 
         # update the variable
-        self.local_body_velocities = body_velocities
+        self.local_body_velocities[...] = body_velocities
 
     def physics_update(self):
         """Applies a force to the boring bodies depending on their local surface velocities."""
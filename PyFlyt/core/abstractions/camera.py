@@ -8,6 +8,7 @@ import warnings
 import numpy as np
 from pybullet_utils import bullet_client
 
+from PyFlyt.core.abstractions.link_state_cache import LinkStateCache
 from PyFlyt.core.utils.compile_helpers import check_numpy
 
 
@@ -95,6 +96,20 @@ class Camera:
         # it's not a bug, it's a feature
         self.cinematic = cinematic
 
+        # the camera link state is fetched by the camera itself unless a shared cache is used
+        self.link_state_cache: None | LinkStateCache = None
+        self._cache_index = 0
+
+    def use_link_state_cache(self, link_state_cache: LinkStateCache) -> None:
+        """Reads the camera link state from a cache shared with other components of the drone, whenever the cache is current.
+
+        Args:
+            link_state_cache (LinkStateCache): the drone's link state cache.
+
+        """
+        self.link_state_cache = link_state_cache
+        self._cache_index = int(link_state_cache.register([self.camera_id])[0])
+
     @property
     def view_mat(self) -> np.ndarray:
         """Generates the view matrix for the camera depending on the current orientation and implicit parameters.
@@ -103,8 +118,14 @@ class Camera:
             np.ndarray: view matrix.
 
         """
-        # get the state of the camera on the robot
-        camera_state = self.p.getLinkState(self.uav_id, self.camera_id)
+        # get the state of the camera on the robot, from the shared cache if it is up to date
+        if self.link_state_cache is not None and self.link_state_cache.is_current:
+            camera_state = (
+                self.link_state_cache.positions[self._cache_index],
+                self.link_state_cache.orientations[self._cache_index],
+            )
+        else:
+            camera_state = self.p.getLinkState(self.uav_id, self.camera_id)
 
         # pose and rot depends on offset if any
         position = np.array(camera_state[0])
@@ -24,6 +24,7 @@ class Gimbals:
         gimbal_unit_2 (np.ndarray): second unit vector that the gimbal rotates around.
         gimbal_tau (np.ndarray): gimbal actuation time constant.
         gimbal_range_degrees (np.ndarray): gimbal actuation range in degrees.
+        rotation_tolerance (float): largest change in gimbal state for which the previous rotation matrices are reused.
 
     """
 
@@ -36,6 +37,7 @@ class Gimbals:
         gimbal_unit_2: np.ndarray,
         gimbal_tau: np.ndarray,
         gimbal_range_degrees: np.ndarray,
+        rotation_tolerance: float = 0.0,
     ):
         """Used for simulating an array of gimbals.
 
@@ -47,12 +49,16 @@ class Gimbals:
             gimbal_unit_2 (np.ndarray): second unit vector that the gimbal rotates around.
             gimbal_tau (np.ndarray): gimbal actuation time constant.
             gimbal_range_degrees (np.ndarray): gimbal actuation range in degrees.
+            rotation_tolerance (float): largest change in gimbal state for which the previous rotation matrices are reused.
 
         """
         self.p = p
         self.physics_period = physics_period
         self.np_random = np_random
 
+        # inputs are checked on every physics step only in strict mode
+        self.strict = getattr(p, "strict", True)
+
         assert (
             len(gimbal_unit_1.shape) == 2 and gimbal_unit_1.shape[-1] == 3
         ), f"Expected `gimbal_unit_1` to be of shape (n, 3), got {gimbal_unit_1.shape}"
@@ -64,6 +70,9 @@ class Gimbals:
         ), f"Expected both gimbal_units to have equal number of elements, got {gimbal_unit_1.shape} and {gimbal_unit_2.shape}"
         assert gimbal_tau.shape == (gimbal_unit_1.shape[0],)
         assert gimbal_range_degrees.shape == (gimbal_unit_1.shape[0], 2)
+        assert (
+            rotation_tolerance >= 0.0
+        ), f"`rotation_tolerance` must not be negative, got {rotation_tolerance}."
 
         self.num_gimbals = gimbal_unit_1.shape[0]
 
@@ -91,6 +100,7 @@ class Gimbals:
         # constants
         self.gimbal_tau = gimbal_tau
         self.gimbal_range_radians = np.deg2rad(gimbal_range_degrees)
+        self.rotation_tolerance = rotation_tolerance
 
         # runtime variables
         # rotation matrices using
@@ -116,8 +126,10 @@ class Gimbals:
     def reset(self):
         """Reset the gimbals."""
         self.gimbal_state = np.zeros((self.num_gimbals, 2), dtype=np.float64)
-        self.rotation1 = np.array([np.eye(3)] * self.num_gimbals, dtype=np.float64)
-        self.rotation2 = np.array([np.eye(3)] * self.num_gimbals, dtype=np.float64)
+
+        # rotation matrices and the gimbal state they were computed at, the identity at zero state
+        self.rotation = np.array([np.eye(3)] * self.num_gimbals, dtype=np.float64)
+        self.rotation_state = np.zeros((self.num_gimbals, 2), dtype=np.float64)
 
     def get_states(self) -> np.ndarray:
         """Gets the current state of the components.
@@ -149,69 +161,110 @@ class Gimbals:
             gimbal_command (np.ndarray): (num_gimbals, 2) array of floats between [-1, 1].
 
         Returns:
-            rotation_vector (np.ndarray): (num_gimbals, 3, 3) rotation matrices for all gimbals.
+            rotation_vector (np.ndarray): (num_gimbals, 3, 3) rotation matrices for all gimbals, these are reused between calls and must not be modified in place.
 
         """
-        assert np.all(gimbal_command >= -1.0) and np.all(
-            gimbal_command <= 1.0
-        ), f"`{gimbal_command=} has values out of bounds of -1.0 and 1.0.`"
-
-        # model the gimbal using first order ODE, y' = T/tau * (setpoint - y)
-        self.gimbal_state += (self.physics_period / self.gimbal_tau) * (
-            gimbal_command - self.gimbal_state
-        )
-
-        # compute gimbal euler angles
-        gimbal_angles = self.gimbal_state * self.gimbal_range_radians
-        gimbal_angles = gimbal_angles.reshape(*gimbal_angles.shape, 1, 1)
-
-        # compute gimbal rotation matrix
-        (rotation1, rotation2) = self._jitted_compute_rotation(
-            gimbal_angles,
+        if self.strict:
+            assert np.all(gimbal_command >= -1.0) and np.all(
+                gimbal_command <= 1.0
+            ), f"`{gimbal_command=} has values out of bounds of -1.0 and 1.0.`"
+
+        # integrate the gimbal and recompute the rotations only if the gimbal moved
+        self._jitted_compute_rotation(
+            np.asarray(gimbal_command, dtype=np.float64).reshape(self.num_gimbals, 2),
+            self.gimbal_state,
+            self.rotation_state,
+            self.rotation,
+            self.physics_period,
+            self.gimbal_tau,
+            self.gimbal_range_radians,
             self.w1,
             self.w2,
             self.w1_squared,
             self.w2_squared,
+            self.rotation_tolerance,
         )
-        return rotation1 @ rotation2
+        return self.rotation
 
     @staticmethod
     @jitter
     def _jitted_compute_rotation(
-        gimbal_angles: np.ndarray,
+        gimbal_command: np.ndarray,
+        gimbal_state: np.ndarray,
+        rotation_state: np.ndarray,
+        rotation: np.ndarray,
+        physics_period: float,
+        gimbal_tau: np.ndarray,
+        gimbal_range_radians: np.ndarray,
         w1: np.ndarray,
         w2: np.ndarray,
         w1_squared: np.ndarray,
         w2_squared: np.ndarray,
-    ) -> tuple[np.ndarray, np.ndarray]:
-        """Compute the rotation matrix given the gimbal action values.
+        rotation_tolerance: float,
+    ) -> None:
+        """Integrates the gimbal states and updates the rotation matrices of gimbals that moved, all in place.
 
         Args:
-            gimbal_angles (np.ndarray): gimbal_angles
+            gimbal_command (np.ndarray): (num_gimbals, 2) gimbal commands
+            gimbal_state (np.ndarray): (num_gimbals, 2) gimbal states, updated in place
+            rotation_state (np.ndarray): (num_gimbals, 2) gimbal states that `rotation` was computed at, updated in place
+            rotation (np.ndarray): (num_gimbals, 3, 3) rotation matrices, updated in place
+            physics_period (float): physics_period
+            gimbal_tau (np.ndarray): (num_gimbals,) gimbal time constants
+            gimbal_range_radians (np.ndarray): (num_gimbals, 2) gimbal ranges
             w1 (np.ndarray): w1 from self
             w2 (np.ndarray): w2 from self
             w1_squared (np.ndarray): w1_squared from self
             w2_squared (np.ndarray): w2_squared from self
-
-        Returns:
-            tuple[np.ndarray, np.ndarray]:
+            rotation_tolerance (float): largest change in gimbal state for which `rotation` is kept
 
         """
-        # precompute some things
-        sin_angles = np.sin(gimbal_angles)
-        sin_half_angles = np.sin(gimbal_angles / 2.0)
-
-        # start calculating rotation matrices
-        # https://math.stackexchange.com/questions/142821/matrix-for-rotation-around-a-vector
-        rotation1 = (
-            np.eye(3)
-            + sin_angles[:, 0, ...] * w1
-            + 2 * (sin_half_angles[:, 0, ...] ** 2) * w1_squared
-        )
-        rotation2 = (
-            np.eye(3)
-            + sin_angles[:, 1, ...] * w2
-            + 2 * (sin_half_angles[:, 1, ...] ** 2) * w2_squared
-        )
-
-        return rotation1, rotation2
+        rotation1 = np.empty((3, 3))
+        rotation2 = np.empty((3, 3))
+        for i in range(gimbal_state.shape[0]):
+            # model the gimbal using first order ODE, y' = T/tau * (setpoint - y)
+            moved = False
+            for j in range(2):
+                gimbal_state[i, j] += (physics_period / gimbal_tau[i]) * (
+                    gimbal_command[i, j] - gimbal_state[i, j]
+                )
+                moved |= abs(gimbal_state[i, j] - rotation_state[i, j]) > (
+                    rotation_tolerance
+                )
+            if not moved:
+                continue
+
+            # compute gimbal euler angles
+            angle1 = gimbal_state[i, 0] * gimbal_range_radians[i, 0]
+            angle2 = gimbal_state[i, 1] * gimbal_range_radians[i, 1]
+            sin_angle1 = np.sin(angle1)
+            sin_angle2 = np.sin(angle2)
+            sin_half_angle1 = 2 * (np.sin(angle1 / 2.0) ** 2)
+            sin_half_angle2 = 2 * (np.sin(angle2 / 2.0) ** 2)
+
+            # start calculating rotation matrices
+            # https://math.stackexchange.com/questions/142821/matrix-for-rotation-around-a-vector
+            for r in range(3):
+                for c in range(3):
+                    eye = 1.0 if r == c else 0.0
+                    rotation1[r, c] = (
+                        eye
+                        + sin_angle1 * w1[i, r, c]
+                        + sin_half_angle1 * w1_squared[i, r, c]
+                    )
+                    rotation2[r, c] = (
+                        eye
+                        + sin_angle2 * w2[i, r, c]
+                        + sin_half_angle2 * w2_squared[i, r, c]
+                    )
+
+            # the final rotation is the first rotation followed by the second
+            for r in range(3):
+                for c in range(3):
+                    rotation[i, r, c] = (
+                        rotation1[r, 0] * rotation2[0, c]
+                        + rotation1[r, 1] * rotation2[1, c]
+                        + rotation1[r, 2] * rotation2[2, c]
+                    )
+            rotation_state[i, 0] = gimbal_state[i, 0]
+            rotation_state[i, 1] = gimbal_state[i, 1]
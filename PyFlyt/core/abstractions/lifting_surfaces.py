@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import warnings
+from typing import Any
 
 import numpy as np
 from pybullet_utils import bullet_client
 
+from PyFlyt.core.abstractions.link_state_cache import LinkStateCache
 from PyFlyt.core.utils.compile_helpers import jitter
 
 
@@ -16,6 +18,9 @@ class LiftingSurfaces:
     This is a convenience class for handling multiple lifting surfaces as a single object.
     Simply pass it a list of `LiftingSurface` objects.
 
+    The parameters of all surfaces are gathered into arrays, one entry per surface, and all surfaces are updated in a single jitted kernel.
+    The runtime state of the surfaces, `actuation` and `local_surface_velocities`, is held here rather than on each `LiftingSurface`, whose accessors read their own row.
+
     Args:
         lifting_surfaces (list[LiftingSurface]): a list of `LiftingSurface` objects.
 
@@ -38,10 +43,140 @@ class LiftingSurfaces:
         self.uav_id = lifting_surfaces[0].uav_id
         self.surfaces: list[LiftingSurface] = lifting_surfaces
         self.surface_ids = np.array([s.surface_id for s in self.surfaces])
+        self.physics_period = lifting_surfaces[0].physics_period
+
+        # surface parameters as arrays
+        self.cmd_tau = np.array([s.cmd_tau for s in self.surfaces], dtype=np.float64)
+        self.lift_units = np.array(
+            [s.lift_unit for s in self.surfaces], dtype=np.float64
+        )
+        self.drag_units = np.array(
+            [s.drag_unit for s in self.surfaces], dtype=np.float64
+        )
+        self.torque_units = np.array(
+            [s.torque_unit for s in self.surfaces], dtype=np.float64
+        )
+        self.aspect = np.array([s.aspect for s in self.surfaces], dtype=np.float64)
+        self.flap_to_chord = np.array(
+            [s.flap_to_chord for s in self.surfaces], dtype=np.float64
+        )
+        self.aero_tau = np.array([s.aero_tau for s in self.surfaces], dtype=np.float64)
+        self.deflection_limit = np.array(
+            [s.deflection_limit for s in self.surfaces], dtype=np.float64
+        )
+        self.eta = np.array([s.eta for s in self.surfaces], dtype=np.float64)
+        self.Cl_alpha_3D = np.array(
+            [s.Cl_alpha_3D for s in self.surfaces], dtype=np.float64
+        )
+        self.alpha_stall_P_base = np.array(
+            [s.alpha_stall_P_base for s in self.surfaces], dtype=np.float64
+        )
+        self.alpha_0_base = np.array(
+            [s.alpha_0_base for s in self.surfaces], dtype=np.float64
+        )
+        self.alpha_stall_N_base = np.array(
+            [s.alpha_stall_N_base for s in self.surfaces], dtype=np.float64
+        )
+        self.Cd_0 = np.array([s.Cd_0 for s in self.surfaces], dtype=np.float64)
+        self.half_rho = np.array([s.half_rho for s in self.surfaces], dtype=np.float64)
+        self.area = np.array([s.area for s in self.surfaces], dtype=np.float64)
+        self.chord = np.array([s.chord for s in self.surfaces], dtype=np.float64)
+
+        # inputs are checked on every physics step only in strict mode
+        self.strict = getattr(self.p, "strict", True)
+
+        # runtime parameters
+        self.actuation = np.zeros((len(self.surfaces),))
+        self.local_surface_velocities = np.zeros((len(self.surfaces), 3))
+        for index, surface in enumerate(self.surfaces):
+            surface.bind_container(self, index)
+
+        # link states are fetched by the component itself unless a shared cache is used
+        self.link_state_cache: None | LinkStateCache = None
+        self._cache_indices = np.zeros((0,), dtype=int)
+
+        # tables of all surfaces if they all use them, stacked
+        self._stack_aero_tables()
+
+    def use_link_state_cache(self, link_state_cache: LinkStateCache) -> None:
+        """Reads link states from a cache shared with other components of the drone, instead of fetching them in `state_update`.
+
+        The drone must call `link_state_cache.update()` before `state_update`.
+
+        Args:
+            link_state_cache (LinkStateCache): the drone's link state cache.
+
+        """
+        self.link_state_cache = link_state_cache
+        self._cache_indices = link_state_cache.register(self.surface_ids)
+
+    def use_aero_tables(
+        self,
+        aero_tables: None | list[None | AeroTable] = None,
+        alpha_resolution: int = 721,
+        actuation_resolution: int = 21,
+    ) -> list[AeroTable]:
+        """Switches all surfaces to interpolating their aerodynamic coefficients from tables, see `LiftingSurface.use_aero_table`.
+
+        All tables must have the same resolution.
+
+        Args:
+            aero_tables (None | list[None | AeroTable]): a table for each surface, where None tabulates the surface's analytic model.
+            alpha_resolution (int): number of angles of attack in [-pi, pi] when tabulating.
+            actuation_resolution (int): number of actuations in [-1, 1] when tabulating.
+
+        Returns:
+            list[AeroTable]: the table in use by each surface.
+
+        """
+        if aero_tables is None:
+            aero_tables = [None] * len(self.surfaces)
+        if len(aero_tables) != len(self.surfaces):
+            raise ValueError(
+                f"Expected {len(self.surfaces)} tables, one per surface, got {len(aero_tables)}."
+            )
+
+        tables = [
+            surface.use_aero_table(table, alpha_resolution, actuation_resolution)
+            for surface, table in zip(self.surfaces, aero_tables)
+        ]
+        self._stack_aero_tables()
+        return tables
+
+    def use_analytic_aero(self) -> None:
+        """Switches all surfaces back to the analytic aerodynamic model."""
+        for surface in self.surfaces:
+            surface.aero_table = None
+        self._stack_aero_tables()
+
+    def _stack_aero_tables(self) -> None:
+        """Stacks the tables of all surfaces into arrays for the jitted kernel, if all surfaces use tables."""
+        tables = [surface.aero_table for surface in self.surfaces]
+        self.use_tables = all(table is not None for table in tables)
+        if not self.use_tables:
+            # placeholders so that the kernel signature stays the same
+            if any(table is not None for table in tables):
+                warnings.warn(
+                    "Only some lifting surfaces have aerodynamic tables, all surfaces will use the analytic model."
+                )
+            self.table_alphas = np.zeros((len(tables), 2))
+            self.table_actuations = np.zeros((len(tables), 2))
+            self.table_coefficients = np.zeros((len(tables), 3, 2, 2))
+            return
+
+        shapes = {table.coefficients.shape for table in tables}
+        if len(shapes) != 1:
+            raise ValueError(
+                f"All aerodynamic tables of a vehicle must have the same resolution, got {shapes}."
+            )
+        self.table_alphas = np.stack([table.alphas for table in tables])
+        self.table_actuations = np.stack([table.actuations for table in tables])
+        self.table_coefficients = np.stack([table.coefficients for table in tables])
 
     def reset(self):
         """Resets all lifting surfaces."""
-        [surface.reset() for surface in self.surfaces]
+        self.actuation = np.zeros((len(self.surfaces),))
+        self.local_surface_velocities = np.zeros((len(self.surfaces), 3))
 
     def get_states(self) -> np.ndarray:
         """Gets the current state of the components.
@@ -50,7 +185,7 @@ class LiftingSurfaces:
             np.ndarray: a (num_surfaces, ) array representing the actuation state for each surface
 
         """
-        return np.array([surface.actuation for surface in self.surfaces])
+        return self.actuation.copy()
 
     def physics_update(self, cmd: np.ndarray):
         """Converts actuation commands into forces on the lifting surfaces.
@@ -59,16 +194,50 @@ class LiftingSurfaces:
             cmd (np.ndarray): the full command array, command mapping is handled through `command_id` and `command_sign` on each surface, normalized in [-1, 1].
 
         """
-        assert len(cmd.shape) == 1, f"`{cmd=}` must be 1D array."
-        assert cmd.shape[0] == len(
-            self.surfaces
-        ), f"`{cmd=}` must have same number of elements as surfaces ({len(self.surfaces)})."
-        assert np.all(cmd >= -1.0) and np.all(
-            cmd <= 1.0
-        ), f"`{cmd=} has values out of bounds of -1.0 and 1.0.`"
+        if self.strict:
+            assert len(cmd.shape) == 1, f"`{cmd=}` must be 1D array."
+            assert cmd.shape[0] == len(
+                self.surfaces
+            ), f"`{cmd=}` must have same number of elements as surfaces ({len(self.surfaces)})."
+            assert np.all(cmd >= -1.0) and np.all(
+                cmd <= 1.0
+            ), f"`{cmd=} has values out of bounds of -1.0 and 1.0.`"
+
+        (forces, torques) = self._jitted_physics_update(
+            np.asarray(cmd, dtype=np.float64),
+            self.actuation,
+            self.local_surface_velocities,
+            self.physics_period,
+            self.cmd_tau,
+            self.lift_units,
+            self.drag_units,
+            self.torque_units,
+            self.aspect,
+            self.flap_to_chord,
+            self.aero_tau,
+            self.deflection_limit,
+            self.eta,
+            self.Cl_alpha_3D,
+            self.alpha_stall_P_base,
+            self.alpha_0_base,
+            self.alpha_stall_N_base,
+            self.Cd_0,
+            self.half_rho,
+            self.area,
+            self.chord,
+            self.use_tables,
+            self.table_alphas,
+            self.table_actuations,
+            self.table_coefficients,
+        )
 
-        for surface, actuation in zip(self.surfaces, cmd):
-            surface.physics_update(actuation)
+        # the bullet functions are looked up once, `BulletClient.__getattr__` is slow
+        apply_force = self.p.applyExternalForce
+        apply_torque = self.p.applyExternalTorque
+        link_frame = self.p.LINK_FRAME
+        for surface_id, force, torque in zip(self.surface_ids, forces, torques):
+            apply_force(self.uav_id, surface_id, force, [0.0, 0.0, 0.0], link_frame)
+            apply_torque(self.uav_id, surface_id, torque, link_frame)
 
     def state_update(self, rotation_matrix: np.ndarray):
         """Updates all local surface velocities of the lifting surface, place under `update_state`.
@@ -77,20 +246,25 @@ class LiftingSurfaces:
             rotation_matrix (np.ndarray): (3, 3) OR (num_surfaces, 3, 3) array rotation_matrix
 
         """
-        # get all the states for all the surfaces
-        link_states = self.p.getLinkStates(
-            self.uav_id, self.surface_ids, computeLinkVelocity=True
-        )
+        if self.link_state_cache is not None:
+            # the wind has already been accounted for in the cache
+            surface_velocities = self.link_state_cache.relative_velocities[
+                self._cache_indices
+            ]
+        else:
+            # get all the states for all the surfaces
+            link_states = self.p.getLinkStates(
+                self.uav_id, self.surface_ids, computeLinkVelocity=True
+            )
 
-        # get all the velocities
-        surface_velocities = np.array([item[-2] for item in link_states])
+            # get all the velocities
+            surface_velocities = np.array([item[-2] for item in link_states])
 
-        # query for wind if available and add to surface velocities
-        if self.p.wind_field is not None:
-            surface_positions = np.array([item[0] for item in link_states])
-            surface_velocities -= self.p.wind_field(
-                self.p.elapsed_time, surface_positions
-            )
+            # query for wind if available and add to surface velocities
+            wind_field = getattr(self.p, "wind_field", None)
+            if wind_field is not None:
+                surface_positions = np.array([item[0] for item in link_states])
+                surface_velocities -= wind_field(self.p.elapsed_time, surface_positions)
 
         # convert all to local velocities, depending on rotation matrix style
         if rotation_matrix.shape == (len(self.surfaces), 3, 3):
@@ -105,15 +279,133 @@ class LiftingSurfaces:
             )
 
         # update the velocities of all surfaces
-        surface_velocities = np.ascontiguousarray(surface_velocities)
-        for surface, velocity in zip(self.surfaces, surface_velocities):
-            surface.state_update(velocity)
+        self.local_surface_velocities = np.ascontiguousarray(surface_velocities)
+
+    @staticmethod
+    @jitter
+    def _jitted_physics_update(
+        cmd: np.ndarray,
+        actuation: np.ndarray,
+        local_surface_velocities: np.ndarray,
+        physics_period: float,
+        cmd_tau: np.ndarray,
+        lift_units: np.ndarray,
+        drag_units: np.ndarray,
+        torque_units: np.ndarray,
+        aspect: np.ndarray,
+        flap_to_chord: np.ndarray,
+        aero_tau: np.ndarray,
+        deflection_limit: np.ndarray,
+        eta: np.ndarray,
+        Cl_alpha_3D: np.ndarray,
+        alpha_stall_P_base: np.ndarray,
+        alpha_0_base: np.ndarray,
+        alpha_stall_N_base: np.ndarray,
+        Cd_0: np.ndarray,
+        half_rho: np.ndarray,
+        area: np.ndarray,
+        chord: np.ndarray,
+        use_tables: bool,
+        table_alphas: np.ndarray,
+        table_actuations: np.ndarray,
+        table_coefficients: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Updates the actuation of all surfaces in place and computes their forces and torques.
+
+        All surface parameters are `(num_surfaces,)` arrays, and all vectors are `(num_surfaces, 3)` arrays.
+
+        Args:
+            cmd (np.ndarray): commanded actuation of each surface
+            actuation (np.ndarray): actuation of each surface, updated in place
+            local_surface_velocities (np.ndarray): local velocity of each surface
+            physics_period (float): physics_period
+            cmd_tau (np.ndarray): cmd_tau of each surface
+            lift_units (np.ndarray): lift_unit of each surface
+            drag_units (np.ndarray): drag_unit of each surface
+            torque_units (np.ndarray): torque_unit of each surface
+            aspect (np.ndarray): aspect of each surface
+            flap_to_chord (np.ndarray): flap_to_chord of each surface
+            aero_tau (np.ndarray): aero_tau of each surface
+            deflection_limit (np.ndarray): deflection_limit of each surface
+            eta (np.ndarray): eta of each surface
+            Cl_alpha_3D (np.ndarray): Cl_alpha_3D of each surface
+            alpha_stall_P_base (np.ndarray): alpha_stall_P_base of each surface
+            alpha_0_base (np.ndarray): alpha_0_base of each surface
+            alpha_stall_N_base (np.ndarray): alpha_stall_N_base of each surface
+            Cd_0 (np.ndarray): Cd_0 of each surface
+            half_rho (np.ndarray): half_rho of each surface
+            area (np.ndarray): area of each surface
+            chord (np.ndarray): chord of each surface
+            use_tables (bool): whether to interpolate the aerodynamic coefficients from tables
+            table_alphas (np.ndarray): (num_surfaces, num_alphas) angles of attack of each table
+            table_actuations (np.ndarray): (num_surfaces, num_actuations) actuations of each table
+            table_coefficients (np.ndarray): (num_surfaces, 3, num_alphas, num_actuations) Cl, Cd and CM of each table
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (num_surfaces, 3) forces and (num_surfaces, 3) torques
+
+        """
+        num_surfaces = actuation.shape[0]
+        forces = np.zeros((num_surfaces, 3))
+        torques = np.zeros((num_surfaces, 3))
+
+        for i in range(num_surfaces):
+            # model the deflection using first order ODE, y' = T/tau * (setpoint - y)
+            actuation[i] += (physics_period / cmd_tau[i]) * (cmd[i] - actuation[i])
+
+            # compute angle of attack and freestream velocity
+            (alpha, freestream_speed) = _jitted_compute_aoa_freestream(
+                local_surface_velocities[i], lift_units[i], drag_units[i]
+            )
+
+            # compute aerofoil parameters
+            if use_tables:
+                (Cl, Cd, CM) = _jitted_interpolate_aero_table(
+                    alpha,
+                    actuation[i],
+                    table_alphas[i],
+                    table_actuations[i],
+                    table_coefficients[i],
+                )
+            else:
+                (Cl, Cd, CM) = _jitted_compute_aero_data(
+                    alpha,
+                    aspect[i],
+                    flap_to_chord[i],
+                    aero_tau[i],
+                    actuation[i],
+                    deflection_limit[i],
+                    eta[i],
+                    Cl_alpha_3D[i],
+                    alpha_stall_P_base[i],
+                    alpha_0_base[i],
+                    alpha_stall_N_base[i],
+                    Cd_0[i],
+                )
+
+            # compute the forces and torques
+            (forces[i], torques[i]) = _jitted_compute_force_torque(
+                alpha,
+                freestream_speed,
+                Cl,
+                Cd,
+                CM,
+                half_rho[i],
+                area[i],
+                chord[i],
+                lift_units[i],
+                drag_units[i],
+                torque_units[i],
+            )
+
+        return forces, torques
 
 
 class LiftingSurface:
     """Used to represent a single lifting surface.
 
     The `Lifting Surface` component is used to simulate a single lifting surface based on "Real-time modeling of agile fixed-wing uav aerodynamics, Khan et. al.".
+    It only holds the parameters of the surface, the surface is simulated as part of a `LiftingSurfaces`, which also holds its runtime state.
 
     Args:
         p (bullet_client.BulletClient): PyBullet physics client ID.
@@ -238,261 +530,576 @@ class LiftingSurface:
         self.theta_f = np.arccos(2.0 * self.flap_to_chord - 1.0)
         self.aero_tau = 1 - ((self.theta_f - np.sin(self.theta_f)) / np.pi)
 
-        # runtime parameters
-        self.local_surface_velocity = np.array([0.0, 0.0, 0.0])
+        # the `LiftingSurfaces` that simulates this surface, and the row of this surface in it
+        self._container: None | LiftingSurfaces = None
+        self._index = 0
 
-    def reset(self):
-        """Reset the lifting surfaces."""
-        self.actuation = 0.0
+        # optional tabulated aerodynamics, see `use_aero_table`
+        self.aero_table: None | AeroTable = None
 
-    def get_states(self) -> float:
-        """Gets the current state of the components.
+    def aero_params(self) -> tuple[float, ...]:
+        """The parameters of the analytic aerodynamic model of this surface, in the order taken by `_jitted_compute_aero_data` after `alpha` and without `actuation`.
 
         Returns:
-            float: the level of deflection of the surface.
+            tuple[float, ...]: aspect, flap_to_chord, aero_tau, deflection_limit, eta, Cl_alpha_3D, alpha_stall_P_base, alpha_0_base, alpha_stall_N_base, Cd_0
 
         """
-        return self.actuation
+        return tuple(
+            float(param)
+            for param in (
+                self.aspect,
+                self.flap_to_chord,
+                self.aero_tau,
+                self.deflection_limit,
+                self.eta,
+                self.Cl_alpha_3D,
+                self.alpha_stall_P_base,
+                self.alpha_0_base,
+                self.alpha_stall_N_base,
+                self.Cd_0,
+            )
+        )
 
-    def state_update(self, surface_velocity: np.ndarray):
-        """Updates the local surface velocity of the lifting surface.
+    def use_aero_table(
+        self,
+        aero_table: None | AeroTable = None,
+        alpha_resolution: int = 721,
+        actuation_resolution: int = 21,
+    ) -> AeroTable:
+        """Switches this surface to interpolating its aerodynamic coefficients from a table, set `aero_table = None` to switch back to the analytic model.
 
         Args:
-            surface_velocity (np.ndarray): surface_velocity.
+            aero_table (None | AeroTable): a table to use, such as one loaded from measured data, otherwise the analytic model of this surface is tabulated.
+            alpha_resolution (int): number of angles of attack in [-pi, pi] when tabulating.
+            actuation_resolution (int): number of actuations in [-1, 1] when tabulating.
+
+        Returns:
+            AeroTable: the table in use, its `max_error` holds the max error against the analytic model of this surface.
 
         """
-        self.local_surface_velocity = surface_velocity
+        if aero_table is None:
+            aero_table = AeroTable.from_surface(
+                self, alpha_resolution, actuation_resolution
+            )
+        else:
+            aero_table.compute_max_error(self)
+
+        self.aero_table = aero_table
+        return aero_table
 
-    def physics_update(self, cmd: float):
-        """Converts a commanded actuation state into forces on the lifting surface.
+    def bind_container(self, lifting_surfaces: LiftingSurfaces, index: int) -> None:
+        """Points the runtime state accessors of this surface at its row in the `LiftingSurfaces` that simulates it.
 
         Args:
-            cmd (float): normalized actuation in [-1, 1].
+            lifting_surfaces (LiftingSurfaces): the container that simulates this surface.
+            index (int): the row of this surface in the container.
+
+        """
+        self._container = lifting_surfaces
+        self._index = index
+
+    @property
+    def actuation(self) -> float:
+        """The current actuation of this surface, 0.0 until it is part of a `LiftingSurfaces`.
 
         Returns:
-            tuple[np.ndarray, np.ndarray]: vec3 force, vec3 torque
+            float:
 
         """
-        # model the deflection using first order ODE, y' = T/tau * (setpoint - y)
-        self.actuation += (self.physics_period / self.cmd_tau) * (cmd - self.actuation)
+        if self._container is None:
+            return 0.0
+        return float(self._container.actuation[self._index])
 
-        # compute angle of attack and freestream velocity
-        (alpha, freestream_speed) = self._compute_aoa_freestream(
-            self.local_surface_velocity, self.lift_unit, self.drag_unit
-        )
+    @property
+    def local_surface_velocity(self) -> np.ndarray:
+        """The current (3,) local velocity of this surface, zero until it is part of a `LiftingSurfaces`.
 
-        # compute aerofoil parameters
-        (Cl, Cd, CM) = self._jitted_compute_aero_data(
-            alpha,
-            self.aspect,
-            self.flap_to_chord,
-            self.aero_tau,
-            self.actuation,
-            self.deflection_limit,
-            self.eta,
-            self.Cl_alpha_3D,
-            self.alpha_stall_P_base,
-            self.alpha_0_base,
-            self.alpha_stall_N_base,
-            self.Cd_0,
-        )
+        Returns:
+            np.ndarray:
 
-        # compute the forces and torques
-        (force, torque) = self._jitted_compute_force_torque(
-            alpha,
-            freestream_speed,
-            Cl,
-            Cd,
-            CM,
-            self.half_rho,
-            self.area,
-            self.chord,
-            self.lift_unit,
-            self.drag_unit,
-            self.torque_unit,
+        """
+        if self._container is None:
+            return np.zeros((3,))
+        return self._container.local_surface_velocities[self._index].copy()
+
+    def get_states(self) -> float:
+        """Gets the current state of the components.
+
+        Returns:
+            float: the level of deflection of the surface.
+
+        """
+        return self.actuation
+
+
+@jitter
+def _jitted_compute_aoa_freestream(
+    local_surface_velocity: np.ndarray, lift_unit: np.ndarray, drag_unit: np.ndarray
+) -> tuple[float, float]:
+    """Computes the angle of attack (alpha) as well as the freestream speed.
+
+    Args:
+        local_surface_velocity (np.ndarray): local_surface_velocity of the surface
+        lift_unit (np.ndarray): lift_unit of the surface
+        drag_unit (np.ndarray): drag_unit of the surface
+
+    Returns:
+        tuple[float, float]:
+
+    """
+    freestream_speed = np.linalg.norm(local_surface_velocity).item()
+    lifting_airspeed = np.dot(local_surface_velocity, lift_unit)
+    forward_airspeed = np.dot(local_surface_velocity, drag_unit)
+    alpha = np.arctan2(-lifting_airspeed, forward_airspeed)
+
+    return alpha, freestream_speed
+
+
+@jitter
+def _jitted_compute_aero_data(
+    alpha: float,
+    aspect: float,
+    flap_to_chord: float,
+    aero_tau: float,
+    actuation: float,
+    deflection_limit: float,
+    eta: float,
+    Cl_alpha_3D: float,
+    alpha_stall_P_base: float,
+    alpha_0_base: float,
+    alpha_stall_N_base: float,
+    Cd_0: float,
+) -> tuple[float, float, float]:
+    """Computes the relevant aerodynamic data depending on the current state of the lifting surface.
+
+    Args:
+        alpha (float): alpha
+        aspect (float): aspect of the surface
+        flap_to_chord (float): flap_to_chord of the surface
+        aero_tau (float): aero_tau of the surface
+        actuation (float): actuation of the surface
+        deflection_limit (float): deflection_limit of the surface
+        eta (float): eta of the surface
+        Cl_alpha_3D (float): Cl_alpha_3D of the surface
+        alpha_stall_P_base (float): alpha_stall_P_base of the surface
+        alpha_0_base (float): alpha_0_base of the surface
+        alpha_stall_N_base (float): alpha_stall_N_base of the surface
+        Cd_0 (float): Cd_0 of the surface
+
+    Returns:
+        tuple[float, float, float]:
+
+    """
+    # deflection must be in degrees because engineering uses degrees
+    deflection_radians = np.deg2rad(actuation * deflection_limit)
+
+    delta_Cl = Cl_alpha_3D * aero_tau * eta * deflection_radians
+    delta_Cl_max = flap_to_chord * delta_Cl
+    Cl_max_P = Cl_alpha_3D * (alpha_stall_P_base - alpha_0_base) + delta_Cl_max
+    Cl_max_N = Cl_alpha_3D * (alpha_stall_N_base - alpha_0_base) + delta_Cl_max
+    alpha_0 = alpha_0_base - (delta_Cl / Cl_alpha_3D)
+    alpha_stall_P = alpha_0 + (Cl_max_P / Cl_alpha_3D)
+    alpha_stall_N = alpha_0 + (Cl_max_N / Cl_alpha_3D)
+
+    # no stall condition
+    if alpha_stall_N < alpha and alpha < alpha_stall_P:
+        Cl = Cl_alpha_3D * (alpha - alpha_0)
+        alpha_i = Cl / (np.pi * aspect)
+        alpha_eff = alpha - alpha_0 - alpha_i
+        CT = Cd_0 * np.cos(alpha_eff)
+        CN = (Cl + (CT * np.sin(alpha_eff))) / np.cos(alpha_eff)
+        Cd = (CN * np.sin(alpha_eff)) + (CT * np.cos(alpha_eff))
+        CM = -CN * (0.25 - (0.175 * (1.0 - ((2.0 * alpha_eff) / np.pi))))
+
+        return Cl, Cd, CM
+
+    # positive stall
+    if alpha > 0.0:
+        # Stall calculations to find alpha_i at stall
+        Cl_stall = Cl_alpha_3D * (alpha_stall_P - alpha_0)
+        alpha_i_at_stall = Cl_stall / (np.pi * aspect)
+        # alpha_i post-stall Pos
+        alpha_i = np.interp(
+            alpha, [alpha_stall_P, np.pi / 2.0], [alpha_i_at_stall, 0.0]
+        )
+    # negative stall
+    else:
+        # Stall calculations to find alpha_i at stall
+        Cl_stall = Cl_alpha_3D * (alpha_stall_N - alpha_0)
+        alpha_i_at_stall = Cl_stall / (np.pi * aspect)
+        # alpha_i post-stall Neg
+        alpha_i = np.interp(
+            alpha, [-np.pi / 2.0, alpha_stall_N], [0.0, alpha_i_at_stall]
         )
 
-        self.p.applyExternalForce(
-            self.uav_id,
-            self.surface_id,
-            force,
-            [0.0, 0.0, 0.0],
-            self.p.LINK_FRAME,
+    alpha_eff = alpha - alpha_0 - alpha_i
+
+    # Drag coefficient at 90 deg dependent on deflection angle
+    Cd_90 = (
+        ((-4.26 * (10**-2)) * (deflection_radians**2))
+        + ((2.1 * (10**-1)) * deflection_radians)
+        + 1.98
+    )
+    CN = (
+        Cd_90
+        * np.sin(alpha_eff)
+        * (
+            1.0 / (0.56 + 0.44 * abs(np.sin(alpha_eff)))
+            - 0.41 * (1.0 - np.exp(-17.0 / aspect))
         )
-        self.p.applyExternalTorque(
-            self.uav_id, self.surface_id, torque, self.p.LINK_FRAME
+    )
+    CT = 0.5 * Cd_0 * np.cos(alpha_eff)
+    Cl = (CN * np.cos(alpha_eff)) - (CT * np.sin(alpha_eff))
+    Cd = (CN * np.sin(alpha_eff)) + (CT * np.cos(alpha_eff))
+    CM = -CN * (0.25 - (0.175 * (1.0 - ((2.0 * abs(alpha_eff)) / np.pi))))
+
+    return Cl, Cd, CM
+
+
+@jitter
+def _jitted_compute_force_torque(
+    alpha: float,
+    freestream_speed: float,
+    Cl: float,
+    Cd: float,
+    CM: float,
+    half_rho: float,
+    area: float,
+    chord: float,
+    lift_unit: np.ndarray,
+    drag_unit: np.ndarray,
+    torque_unit: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the force and torque vectors on the surface.
+
+    Args:
+        alpha (float): alpha
+        freestream_speed (float): freestream_speed
+        Cl (float): Cl
+        Cd (float): Cd
+        CM (float): CM
+        half_rho (float): half_rho of the surface
+        area (float): area of the surface
+        chord (float): chord of the surface
+        lift_unit (np.ndarray): lift_unit of the surface
+        drag_unit (np.ndarray): drag_unit of the surface
+        torque_unit (np.ndarray): torque_unit of the surface
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]:
+
+    """
+    # compute dynamic pressure
+    Q = half_rho * np.square(freestream_speed)
+    Q_area = Q * area
+
+    # compute lift and drag
+    lift = Cl * Q_area
+    drag = Cd * Q_area
+    force_normal = (lift * np.cos(alpha)) + (drag * np.sin(alpha))
+    force_parallel = (lift * np.sin(alpha)) - (drag * np.cos(alpha))
+
+    # compute forces and torques
+    force = lift_unit * force_normal + drag_unit * force_parallel
+    torque = Q_area * CM * chord * torque_unit
+
+    return force, torque
+
+
+@jitter
+def _jitted_tabulate_aero_data(
+    alphas: np.ndarray,
+    actuations: np.ndarray,
+    aspect: float,
+    flap_to_chord: float,
+    aero_tau: float,
+    deflection_limit: float,
+    eta: float,
+    Cl_alpha_3D: float,
+    alpha_stall_P_base: float,
+    alpha_0_base: float,
+    alpha_stall_N_base: float,
+    Cd_0: float,
+) -> np.ndarray:
+    """Evaluates the analytic aerodynamic model over a grid of angles of attack and actuations.
+
+    Args:
+        alphas (np.ndarray): (num_alphas,) angles of attack in radians
+        actuations (np.ndarray): (num_actuations,) normalized actuations
+        aspect (float): aspect of the surface
+        flap_to_chord (float): flap_to_chord of the surface
+        aero_tau (float): aero_tau of the surface
+        deflection_limit (float): deflection_limit of the surface
+        eta (float): eta of the surface
+        Cl_alpha_3D (float): Cl_alpha_3D of the surface
+        alpha_stall_P_base (float): alpha_stall_P_base of the surface
+        alpha_0_base (float): alpha_0_base of the surface
+        alpha_stall_N_base (float): alpha_stall_N_base of the surface
+        Cd_0 (float): Cd_0 of the surface
+
+    Returns:
+        np.ndarray: (3, num_alphas, num_actuations) array of Cl, Cd and CM
+
+    """
+    coefficients = np.zeros((3, alphas.shape[0], actuations.shape[0]))
+    for i in range(alphas.shape[0]):
+        for j in range(actuations.shape[0]):
+            (
+                coefficients[0, i, j],
+                coefficients[1, i, j],
+                coefficients[2, i, j],
+            ) = _jitted_compute_aero_data(
+                alphas[i],
+                aspect,
+                flap_to_chord,
+                aero_tau,
+                actuations[j],
+                deflection_limit,
+                eta,
+                Cl_alpha_3D,
+                alpha_stall_P_base,
+                alpha_0_base,
+                alpha_stall_N_base,
+                Cd_0,
+            )
+
+    return coefficients
+
+
+@jitter
+def _jitted_interpolate_aero_table(
+    alpha: float,
+    actuation: float,
+    alphas: np.ndarray,
+    actuations: np.ndarray,
+    coefficients: np.ndarray,
+) -> tuple[float, float, float]:
+    """Bilinearly interpolates Cl, Cd and CM from an aerodynamic table, clamping to the edges of the table.
+
+    Args:
+        alpha (float): angle of attack in radians
+        actuation (float): normalized actuation
+        alphas (np.ndarray): (num_alphas,) increasing angles of attack of the table
+        actuations (np.ndarray): (num_actuations,) increasing actuations of the table
+        coefficients (np.ndarray): (3, num_alphas, num_actuations) array of Cl, Cd and CM
+
+    Returns:
+        tuple[float, float, float]:
+
+    """
+    # find the cell, clamped to the edges of the table
+    i = min(max(np.searchsorted(alphas, alpha) - 1, 0), alphas.shape[0] - 2)
+    j = min(max(np.searchsorted(actuations, actuation) - 1, 0), actuations.shape[0] - 2)
+    t = (alpha - alphas[i]) / (alphas[i + 1] - alphas[i])
+    u = (actuation - actuations[j]) / (actuations[j + 1] - actuations[j])
+    t = min(max(t, 0.0), 1.0)
+    u = min(max(u, 0.0), 1.0)
+
+    # weights of the four corners
+    w00 = (1.0 - t) * (1.0 - u)
+    w01 = (1.0 - t) * u
+    w10 = t * (1.0 - u)
+    w11 = t * u
+
+    Cl = (
+        w00 * coefficients[0, i, j]
+        + w01 * coefficients[0, i, j + 1]
+        + w10 * coefficients[0, i + 1, j]
+        + w11 * coefficients[0, i + 1, j + 1]
+    )
+    Cd = (
+        w00 * coefficients[1, i, j]
+        + w01 * coefficients[1, i, j + 1]
+        + w10 * coefficients[1, i + 1, j]
+        + w11 * coefficients[1, i + 1, j + 1]
+    )
+    CM = (
+        w00 * coefficients[2, i, j]
+        + w01 * coefficients[2, i, j + 1]
+        + w10 * coefficients[2, i + 1, j]
+        + w11 * coefficients[2, i + 1, j + 1]
+    )
+
+    return Cl, Cd, CM
+
+
+# tables are shared between surfaces with the same parameters, keyed by the parameters and resolution
+_AERO_TABLE_CACHE: dict[tuple[float | int, ...], AeroTable] = dict()
+
+
+class AeroTable:
+    """Tabulated aerodynamic coefficients of a lifting surface.
+
+    This holds Cl, Cd and CM over a grid of angles of attack and normalized actuations, where the flap deflection is `actuation * deflection_limit`.
+    At runtime, the coefficients are bilinearly interpolated from the table instead of being computed from the analytic model, queries outside the table are clamped to its edges.
+    Tables are either tabulated from the analytic model of a surface via `AeroTable.from_surface`, or loaded from externally measured data via `AeroTable.load`.
+
+    Args:
+        alphas (np.ndarray): (num_alphas,) strictly increasing angles of attack in radians.
+        actuations (np.ndarray): (num_actuations,) strictly increasing normalized actuations.
+        Cl (np.ndarray): (num_alphas, num_actuations) lift coefficients.
+        Cd (np.ndarray): (num_alphas, num_actuations) drag coefficients.
+        CM (np.ndarray): (num_alphas, num_actuations) moment coefficients.
+
+    """
+
+    def __init__(
+        self,
+        alphas: np.ndarray,
+        actuations: np.ndarray,
+        Cl: np.ndarray,
+        Cd: np.ndarray,
+        CM: np.ndarray,
+    ):
+        """__init__.
+
+        Args:
+            alphas (np.ndarray): (num_alphas,) strictly increasing angles of attack in radians.
+            actuations (np.ndarray): (num_actuations,) strictly increasing normalized actuations.
+            Cl (np.ndarray): (num_alphas, num_actuations) lift coefficients.
+            Cd (np.ndarray): (num_alphas, num_actuations) drag coefficients.
+            CM (np.ndarray): (num_alphas, num_actuations) moment coefficients.
+
+        """
+        self.alphas = np.ascontiguousarray(alphas, dtype=np.float64)
+        self.actuations = np.ascontiguousarray(actuations, dtype=np.float64)
+        self.coefficients = np.ascontiguousarray(
+            np.stack([Cl, Cd, CM]), dtype=np.float64
         )
 
-    @staticmethod
-    @jitter
-    def _compute_aoa_freestream(
-        local_surface_velocity: np.ndarray, lift_unit: np.ndarray, drag_unit: np.ndarray
-    ) -> tuple[float, float]:
-        """Computes the angle of attack (alpha) as well as the freestream speed.
+        shape = (self.alphas.shape[0], self.actuations.shape[0])
+        if self.alphas.ndim != 1 or self.actuations.ndim != 1 or min(shape) < 2:
+            raise ValueError(
+                f"Expected `alphas` and `actuations` to be 1D arrays of at least 2 elements, got {self.alphas.shape} and {self.actuations.shape}."
+            )
+        if np.any(np.diff(self.alphas) <= 0.0) or np.any(
+            np.diff(self.actuations) <= 0.0
+        ):
+            raise ValueError("`alphas` and `actuations` must be strictly increasing.")
+        if self.coefficients.shape != (3, *shape):
+            raise ValueError(
+                f"Expected `Cl`, `Cd` and `CM` to be of shape {shape}, got {self.coefficients.shape[1:]}."
+            )
+
+        # max absolute error against the analytic model of a surface, filled in by `compute_max_error`
+        self.max_error: dict[str, float] = dict()
+
+    @classmethod
+    def from_surface(
+        cls,
+        surface: LiftingSurface,
+        alpha_resolution: int = 721,
+        actuation_resolution: int = 21,
+    ) -> AeroTable:
+        """Tabulates the analytic model of a surface, tables are cached and shared between surfaces with identical parameters.
 
         Args:
-            local_surface_velocity (np.ndarray): local_surface_velocity from self
-            lift_unit (np.ndarray): lift_unit from self
-            drag_unit (np.ndarray): drag_unit from self
+            surface (LiftingSurface): the surface to tabulate.
+            alpha_resolution (int): number of angles of attack in [-pi, pi].
+            actuation_resolution (int): number of actuations in [-1, 1].
 
         Returns:
-            tuple[float, float]:
+            AeroTable:
 
         """
-        freestream_speed = np.linalg.norm(local_surface_velocity).item()
-        lifting_airspeed = np.dot(local_surface_velocity, lift_unit)
-        forward_airspeed = np.dot(local_surface_velocity, drag_unit)
-        alpha = np.arctan2(-lifting_airspeed, forward_airspeed)
+        key = (*surface.aero_params(), alpha_resolution, actuation_resolution)
+        if key not in _AERO_TABLE_CACHE:
+            alphas = np.linspace(-np.pi, np.pi, alpha_resolution)
+            actuations = np.linspace(-1.0, 1.0, actuation_resolution)
+            coefficients = _jitted_tabulate_aero_data(
+                alphas, actuations, *surface.aero_params()
+            )
+            table = cls(alphas, actuations, *coefficients)
+            table.compute_max_error(surface)
+            _AERO_TABLE_CACHE[key] = table
 
-        return alpha, freestream_speed
+        return _AERO_TABLE_CACHE[key]
 
-    @staticmethod
-    @jitter
-    def _jitted_compute_aero_data(
-        alpha: float,
-        aspect: float,
-        flap_to_chord: float,
-        aero_tau: float,
-        actuation: float,
-        deflection_limit: float,
-        eta: float,
-        Cl_alpha_3D: float,
-        alpha_stall_P_base: float,
-        alpha_0_base: float,
-        alpha_stall_N_base: float,
-        Cd_0: float,
-    ) -> tuple[float, float, float]:
-        """Computes the relevant aerodynamic data depending on the current state of the lifting surface.
+    @classmethod
+    def load(cls, path: str) -> AeroTable:
+        """Loads a table from an `.npz` file with the arrays `alphas`, `actuations`, `Cl`, `Cd` and `CM`.
 
         Args:
-            alpha (float): alpha
-            aspect (float): aspect from self
-            flap_to_chord (float): flap_to_chord from self
-            aero_tau (float): aero_tau from self
-            actuation (float): actuation from self
-            deflection_limit (float): deflection_limit from self
-            eta (float): eta from self
-            Cl_alpha_3D (float): Cl_alpha_3D from self
-            alpha_stall_P_base (float): alpha_stall_P_base from self
-            alpha_0_base (float): alpha_0_base from self
-            alpha_stall_N_base (float): alpha_stall_N_base from self
-            Cd_0 (float): Cd_0 from self
+            path (str): path to the `.npz` file.
 
         Returns:
-            tuple[float, float, float]:
+            AeroTable:
 
         """
-        # deflection must be in degrees because engineering uses degrees
-        deflection_radians = np.deg2rad(actuation * deflection_limit)
-
-        delta_Cl = Cl_alpha_3D * aero_tau * eta * deflection_radians
-        delta_Cl_max = flap_to_chord * delta_Cl
-        Cl_max_P = Cl_alpha_3D * (alpha_stall_P_base - alpha_0_base) + delta_Cl_max
-        Cl_max_N = Cl_alpha_3D * (alpha_stall_N_base - alpha_0_base) + delta_Cl_max
-        alpha_0 = alpha_0_base - (delta_Cl / Cl_alpha_3D)
-        alpha_stall_P = alpha_0 + (Cl_max_P / Cl_alpha_3D)
-        alpha_stall_N = alpha_0 + (Cl_max_N / Cl_alpha_3D)
-
-        # no stall condition
-        if alpha_stall_N < alpha and alpha < alpha_stall_P:
-            Cl = Cl_alpha_3D * (alpha - alpha_0)
-            alpha_i = Cl / (np.pi * aspect)
-            alpha_eff = alpha - alpha_0 - alpha_i
-            CT = Cd_0 * np.cos(alpha_eff)
-            CN = (Cl + (CT * np.sin(alpha_eff))) / np.cos(alpha_eff)
-            Cd = (CN * np.sin(alpha_eff)) + (CT * np.cos(alpha_eff))
-            CM = -CN * (0.25 - (0.175 * (1.0 - ((2.0 * alpha_eff) / np.pi))))
-
-            return Cl, Cd, CM
-
-        # positive stall
-        if alpha > 0.0:
-            # Stall calculations to find alpha_i at stall
-            Cl_stall = Cl_alpha_3D * (alpha_stall_P - alpha_0)
-            alpha_i_at_stall = Cl_stall / (np.pi * aspect)
-            # alpha_i post-stall Pos
-            alpha_i = np.interp(
-                alpha, [alpha_stall_P, np.pi / 2.0], [alpha_i_at_stall, 0.0]
-            )
-        # negative stall
-        else:
-            # Stall calculations to find alpha_i at stall
-            Cl_stall = Cl_alpha_3D * (alpha_stall_N - alpha_0)
-            alpha_i_at_stall = Cl_stall / (np.pi * aspect)
-            # alpha_i post-stall Neg
-            alpha_i = np.interp(
-                alpha, [-np.pi / 2.0, alpha_stall_N], [0.0, alpha_i_at_stall]
+        with np.load(path) as data:
+            return cls(
+                data["alphas"], data["actuations"], data["Cl"], data["Cd"], data["CM"]
             )
 
-        alpha_eff = alpha - alpha_0 - alpha_i
+    def __deepcopy__(self, memo: dict[int, Any]) -> AeroTable:
+        """Tables are never modified after construction, so copies share them.
 
-        # Drag coefficient at 90 deg dependent on deflection angle
-        Cd_90 = (
-            ((-4.26 * (10**-2)) * (deflection_radians**2))
-            + ((2.1 * (10**-1)) * deflection_radians)
-            + 1.98
-        )
-        CN = (
-            Cd_90
-            * np.sin(alpha_eff)
-            * (
-                1.0 / (0.56 + 0.44 * abs(np.sin(alpha_eff)))
-                - 0.41 * (1.0 - np.exp(-17.0 / aspect))
-            )
-        )
-        CT = 0.5 * Cd_0 * np.cos(alpha_eff)
-        Cl = (CN * np.cos(alpha_eff)) - (CT * np.sin(alpha_eff))
-        Cd = (CN * np.sin(alpha_eff)) + (CT * np.cos(alpha_eff))
-        CM = -CN * (0.25 - (0.175 * (1.0 - ((2.0 * abs(alpha_eff)) / np.pi))))
+        Args:
+            memo (dict[int, Any]): memo
 
-        return Cl, Cd, CM
+        Returns:
+            AeroTable:
 
-    @staticmethod
-    @jitter
-    def _jitted_compute_force_torque(
-        alpha: float,
-        freestream_speed: float,
-        Cl: float,
-        Cd: float,
-        CM: float,
-        half_rho: float,
-        area: float,
-        chord: float,
-        lift_unit: np.ndarray,
-        drag_unit: np.ndarray,
-        torque_unit: np.ndarray,
-    ) -> tuple[np.ndarray, np.ndarray]:
-        """Compute the force and torque vectors on the surface.
+        """
+        return self
+
+    def save(self, path: str) -> None:
+        """Saves the table to an `.npz` file that can be read by `AeroTable.load`.
+
+        Args:
+            path (str): path to the `.npz` file.
+
+        """
+        np.savez(
+            path,
+            alphas=self.alphas,
+            actuations=self.actuations,
+            Cl=self.coefficients[0],
+            Cd=self.coefficients[1],
+            CM=self.coefficients[2],
+        )
+
+    def interpolate(self, alpha: float, actuation: float) -> tuple[float, float, float]:
+        """Interpolates Cl, Cd and CM at an angle of attack and actuation.
 
         Args:
-            alpha (float): alpha
-            freestream_speed (float): freestream_speed
-            Cl (float): Cl
-            Cd (float): Cd
-            CM (float): CM
-            half_rho (float): half_rho from self
-            area (float): area from self
-            chord (float): chord from self
-            lift_unit (np.ndarray): lift_unit from self
-            drag_unit (np.ndarray): drag_unit from self
-            torque_unit (np.ndarray): torque_unit from self
+            alpha (float): angle of attack in radians.
+            actuation (float): normalized actuation.
 
         Returns:
-            tuple[np.ndarray, np.ndarray]:
+            tuple[float, float, float]:
 
         """
-        # compute dynamic pressure
-        Q = half_rho * np.square(freestream_speed)
-        Q_area = Q * area
+        return _jitted_interpolate_aero_table(
+            alpha, actuation, self.alphas, self.actuations, self.coefficients
+        )
+
+    def compute_max_error(self, surface: LiftingSurface) -> dict[str, float]:
+        """Computes the max absolute error of the table against the analytic model of a surface, and stores it in `max_error`.
 
-        # compute lift and drag
-        lift = Cl * Q_area
-        drag = Cd * Q_area
-        force_normal = (lift * np.cos(alpha)) + (drag * np.sin(alpha))
-        force_parallel = (lift * np.sin(alpha)) - (drag * np.cos(alpha))
+        The error is evaluated at the center of every cell of the table, where bilinear interpolation is furthest from the grid points.
+        Expect this to be dominated by the discontinuity of the analytic model at stall.
 
-        # compute forces and torques
-        force = lift_unit * force_normal + drag_unit * force_parallel
-        torque = Q_area * CM * chord * torque_unit
+        Args:
+            surface (LiftingSurface): the surface to compare against.
 
-        return force, torque
+        Returns:
+            dict[str, float]: max absolute error of each of `Cl`, `Cd` and `CM`.
+
+        """
+        mid_alphas = 0.5 * (self.alphas[1:] + self.alphas[:-1])
+        mid_actuations = 0.5 * (self.actuations[1:] + self.actuations[:-1])
+        analytic = _jitted_tabulate_aero_data(
+            mid_alphas, mid_actuations, *surface.aero_params()
+        )
+        interpolated = 0.25 * (
+            self.coefficients[:, 1:, 1:]
+            + self.coefficients[:, 1:, :-1]
+            + self.coefficients[:, :-1, 1:]
+            + self.coefficients[:, :-1, :-1]
+        )
+        errors = np.abs(analytic - interpolated).reshape(3, -1).max(axis=-1)
+        self.max_error = dict(
+            Cl=float(errors[0]), Cd=float(errors[1]), CM=float(errors[2])
+        )
+        return self.max_error
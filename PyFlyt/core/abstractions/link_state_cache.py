@@ -0,0 +1,101 @@
+"""A per-drone cache of link states shared between components."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+from pybullet_utils import bullet_client
+
+
+class LinkStateCache:
+    """Fetches the states of all links that the components of a drone need in one call per physics step.
+
+    Components such as `BoringBodies`, `LiftingSurfaces` and `Camera` each need the positions and velocities of some links of the drone.
+    Instead of each component calling `getLinkStates` and querying the wind field for its own links, they register their links here.
+    The drone then calls `update` once in `update_state`, which issues one `getLinkStates` call for the union of all registered links, and one wind field query for all of their positions.
+    Components read their slices through the indices returned by `register`.
+
+    Args:
+        p (bullet_client.BulletClient): PyBullet physics client ID.
+        uav_id (int): ID of the drone.
+
+    """
+
+    def __init__(self, p: bullet_client.BulletClient, uav_id: int):
+        """__init__.
+
+        Args:
+            p (bullet_client.BulletClient): PyBullet physics client ID.
+            uav_id (int): ID of the drone.
+
+        """
+        self.p = p
+        self.uav_id = uav_id
+
+        # registered links, in order of first registration
+        self.link_ids: list[int] = []
+
+        # runtime states
+        self.positions = np.zeros((0, 3))
+        self.orientations = np.zeros((0, 4))
+        self.velocities = np.zeros((0, 3))
+        self.relative_velocities = np.zeros((0, 3))
+        self.stamp: None | int = -1
+
+    def register(self, link_ids: np.ndarray | Sequence[int]) -> np.ndarray:
+        """Registers links to be fetched on every `update`, links that are already registered are shared.
+
+        Args:
+            link_ids (np.ndarray | Sequence[int]): IDs of the links needed by a component.
+
+        Returns:
+            np.ndarray: indices of the given links into the cached arrays.
+
+        """
+        indices = []
+        for link_id in link_ids:
+            link_id = int(link_id)
+            assert (
+                link_id != -1
+            ), "The base cannot be cached, use the drone state instead."
+            if link_id not in self.link_ids:
+                self.link_ids.append(link_id)
+            indices.append(self.link_ids.index(link_id))
+
+        self.positions = np.zeros((len(self.link_ids), 3))
+        self.orientations = np.zeros((len(self.link_ids), 4))
+        self.velocities = np.zeros((len(self.link_ids), 3))
+        self.relative_velocities = np.zeros((len(self.link_ids), 3))
+        self.stamp = -1
+        return np.array(indices, dtype=int)
+
+    @property
+    def is_current(self) -> bool:
+        """Whether the cache was updated during the current physics step.
+
+        Returns:
+            bool:
+
+        """
+        physics_steps = getattr(self.p, "physics_steps", None)
+        return physics_steps is not None and self.stamp == physics_steps
+
+    def update(self) -> None:
+        """Fetches the states of all registered links and the wind at their positions, call this once under `update_state`."""
+        link_states = self.p.getLinkStates(
+            self.uav_id, self.link_ids, computeLinkVelocity=True
+        )
+
+        # world frame positions, orientations, and velocities of each link
+        self.positions = np.array([item[0] for item in link_states])
+        self.orientations = np.array([item[1] for item in link_states])
+        self.velocities = np.array([item[-2] for item in link_states])
+
+        # velocities relative to the surrounding air
+        self.relative_velocities = self.velocities.copy()
+        wind_field = getattr(self.p, "wind_field", None)
+        if wind_field is not None:
+            self.relative_velocities -= wind_field(self.p.elapsed_time, self.positions)
+
+        self.stamp = getattr(self.p, "physics_steps", None)
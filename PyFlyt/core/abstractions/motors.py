@@ -16,6 +16,9 @@ class Motors:
     The `Motors` component is used to simulate a series of brushless motor driven propellers at arbitrary locations of the drone.
     Counter rotating motors (producing reversed torque) can be represented using negative `torque_coef` values.
     The maximum RPM can be easily computed using `max_rpm = max_thrust / thrust_coef`.
+    When all motor links are attached to the base using fixed joints, `lumped=True` combines the thrusts and torques of all motors into one force and one torque on the base.
+    This takes two calls to PyBullet per physics step instead of two per motor.
+    The result is the same as applying forces per motor, except that PyBullet applies per link forces using link poses from before the previous physics step, which the lumped wrench does not suffer from.
 
     Args:
         p (bullet_client.BulletClient): PyBullet physics client ID.
@@ -29,6 +32,7 @@ class Motors:
         torque_coef (np.ndarray): an (n,) array of floats representing all motor torque coefficients, uses right hand rotation rule around the `thrust_unit` axis.
         thrust_unit (np.ndarray): an (n, 3) array of floats representing n unit vectors along with the thrust of each motor acts.
         noise_ratio (np.ndarray): an (n,) array of floats representing the ratio amount of noise fluctuation present in each motor.
+        lumped (bool): whether to apply the motor forces as a single wrench on the base, this requires all motor links to be fixed to the base.
 
     """
 
@@ -45,6 +49,7 @@ class Motors:
         torque_coef: np.ndarray,
         thrust_unit: np.ndarray,
         noise_ratio: np.ndarray,
+        lumped: bool = False,
     ):
         """Used for simulating an array of motors.
 
@@ -60,12 +65,19 @@ class Motors:
             torque_coef (np.ndarray): an (n,) array of floats representing all motor torque coefficients, uses right hand rotation rule around the `thrust_unit` axis.
             thrust_unit (np.ndarray): an (n, 3) array of floats representing n unit vectors along with the thrust of each motor acts.
             noise_ratio (np.ndarray): an (n,) array of floats representing the ratio amount of noise fluctuation present in each motor.
+            lumped (bool): whether to apply the motor forces as a single wrench on the base, this requires all motor links to be fixed to the base.
 
         """
         self.p = p
         self.physics_period = physics_period
         self.np_random = np_random
 
+        # draw noise from the simulation's shared pool if there is one
+        self.noise_pool = getattr(p, "noise_pool", np_random)
+
+        # inputs are checked on every physics step only in strict mode
+        self.strict = getattr(p, "strict", True)
+
         # store IDs
         self.uav_id = uav_id
         self.motor_ids = motor_ids
@@ -89,10 +101,65 @@ class Motors:
         self.torque_coef = torque_coef[..., None]
         self.thrust_unit = thrust_unit[..., None]
         self.noise_ratio = noise_ratio
+        self.noisy = bool(np.any(noise_ratio))
+
+        # runtime parameters, only ever written in place so views of them stay valid
+        self.throttle = np.zeros((self.num_motors,))
+
+        # the pose of each motor relative to the base, these are constant for fixed joints
+        self.lumped = lumped
+        if self.lumped:
+            self.link_rotations, self.lever_arms = self._get_motor_poses()
+
+    def _get_motor_poses(self) -> tuple[np.ndarray, np.ndarray]:
+        """Computes the pose of each motor link relative to the base from the joint tree of the URDF.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (num_motors, 3, 3) rotation matrices from each motor link frame to the base frame, and (num_motors, 3) positions of each motor link in the base frame
+
+        """
+        link_rotations = np.zeros((self.num_motors, 3, 3))
+        lever_arms = np.zeros((self.num_motors, 3))
+
+        for i, idx in enumerate(self.motor_ids):
+            # walk up the tree from the motor to the base, forces are applied in each link's inertial frame
+            rotation = np.eye(3)
+            position = np.zeros((3,))
+            link = idx
+            while link != -1:
+                joint_info = self.p.getJointInfo(self.uav_id, link)
+                if joint_info[2] != self.p.JOINT_FIXED:
+                    raise ValueError(
+                        f"Lumped motors require all motor links to be fixed to the base, joint {link} is not."
+                    )
+
+                # from the link's inertial frame to its link frame
+                inertial_pos, inertial_orn = self.p.getDynamicsInfo(self.uav_id, link)[
+                    3:5
+                ]
+                inertial_rot = np.array(
+                    self.p.getMatrixFromQuaternion(inertial_orn)
+                ).reshape(3, 3)
+                position = inertial_rot @ position + inertial_pos
+                rotation = inertial_rot @ rotation
+
+                # from the link frame to the parent's inertial frame
+                joint_rot = np.array(
+                    self.p.getMatrixFromQuaternion(joint_info[15])
+                ).reshape(3, 3)
+                position = joint_rot @ position + joint_info[14]
+                rotation = joint_rot @ rotation
+
+                link = joint_info[16]
+
+            link_rotations[i] = rotation
+            lever_arms[i] = position
+
+        return link_rotations, lever_arms
 
     def reset(self) -> None:
         """Reset the motors."""
-        self.throttle = np.zeros((self.num_motors,))
+        self.throttle[...] = 0.0
 
     def get_states(self) -> np.ndarray:
         """Gets the current state of the components.
@@ -117,25 +184,27 @@ class Motors:
             rotation (np.ndarray): (num_motors, 3, 3) rotation matrices to rotate each booster's thrust axis around, this is readily obtained from the `gimbals` component.
 
         """
-        assert np.all(pwm >= -1.0) and np.all(
-            pwm <= 1.0
-        ), f"`{pwm=} has values out of bounds of -1.0 and 1.0.`"
-        if rotation is not None:
-            assert rotation.shape == (
-                self.num_motors,
-                3,
-                3,
-            ), f"`rotation` should be of shape (num_motors, 3, 3), got {rotation.shape}"
+        if self.strict:
+            assert np.all(pwm >= -1.0) and np.all(
+                pwm <= 1.0
+            ), f"`{pwm=} has values out of bounds of -1.0 and 1.0.`"
+            if rotation is not None:
+                assert rotation.shape == (
+                    self.num_motors,
+                    3,
+                    3,
+                ), f"`rotation` should be of shape (num_motors, 3, 3), got {rotation.shape}"
 
         # model the motor using first order ODE, y' = T/tau * (setpoint - y)
         self.throttle += (self.physics_period / self.tau) * (pwm - self.throttle)
 
-        # noise in the motor
-        self.throttle += (
-            self.np_random.normal(*self.throttle.shape)
-            * self.throttle
-            * self.noise_ratio
-        )
+        # noise in the motor, noiseless motors skip the draw entirely
+        if self.noisy:
+            self.throttle += (
+                self.noise_pool.normal(*self.throttle.shape)
+                * self.throttle
+                * self.noise_ratio
+            )
 
         # compute thrust and torque in jitted manner
         (thrust, torque) = self._jitted_compute_thrust_torque(
@@ -147,7 +216,17 @@ class Motors:
             self.torque_coef,
         )
 
-        # apply the forces
+        # apply the forces, either as one wrench on the base or on each motor
+        if self.lumped:
+            (force, moment) = self._jitted_lump_wrench(
+                thrust, torque, self.link_rotations, self.lever_arms
+            )
+            self.p.applyExternalForce(
+                self.uav_id, -1, force, [0.0, 0.0, 0.0], self.p.LINK_FRAME
+            )
+            self.p.applyExternalTorque(self.uav_id, -1, moment, self.p.LINK_FRAME)
+            return
+
         for idx, thr, tor in zip(self.motor_ids, thrust, torque):
             self.p.applyExternalForce(
                 self.uav_id, idx, thr, [0.0, 0.0, 0.0], self.p.LINK_FRAME
@@ -193,3 +272,34 @@ class Motors:
         torque = rpm_const * torque_coef
 
         return thrust, torque
+
+    @staticmethod
+    @jitter
+    def _jitted_lump_wrench(
+        thrust: np.ndarray,
+        torque: np.ndarray,
+        link_rotations: np.ndarray,
+        lever_arms: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Combines the thrusts and torques of all motors into one force and torque about the base.
+
+        Args:
+            thrust (np.ndarray): (num_motors, 3) thrusts in each motor link frame
+            torque (np.ndarray): (num_motors, 3) torques in each motor link frame
+            link_rotations (np.ndarray): (num_motors, 3, 3) rotation matrices from each motor link frame to the base frame
+            lever_arms (np.ndarray): (num_motors, 3) positions of each motor link in the base frame
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: force and torque in the base frame
+
+        """
+        force = np.zeros((3,))
+        moment = np.zeros((3,))
+        for i in range(thrust.shape[0]):
+            link_force = link_rotations[i] @ thrust[i]
+            force += link_force
+            moment += link_rotations[i] @ torque[i] + np.cross(
+                lever_arms[i], link_force
+            )
+
+        return force, moment
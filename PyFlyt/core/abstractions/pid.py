@@ -1,20 +1,12 @@
 """A simple class implementing the PID algorithm that works on numpy arrays."""
 
-import numba as nb
+from __future__ import annotations
+
 import numpy as np
 
-_pid_spec = [
-    ("kp", nb.float64[:]),
-    ("ki", nb.float64[:]),
-    ("kd", nb.float64[:]),
-    ("limits", nb.float64[:]),
-    ("period", nb.float64),
-    ("_integral", nb.float64[:]),
-    ("_prev_error", nb.float64[:]),
-]
+from PyFlyt.core.utils.compile_helpers import jitter
 
 
-@nb.experimental.jitclass(_pid_spec)  # type: ignore [reportGeneralTypeIssues]
 class PID:
     """PID."""
 
@@ -28,8 +20,8 @@ class PID:
     ):
         """Defines a simple PID controller that works on numpy arrays.
 
-        This function is jitted to achieve 1.3x speedup.
-        Because of this, all arguments passed into this function, except `period`, must be a 1D np array and have the same shape.
+        The controller math is jitted, so all arguments passed into this function, except `period`, must be a 1D np array and have the same shape.
+        Controllers can be pickled and deepcopied, along with their internal state.
 
         Example:
             Invalid implementation:
@@ -52,16 +44,36 @@ class PID:
             period (float): period
 
         """
-        self.kp = kp
-        self.ki = ki
-        self.kd = kd
-        self.limits = limits
-        self.period = period
+        self.kp = np.asarray(kp, dtype=np.float64)
+        self.ki = np.asarray(ki, dtype=np.float64)
+        self.kd = np.asarray(kd, dtype=np.float64)
+        self.limits = np.asarray(limits, dtype=np.float64)
+        self.period = float(period)
 
         # runtime variables
         self._integral = np.zeros_like(self.kp)
         self._prev_error = np.zeros_like(self.kp)
 
+    def __reduce__(self) -> tuple:
+        """Rebuilds the controller from its gains and internal state when pickled or deepcopied.
+
+        Returns:
+            tuple:
+
+        """
+        return (
+            _rebuild_pid,
+            (
+                self.kp,
+                self.ki,
+                self.kd,
+                self.limits,
+                self.period,
+                self._integral,
+                self._prev_error,
+            ),
+        )
+
     def reset(self):
         """Resets the internal state of the PID controller."""
         self._integral *= 0.0
@@ -77,18 +89,86 @@ class PID:
         Returns:
             np.ndarray:
 
+        """
+        return self._jitted_step(
+            np.asarray(state, dtype=np.float64),
+            np.asarray(setpoint, dtype=np.float64),
+            self.kp,
+            self.ki,
+            self.kd,
+            self.limits,
+            self.period,
+            self._integral,
+            self._prev_error,
+        )
+
+    @staticmethod
+    @jitter
+    def _jitted_step(
+        state: np.ndarray,
+        setpoint: np.ndarray,
+        kp: np.ndarray,
+        ki: np.ndarray,
+        kd: np.ndarray,
+        limits: np.ndarray,
+        period: float,
+        integral: np.ndarray,
+        prev_error: np.ndarray,
+    ) -> np.ndarray:
+        """Steps the PID controller, updating its internal state in place.
+
+        Args:
+            state (np.ndarray): state
+            setpoint (np.ndarray): setpoint
+            kp (np.ndarray): kp
+            ki (np.ndarray): ki
+            kd (np.ndarray): kd
+            limits (np.ndarray): limits
+            period (float): period
+            integral (np.ndarray): integral, updated in place
+            prev_error (np.ndarray): prev_error, updated in place
+
+        Returns:
+            np.ndarray:
+
         """
         error = setpoint - state
 
-        proportional = self.kp * error
+        proportional = kp * error
 
-        self._integral = np.clip(
-            self._integral + self.ki * error * self.period, -self.limits, self.limits
-        )
+        integral[:] = np.clip(integral + ki * error * period, -limits, limits)
 
-        derivative = self.kd * (error - self._prev_error) / self.period
-        self._prev_error = error
+        derivative = kd * (error - prev_error) / period
+        prev_error[:] = error
 
-        return np.clip(
-            proportional + self._integral + derivative, -self.limits, self.limits
-        )
+        return np.clip(proportional + integral + derivative, -limits, limits)
+
+
+def _rebuild_pid(
+    kp: np.ndarray,
+    ki: np.ndarray,
+    kd: np.ndarray,
+    limits: np.ndarray,
+    period: float,
+    integral: np.ndarray,
+    prev_error: np.ndarray,
+) -> PID:
+    """Rebuilds a PID controller, including its internal state.
+
+    Args:
+        kp (np.ndarray): kp
+        ki (np.ndarray): ki
+        kd (np.ndarray): kd
+        limits (np.ndarray): limits
+        period (float): period
+        integral (np.ndarray): integral
+        prev_error (np.ndarray): prev_error
+
+    Returns:
+        PID:
+
+    """
+    controller = PID(kp, ki, kd, limits, period)
+    controller._integral[:] = integral
+    controller._prev_error[:] = prev_error
+    return controller
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import copy
 import time
 from itertools import repeat
-from typing import Any, Callable, Sequence
+from typing import Any, Callable, Hashable, Sequence
 from warnings import warn
 
 import numpy as np
@@ -14,9 +15,18 @@ from pybullet_utils import bullet_client
 
 from PyFlyt.core.abstractions import DroneClass, WindFieldClass
 from PyFlyt.core.drones import Fixedwing, QuadX, Rocket
+from PyFlyt.core.utils.body_pool import BodyPool
+from PyFlyt.core.utils.compile_helpers import jitter
+from PyFlyt.core.utils.contact_array import ContactArray
+from PyFlyt.core.utils.noise_pool import NoisePool
+from PyFlyt.core.utils.profiler import NullProfiler, StepProfiler
+from PyFlyt.core.utils.validation import check_finite
 
 DroneIndex = int
 
+# runs the phases of `Aviary.step` untimed while profiling is off
+_NULL_PROFILER = NullProfiler()
+
 
 class AviaryInitException(Exception):
     """AviaryInitException."""
@@ -63,6 +73,8 @@ class Aviary(bullet_client.BulletClient):
         world_scale (float): how big to spawn the floor.
         seed (None | int): optional int for seeding the simulation RNG.
         np_random (None | np.random.Generator): a numpy random number generator to be used for RNG.
+        strict (bool): whether components check their inputs on every physics step, this is slow and only useful for debugging.
+        use_body_pool (bool): whether full resets park and reuse drone bodies instead of reloading them, see `BodyPool`.
 
     """
 
@@ -80,6 +92,8 @@ class Aviary(bullet_client.BulletClient):
         world_scale: float = 1.0,
         seed: None | int = None,
         np_random: None | np.random.Generator = None,
+        strict: bool = False,
+        use_body_pool: bool = False,
     ):
         """Initializes a PyBullet environment that hosts UAVs and other entities.
 
@@ -99,6 +113,8 @@ class Aviary(bullet_client.BulletClient):
             world_scale (float): how big to spawn the floor.
             seed (None | int): optional int for seeding the simulation RNG.
             np_random (None | np.random.Generator): a numpy random number generator to be used for RNG.
+            strict (bool): whether components check their inputs on every physics step, this is slow and only useful for debugging.
+            use_body_pool (bool): whether full resets park and reuse drone bodies instead of reloading them, see `BodyPool`.
 
         """
         super().__init__(p.GUI if render else p.DIRECT)
@@ -116,19 +132,17 @@ class Aviary(bullet_client.BulletClient):
         else:
             self.np_random = np.random.default_rng()
 
+        # components draw their noise from this instead of the generator directly
+        self.noise_pool = NoisePool(self.np_random)
+
+        # setpoints and controller outputs are always validated, components only check their inputs in strict mode
+        self.strict = strict
+
+        # drones take their bodies from here if set, full resets then clear the world around the pooled bodies instead of destroying them
+        self.body_pool: None | BodyPool = BodyPool(self) if use_body_pool else None
+
         # check for starting position and orientation shapes
-        if len(start_pos.shape) != 2:
-            raise AviaryInitException(
-                f"start_pos must be shape (n, 3), currently {start_pos.shape}."
-            )
-        if start_pos.shape[-1] != 3:
-            raise AviaryInitException(
-                f"start_pos must be shape (n, 3), currently {start_pos.shape}."
-            )
-        if start_orn.shape != start_pos.shape:
-            raise AviaryInitException(
-                f"start_orn must be same shape as start_pos, currently {start_orn.shape}."
-            )
+        self._check_start_pos_orn(start_pos, start_orn)
 
         # check the physics hz
         if physics_hz != 240.0:
@@ -212,17 +226,73 @@ class Aviary(bullet_client.BulletClient):
             text="RTF here", textPosition=[0, 0, 0], textColorRGB=[1, 0, 0]
         )
 
+        # shapes made by `obj_visual` and `obj_collision`, these only live until `resetSimulation`
+        self.shape_cache: dict[Hashable, int] = dict()
+
+        # cache of stabilized world snapshots
+        self._snapshots: dict[Hashable, dict[str, Any]] = dict()
+
+        # bumped on every snapshot restore, bullet does not restore link masses and inertias,
+        # so components that only push these to bullet when they change use this to know when to push them again
+        self.state_restores: int = 0
+        self._profiler: None | StepProfiler = None
+        self._profiling = False
+
         # initialize the environment
         self.reset()
 
-    def reset(self) -> None:
+    def reset(
+        self,
+        start_pos: None | np.ndarray = None,
+        start_orn: None | np.ndarray = None,
+        soft: bool = False,
+    ) -> None:
         """Resets the simulation.
 
+        By default, this tears down the whole world via `resetSimulation` and rebuilds the floor and all drones from scratch.
+        With `use_body_pool`, everything but the drone bodies is removed instead, and the drones are rebuilt around parked bodies rather than reloading them.
+        When `soft=True`, the existing drone bodies are instead moved back to their starting positions and all their components are re-zeroed, leaving the rest of the world intact.
+        A soft reset falls back to a full rebuild if the number or types of drones no longer match what is currently spawned.
+
         Args:
-            seed (None | int): seed
+            start_pos (None | np.ndarray): an optional `(n, 3)` array of new starting positions, defaults to the previous starting positions.
+            start_orn (None | np.ndarray): an optional `(n, 3)` array of new starting orientations, defaults to the previous starting orientations.
+            soft (bool): whether to reuse the already loaded bodies instead of rebuilding the world.
 
         """
-        self.resetSimulation()
+        # update the spawn configuration if needed
+        if start_pos is not None or start_orn is not None:
+            start_pos = self.start_pos if start_pos is None else start_pos
+            start_orn = self.start_orn if start_orn is None else start_orn
+            self._check_start_pos_orn(start_pos, start_orn)
+            if (
+                isinstance(self.drone_type, (tuple, list))
+                and len(self.drone_type) != start_pos.shape[0]
+            ) or (
+                isinstance(self.drone_options, (tuple, list))
+                and len(self.drone_options) != start_pos.shape[0]
+            ):
+                raise AviaryInitException(
+                    f"Cannot change the number of drones to {start_pos.shape[0]} when per-drone `drone_type` or `drone_options` are used."
+                )
+            self.num_drones = start_pos.shape[0]
+            self.start_pos = start_pos
+            self.start_orn = start_orn
+
+        # reuse the existing world if possible
+        if soft and self._can_soft_reset():
+            self._soft_reset()
+            return
+
+        if self.body_pool is not None:
+            self.clear_snapshots()
+            self._clear_world()
+        else:
+            self.resetSimulation()
+            self._snapshots.clear()
+            self.shape_cache.clear()
+        self.contact_array = ContactArray()
+        self._step_contacts = ContactArray()
         self.setGravity(0, 0, -9.81)
         self.physics_steps: int = 0
         self.aviary_steps: int = 0
@@ -236,10 +306,11 @@ class Aviary(bullet_client.BulletClient):
             cameraTargetPosition=[0, 0, 1],
         )
 
-        # construct the world
-        self.planeId = self.loadURDF(
-            "plane.urdf", useFixedBase=True, globalScaling=self.world_scale
-        )
+        # construct the world, the floor survives resets when a body pool is used
+        if self.body_pool is None or not hasattr(self, "planeId"):
+            self.planeId = self.loadURDF(
+                "plane.urdf", useFixedBase=True, globalScaling=self.world_scale
+            )
 
         # spawn drones
         self.drones: list[DroneClass] = []
@@ -263,6 +334,226 @@ class Aviary(bullet_client.BulletClient):
             )
 
         # initialize the wind field
+        self._init_wind_field()
+
+        # point all drone states into the contiguous fleet buffers
+        self._bind_fleet_buffers()
+
+        # constants for tracking how many times to step depending on control hz
+        self._update_looprates()
+
+        # rtf tracking parameters
+        self.now = time.time()
+        self._frame_elapsed = 0.0
+        self._sim_elapsed = 0.0
+
+        # arm everything
+        self.register_all_new_bodies()
+        self.set_armed(True)
+
+        # reset all drones and initialize required states
+        [drone.reset() for drone in self.drones]
+        self._bind_setpoint_buffers()
+        self._update_fleet_states()
+        [drone.update_state() for drone in self.drones]
+        [drone.update_last(0) for drone in self.drones]
+
+    def _update_looprates(self) -> None:
+        """Sets the number of physics steps per `step` from the slowest control looprate amongst all drones, and checks that the looprates are compatible."""
+        all_control_hz = [int(1.0 / drone.control_period) for drone in self.drones]
+        self.updates_per_step = int(self.physics_hz / np.min(all_control_hz))
+        self.step_period = 1.0 / np.min(all_control_hz)
+
+        # sanity check the control looprates
+        if len(all_control_hz) > 0:
+            all_control_hz.sort()
+            all_ratios = np.array(all_control_hz)[1:] / np.array(all_control_hz)[:-1]
+            assert all(
+                r % 1.0 == 0.0 for r in all_ratios
+            ), "Looprates must form common multiples of each other."
+
+    def spawn_drone(
+        self,
+        drone_type: str,
+        start_pos: np.ndarray,
+        start_orn: np.ndarray,
+        drone_options: None | dict[str, Any] = None,
+    ) -> int:
+        """Spawns a new armed drone into the running simulation, without resetting anything else.
+
+        The new drone is appended to `drones`, and the state buffers, control schedule and contact registry are updated incrementally.
+        With `use_body_pool`, a parked body is reused if one is available.
+        Spawning a drone with a slower control looprate than all others lengthens every subsequent `step`, as `updates_per_step` follows the slowest drone.
+        The spawn configuration used by `reset` is left unchanged, so the next full reset rebuilds the drones that the `Aviary` was last reset with.
+        Snapshots are cleared, as they no longer match the drones in the world.
+
+        Args:
+            drone_type (str): the type of drone, this must be a key of `drone_type_mappings`.
+            start_pos (np.ndarray): a `(3,)` array for the starting X, Y, Z position of the drone.
+            start_orn (np.ndarray): a `(3,)` array for the starting orientation of the drone, in terms of Euler angles.
+            drone_options (None | dict[str, Any]): options passed to the drone's constructor.
+
+        Returns:
+            int: the index of the new drone in `drones`.
+
+        """
+        if drone_type not in self.drone_type_mappings:
+            raise ValueError(
+                f"Can't find `drone_type` {drone_type} amongst known types {self.drone_type_mappings.keys()}."
+            )
+        start_pos = np.asarray(start_pos, dtype=np.float64)
+        start_orn = np.asarray(start_orn, dtype=np.float64)
+        self._check_start_pos_orn(start_pos[None], start_orn[None])
+
+        armed_ids = {id(drone) for drone in self.armed_drones}
+        armed = [id(drone) in armed_ids for drone in self.drones]
+        self.clear_snapshots()
+
+        drone = self.drone_type_mappings[drone_type](
+            self,
+            start_pos=start_pos,
+            start_orn=start_orn,
+            physics_hz=self.physics_hz,
+            np_random=self.np_random,
+            **(drone_options or dict()),
+        )
+        self.drones.append(drone)
+
+        # grow the state buffers, the existing drones' states are carried over
+        self._bind_fleet_buffers()
+        self._update_looprates()
+        self.register_all_new_bodies()
+        self.set_armed([*armed, True])
+
+        # reset the new drone and initialize its states
+        drone.reset()
+        self._bind_setpoint_buffers()
+        self._update_fleet_states()
+        drone.update_state()
+        drone.update_last(self.physics_steps)
+
+        return len(self.drones) - 1
+
+    def remove_drone(self, index: int) -> None:
+        """Removes a drone from the running simulation, without resetting anything else.
+
+        The drone's body is parked in the body pool if `use_body_pool` is set, and removed from the world otherwise.
+        The indices of all drones after it in `drones` shift down by one.
+        As with `spawn_drone`, the spawn configuration used by `reset` is left unchanged and snapshots are cleared.
+
+        Args:
+            index (int): the index of the drone in `drones`.
+
+        """
+        armed_ids = {id(drone) for drone in self.armed_drones}
+        armed = [id(drone) in armed_ids for drone in self.drones]
+        del armed[index]
+        drone = self.drones.pop(index)
+        self.clear_snapshots()
+
+        if self.body_pool is not None:
+            self.body_pool.release(drone.Id)
+        else:
+            self.removeBody(drone.Id)
+
+        # bullet hands out the IDs of removed bodies again, so stale contacts must not linger
+        self.contact_array.remove_body(drone.Id)
+        self._step_contacts.remove_body(drone.Id)
+
+        # shrink the state buffers, the remaining drones' states are carried over
+        self._bind_fleet_buffers()
+        if self.drones:
+            self._update_looprates()
+        self.set_armed(armed)
+        self._bind_setpoint_buffers()
+
+    def _clear_world(self) -> None:
+        """Removes everything from the world except for the floor and pooled bodies, which are parked, this stands in for `resetSimulation` when a body pool is used."""
+        for i in reversed(range(self.getNumConstraints())):
+            self.removeConstraint(self.getConstraintUniqueId(i))
+
+        # the floor is kept, so that it stays ahead of the drones in bullet's solver order, as in a fresh world
+        assert self.body_pool is not None
+        for body_id in [self.getBodyUniqueId(i) for i in range(self.getNumBodies())]:
+            if body_id != getattr(self, "planeId", None):
+                self.body_pool.release(body_id)
+
+    def _check_start_pos_orn(
+        self, start_pos: np.ndarray, start_orn: np.ndarray
+    ) -> None:
+        """Checks that the starting positions and orientations are of valid shapes.
+
+        Args:
+            start_pos (np.ndarray): an `(n, 3)` array for the starting X, Y, Z positions for each drone.
+            start_orn (np.ndarray): an `(n, 3)` array for the starting orientations for each drone, in terms of Euler angles.
+
+        """
+        if len(start_pos.shape) != 2:
+            raise AviaryInitException(
+                f"start_pos must be shape (n, 3), currently {start_pos.shape}."
+            )
+        if start_pos.shape[-1] != 3:
+            raise AviaryInitException(
+                f"start_pos must be shape (n, 3), currently {start_pos.shape}."
+            )
+        if start_orn.shape != start_pos.shape:
+            raise AviaryInitException(
+                f"start_orn must be same shape as start_pos, currently {start_orn.shape}."
+            )
+
+    def _can_soft_reset(self) -> bool:
+        """Checks whether the currently spawned drones match the requested drone count and types.
+
+        Returns:
+            bool: whether a soft reset is possible
+
+        """
+        if not hasattr(self, "drones") or len(self.drones) != self.num_drones:
+            return False
+
+        return all(
+            type(drone) is self.drone_type_mappings[drone_type]
+            for drone, drone_type in zip(self.drones, self.drone_type)
+        )
+
+    def _soft_reset(self) -> None:
+        """Resets all drones in place without tearing down the world."""
+        self.physics_steps: int = 0
+        self.aviary_steps: int = 0
+        self.elapsed_time: float = 0
+
+        # move all drones back to their spawn points, and kill all their momentum
+        # the drones' own `reset` handles the position and any starting velocities
+        for drone, start_pos, start_orn in zip(
+            self.drones, self.start_pos, self.start_orn
+        ):
+            drone.start_pos = start_pos
+            drone.start_orn = self.getQuaternionFromEuler(start_orn)
+            self.resetBaseVelocity(drone.Id, [0.0, 0.0, 0.0], [0.0, 0.0, 0.0])
+
+        # wind field models may have internal state, registered wind functions are kept as is
+        if self.wind_type is not None:
+            self._init_wind_field()
+
+        # rtf tracking parameters
+        self.now = time.time()
+        self._frame_elapsed = 0.0
+        self._sim_elapsed = 0.0
+
+        # clear collisions and arm everything
+        self.contact_array.clear()
+        self._step_contacts.clear()
+        self.set_armed(True)
+
+        # reset all drones and initialize required states
+        [drone.reset() for drone in self.drones]
+        self._bind_setpoint_buffers()
+        self._update_fleet_states()
+        [drone.update_state() for drone in self.drones]
+        [drone.update_last(0) for drone in self.drones]
+
+    def _init_wind_field(self) -> None:
+        """Initializes the wind field from the wind type and options."""
         self.wind_field: None | WindFieldClass | Callable
         if self.wind_type is None:
             # no wind field
@@ -284,42 +575,314 @@ class Aviary(bullet_client.BulletClient):
             # none of the above
             raise LookupError("Invalid setting for wind field.")
 
-        # constants for tracking how many times to step depending on control hz
-        all_control_hz = [int(1.0 / drone.control_period) for drone in self.drones]
-        self.updates_per_step = int(self.physics_hz / np.min(all_control_hz))
-        self.step_period = 1.0 / np.min(all_control_hz)
+    def save_snapshot(self, key: None | Hashable = None) -> Hashable:
+        """Captures the current state of the world and all drones into the snapshot cache.
 
-        # sanity check the control looprates
-        if len(all_control_hz) > 0:
-            all_control_hz.sort()
-            all_ratios = np.array(all_control_hz)[1:] / np.array(all_control_hz)[:-1]
-            assert all(
-                r % 1.0 == 0.0 for r in all_ratios
-            ), "Looprates must form common multiples of each other."
+        This is meant to be called once the drones have stabilized after a reset.
+        Later resets with the same spawn configuration, flight modes and setpoints can then skip the stabilization steps entirely via `restore_snapshot`.
+        The random number generator is not part of the snapshot, so noise after a restore still varies between episodes.
+        All snapshots are invalidated on a full (non-soft) reset.
+
+        Args:
+            key (None | Hashable): key to store the snapshot under, defaults to one derived from the current spawn configuration, flight modes and setpoints.
+
+        Returns:
+            Hashable: the key that the snapshot was stored under.
+
+        """
+        key = self._snapshot_key() if key is None else key
+        if key in self._snapshots:
+            self.removeState(self._snapshots[key]["state_id"])
+
+        armed_ids = {id(drone) for drone in self.armed_drones}
+        self._snapshots[key] = dict(
+            state_id=self.saveState(),
+            num_bodies=self.getNumBodies(),
+            num_drones=len(self.drones),
+            drones=self._drone_signature(),
+            physics_steps=self.physics_steps,
+            aviary_steps=self.aviary_steps,
+            elapsed_time=self.elapsed_time,
+            contact_array=self.contact_array.copy(),
+            step_contacts=self._step_contacts.copy(),
+            armed=[id(drone) in armed_ids for drone in self.drones],
+            python_state=copy.deepcopy(
+                (self.wind_field, [drone.__dict__ for drone in self.drones]),
+                self._snapshot_memo(),
+            ),
+        )
+
+        return key
+
+    def restore_snapshot(self, key: None | Hashable = None) -> bool:
+        """Restores the world and all drones from the snapshot cache.
+
+        Nothing is restored unless the world holds the same number of bodies, and the same drones in the same flight modes with the same setpoints, as when the snapshot was saved.
+        This prevents a restore from bringing back a stale flight mode or setpoint along with the rest of the drone state.
+
+        Args:
+            key (None | Hashable): key that the snapshot was stored under, defaults to one derived from the current spawn configuration, flight modes and setpoints.
+
+        Returns:
+            bool: whether a valid snapshot was found and restored.
+
+        """
+        key = self._snapshot_key() if key is None else key
+        snapshot = self._snapshots.get(key)
+        if (
+            snapshot is None
+            or snapshot["num_bodies"] != self.getNumBodies()
+            or snapshot["num_drones"] != len(self.drones)
+            or snapshot["drones"] != self._drone_signature()
+        ):
+            return False
+
+        # restore the bullet side of things
+        self.restoreState(stateId=snapshot["state_id"])
+        self.state_restores += 1
+        self.physics_steps = snapshot["physics_steps"]
+        self.aviary_steps = snapshot["aviary_steps"]
+        self.elapsed_time = snapshot["elapsed_time"]
+        self.contact_array = snapshot["contact_array"].copy()
+        self._step_contacts = snapshot["step_contacts"].copy()
+
+        # restore the python side of things, copied so the snapshot can be reused
+        wind_field, drone_dicts = copy.deepcopy(
+            snapshot["python_state"], self._snapshot_memo()
+        )
+        self.wind_field = wind_field
+        for drone, drone_dict in zip(self.drones, drone_dicts):
+            drone.__dict__.update(drone_dict)
+        self._bind_fleet_buffers()
+        self._bind_setpoint_buffers()
+        self.set_armed(snapshot["armed"])
 
         # rtf tracking parameters
         self.now = time.time()
         self._frame_elapsed = 0.0
         self._sim_elapsed = 0.0
 
-        # arm everything
-        self.register_all_new_bodies()
-        self.set_armed(True)
+        return True
 
-        # reset all drones and initialize required states
-        [drone.reset() for drone in self.drones]
-        [drone.update_state() for drone in self.drones]
-        [drone.update_last(0) for drone in self.drones]
+    def clear_snapshots(self) -> None:
+        """Removes all snapshots from the snapshot cache."""
+        for snapshot in self._snapshots.values():
+            self.removeState(snapshot["state_id"])
+        self._snapshots.clear()
+
+    def stabilize(self, num_steps: int) -> bool:
+        """Steps the simulation to let all drones settle after a reset, or restores the outcome of an earlier call.
+
+        This is meant to replace a plain loop of `step` calls right after a soft reset.
+        The first call for a spawn configuration, set of flight modes and setpoints runs the steps and caches the result with `save_snapshot`, later calls skip straight to `restore_snapshot`.
+        The steps draw their noise from the random number generator as usual, so every later call restores the state that the first call settled into, regardless of seed.
+        The first call restores its own snapshot too, bullet does not restore its cached link transforms exactly, so this keeps every episode on the same footing.
+
+        Args:
+            num_steps (int): number of calls to `step` to let the drones settle.
+
+        Returns:
+            bool: whether the steps were skipped by restoring a snapshot.
+
+        """
+        key = self._snapshot_key()
+        if self.restore_snapshot(key):
+            return True
+
+        for _ in range(num_steps):
+            self.step()
+        self.save_snapshot(key)
+        self.restore_snapshot(key)
+
+        return False
+
+    def reseed(self, np_random: np.random.Generator) -> None:
+        """Moves the random number generator to the state of another generator.
+
+        This is done in place, so all drones, components, and wind fields keep sharing the same generator.
+
+        Args:
+            np_random (np.random.Generator): generator whose state to copy, must use the same bit generator type.
+
+        """
+        self.np_random.bit_generator.state = np_random.bit_generator.state
+        self.noise_pool.reset()
+
+    def _snapshot_key(self) -> Hashable:
+        """Returns a key representing the current spawn configuration, flight modes, and setpoints.
+
+        Returns:
+            Hashable:
+
+        """
+        return (
+            self.start_pos.tobytes(),
+            self.start_orn.tobytes(),
+            self._drone_signature(),
+        )
+
+    def _drone_signature(self) -> tuple[tuple[int, str, Any, bytes], ...]:
+        """Returns the id, type, flight mode, and setpoint of every drone, these must match for a snapshot to be restored.
+
+        Returns:
+            tuple[tuple[int, str, Any, bytes], ...]:
+
+        """
+        return tuple(
+            (
+                drone.Id,
+                type(drone).__name__,
+                getattr(drone, "mode", None),
+                np.asarray(drone.setpoint, dtype=np.float64).tobytes(),
+            )
+            for drone in self.drones
+        )
+
+    def _snapshot_memo(self) -> dict[int, Any]:
+        """Objects that must be shared, not copied, when snapshotting.
+
+        Returns:
+            dict[int, Any]:
+
+        """
+        return {
+            id(self): self,
+            id(self.np_random): self.np_random,
+            id(self.noise_pool): self.noise_pool,
+        }
+
+    def _bind_fleet_buffers(self) -> None:
+        """Allocates the contiguous fleet state buffers if needed and binds each drone's state to views of them."""
+        num_drones = len(self.drones)
+        if not hasattr(self, "_fleet_state") or len(self._fleet_state) != num_drones:
+            self._fleet_state = np.zeros((num_drones, 4, 3), dtype=np.float64)
+            self._fleet_quaternion = np.zeros((num_drones, 4), dtype=np.float64)
+            self._fleet_rotation = np.zeros((num_drones, 3, 3), dtype=np.float64)
+            self._fleet_velocities = np.zeros((num_drones, 2, 3), dtype=np.float64)
+
+        for i, drone in enumerate(self.drones):
+            drone.bind_state_buffers(
+                self._fleet_state[i], self._fleet_quaternion[i], self._fleet_rotation[i]
+            )
+
+    def _bind_setpoint_buffers(self) -> None:
+        """Groups drones by setpoint shape and binds each drone's setpoint to a row of its group's shared buffer.
+
+        Buffers are only reallocated when the grouping changes, such as when a drone switches to a flight mode with a different setpoint size.
+        """
+        layout = tuple(drone.setpoint.shape for drone in self.drones)
+        if layout != getattr(self, "_setpoint_layout", None):
+            groups: dict[tuple[int, ...], list[int]] = dict()
+            for i, shape in enumerate(layout):
+                groups.setdefault(shape, []).append(i)
+
+            self._setpoint_layout = layout
+            self._setpoint_groups = {
+                shape: (
+                    np.array(indices, dtype=np.int64),
+                    np.zeros((len(indices), *shape), dtype=np.float64),
+                )
+                for shape, indices in groups.items()
+            }
+
+        for indices, buffer in self._setpoint_groups.values():
+            for row, i in enumerate(indices):
+                self.drones[i].bind_setpoint_buffer(
+                    buffer[row], self._mark_setpoints_unbound
+                )
+
+        self._setpoints_unbound = False
+
+    def _mark_setpoints_unbound(self) -> None:
+        """Called by drones when their setpoint changes shape, the setpoint buffers are rebound on next use."""
+        self._setpoints_unbound = True
+
+    def _update_fleet_states(self) -> None:
+        """Reads the base states of all armed drones from PyBullet and converts them in one pass."""
+        for i in self._armed_indices:
+            drone_id = self.drones[i].Id
+            self._fleet_state[i, 3], self._fleet_quaternion[i] = (
+                self.getBasePositionAndOrientation(drone_id)
+            )
+            self._fleet_velocities[i, 1], self._fleet_velocities[i, 0] = (
+                self.getBaseVelocity(drone_id)
+            )
+
+        self._compute_fleet_states(
+            self._armed_indices,
+            self._fleet_quaternion,
+            self._fleet_velocities,
+            self._fleet_state,
+            self._fleet_rotation,
+        )
+
+    @staticmethod
+    @jitter
+    def _compute_fleet_states(
+        indices: np.ndarray,
+        quaternions: np.ndarray,
+        velocities: np.ndarray,
+        states: np.ndarray,
+        rotations: np.ndarray,
+    ) -> None:
+        """Computes the rotation matrices, Euler angles and body frame velocities for the indexed drones in place.
+
+        This matches `getMatrixFromQuaternion` and `getEulerFromQuaternion` from PyBullet.
+
+        Args:
+            indices (np.ndarray): `(k,)` indices of drones to update.
+            quaternions (np.ndarray): `(n, 4)` ground frame orientation quaternions.
+            velocities (np.ndarray): `(n, 2, 3)` ground frame angular and linear velocities.
+            states (np.ndarray): `(n, 4, 3)` state buffer, the linear position must already be filled in.
+            rotations (np.ndarray): `(n, 3, 3)` buffer for the rotation matrices from the ground frame to the body frame.
+
+        """
+        for i in indices:
+            x, y, z, w = (
+                quaternions[i, 0],
+                quaternions[i, 1],
+                quaternions[i, 2],
+                quaternions[i, 3],
+            )
+            xx, yy, zz, ww = x * x, y * y, z * z, w * w
+            s = 2.0 / (xx + yy + zz + ww)
+
+            # the transpose of the body to ground rotation
+            rotations[i, 0, 0] = 1.0 - s * (yy + zz)
+            rotations[i, 1, 0] = s * (x * y - w * z)
+            rotations[i, 2, 0] = s * (x * z + w * y)
+            rotations[i, 0, 1] = s * (x * y + w * z)
+            rotations[i, 1, 1] = 1.0 - s * (xx + zz)
+            rotations[i, 2, 1] = s * (y * z - w * x)
+            rotations[i, 0, 2] = s * (x * z - w * y)
+            rotations[i, 1, 2] = s * (y * z + w * x)
+            rotations[i, 2, 2] = 1.0 - s * (xx + yy)
+
+            # express vels in local frame
+            for j in range(3):
+                states[i, 0, j] = 0.0
+                states[i, 2, j] = 0.0
+                for k in range(3):
+                    states[i, 0, j] += rotations[i, j, k] * velocities[i, 0, k]
+                    states[i, 2, j] += rotations[i, j, k] * velocities[i, 1, k]
+
+            # ang_pos in euler form
+            pitch_sin = -2.0 * (x * z - w * y)
+            states[i, 1, 0] = np.arctan2(2.0 * (y * z + w * x), ww - xx - yy + zz)
+            states[i, 1, 1] = np.arcsin(min(max(pitch_sin, -1.0), 1.0))
+            states[i, 1, 2] = np.arctan2(2.0 * (x * y + w * z), ww + xx - yy - zz)
 
     def register_all_new_bodies(self) -> None:
         """Registers all new bodies in the environment to be able to handle collisions later.
 
         Call this when there is an update in the number of bodies in the environment.
+        The contact arrays are sparse, so this only grows their reported size and never reallocates or clears them.
         """
         num_bodies = (
-            np.max([self.getBodyUniqueId(i) for i in range(self.getNumBodies())]) + 1
+            max(self.getBodyUniqueId(i) for i in range(self.getNumBodies())) + 1
         )
-        self.contact_array = np.zeros((num_bodies, num_bodies), dtype=bool)
+        self.contact_array.register(num_bodies)
+        self._step_contacts.register(num_bodies)
 
     def register_wind_field_function(self, wind_field: Callable) -> None:
         """For less complicated wind field models (time invariant models), this allows the registration of a normal function as a wind field model.
@@ -369,10 +932,11 @@ class Aviary(bullet_client.BulletClient):
         return self.drones[index].aux_state
 
     @property
-    def all_states(self) -> list[np.ndarray]:
-        """Returns a list of states for all drones in the environment.
+    def all_states(self) -> np.ndarray:
+        """Returns the states for all drones in the environment.
 
-        This is a `num_drones` list of (4, 3) arrays, where each element in the list corresponds to the i-th drone state.
+        This is a `(num_drones, 4, 3)` array, where each element corresponds to the i-th drone state.
+        It is a view into the fleet state buffer that is updated in place, copy it if it needs to be kept around.
 
         Similar to the `state` property, the states contain information corresponding to:
             - `state[0, :]` represents body frame angular velocity
@@ -380,17 +944,11 @@ class Aviary(bullet_client.BulletClient):
             - `state[2, :]` represents body frame linear velocity
             - `state[3, :]` represents ground frame linear position
 
-        This function is not very optimized, if you want the state of a single drone, do `state(i)`.
-
         Returns:
-            np.ndarray: list of states
+            np.ndarray: a `(num_drones, 4, 3)` array of states
 
         """
-        states = []
-        for drone in self.drones:
-            states.append(drone.state)
-
-        return states
+        return self._fleet_state
 
     @property
     def all_aux_states(self) -> list[np.ndarray]:
@@ -410,6 +968,32 @@ class Aviary(bullet_client.BulletClient):
 
         return aux_states
 
+    def contacts_of(self, body_id: int) -> set[int] | frozenset[int]:
+        """Returns the IDs of all bodies that the given body was in contact with during the last physics step.
+
+        Unlike `contact_array`, which accumulates contacts over a whole call to `step`, this only holds contacts from the most recent physics step.
+
+        Args:
+            body_id (int): ID of the body to query
+
+        Returns:
+            set[int] | frozenset[int]: IDs of all bodies in contact, do not modify this in place.
+
+        """
+        return self._step_contacts.contacts_of(body_id)
+
+    def in_contact(self, body_id: int) -> bool:
+        """Returns whether the given body was in contact with anything during the last physics step.
+
+        Args:
+            body_id (int): ID of the body to query
+
+        Returns:
+            bool:
+
+        """
+        return self._step_contacts.in_contact(body_id)
+
     def print_all_bodies(self) -> None:
         """Debugging function used to print out all bodies in the environment along with their IDs."""
         bodies = dict()
@@ -437,6 +1021,75 @@ class Aviary(bullet_client.BulletClient):
         else:
             self.armed_drones = [drone for drone in self.drones] if settings else []
 
+        armed_ids = {id(drone) for drone in self.armed_drones}
+        self._armed_indices = np.array(
+            [i for i, drone in enumerate(self.drones) if id(drone) in armed_ids],
+            dtype=np.int64,
+        )
+        self._build_update_schedule()
+
+    def _build_update_schedule(self) -> None:
+        """Precomputes which armed drones need control and camera updates on each physics step, and whether their physics can be batched.
+
+        The schedule repeats every `len(self._control_schedule)` physics steps, which is a multiple of `updates_per_step`.
+        Drones that do not define `use_camera` and `physics_camera_ratio` have `update_last` called on every physics step.
+        Physics is batched through the drones' `fleet_class` when all armed drones are of the same type, that type provides one, and it does not override the `update_physics` of the class that declared the fleet.
+        Control is batched as well when the fleet provides `update_control` and the drone type does not override `update_control` either.
+        Drones with `update_physics` assigned on the instance are checked for on every `step`, and rule out batching the physics.
+        """
+        control_ratios = [drone.physics_control_ratio for drone in self.armed_drones]
+        camera_ratios = [
+            (
+                getattr(drone, "physics_camera_ratio", 1)
+                if getattr(drone, "use_camera", True)
+                else 0
+            )
+            for drone in self.armed_drones
+        ]
+        period = int(
+            np.lcm.reduce(
+                [self.updates_per_step, *control_ratios, *filter(None, camera_ratios)]
+            )
+        )
+
+        self._control_schedule: list[list[DroneClass]] = [
+            [
+                drone
+                for drone, ratio in zip(self.armed_drones, control_ratios)
+                if step % ratio == 0
+            ]
+            for step in range(period)
+        ]
+        self._camera_schedule: list[list[DroneClass]] = [
+            [
+                drone
+                for drone, ratio in zip(self.armed_drones, camera_ratios)
+                if ratio > 0 and step % ratio == 0
+            ]
+            for step in range(period)
+        ]
+
+        # batch the physics if all armed drones are of one type that supports it
+        # control is batched too if the fleet supports it and `update_control` is not overridden
+        self._fleet = None
+        self._control_fleet = None
+        drone_types = {type(drone) for drone in self.armed_drones}
+        if len(drone_types) == 1:
+            drone_type = drone_types.pop()
+            fleet_class = drone_type.fleet_class
+
+            # the fleet only stands in for the methods of the class that declared it
+            declarer = next(c for c in drone_type.__mro__ if "fleet_class" in vars(c))
+            if (
+                fleet_class is not None
+                and drone_type.update_physics is declarer.update_physics
+            ):
+                self._fleet = fleet_class(self.armed_drones)
+                if drone_type.update_control is declarer.update_control and hasattr(
+                    self._fleet, "update_control"
+                ):
+                    self._control_fleet = self._fleet
+
     def set_mode(self, flight_modes: int | list[int]) -> None:
         """Sets the flight control mode of each drone in the environment.
 
@@ -465,20 +1118,119 @@ class Aviary(bullet_client.BulletClient):
             setpoint (np.ndarray): setpoint
 
         """
+        check_finite("setpoint", setpoint)
         self.drones[index].setpoint = setpoint
 
     def set_all_setpoints(self, setpoints: np.ndarray) -> None:
         """Sets the setpoints of each drone in the environment.
 
+        When all drones share the same setpoint shape and `setpoints` is a single array, this is one write into the shared setpoint buffer.
+
         Args:
             setpoints (np.ndarray): list of setpoints
 
         """
+        if self._setpoints_unbound:
+            self._bind_setpoint_buffers()
+
+        if len(self._setpoint_groups) == 1:
+            buffer = next(iter(self._setpoint_groups.values()))[1]
+            if np.shape(setpoints) == buffer.shape:
+                check_finite("setpoints", setpoints)
+                buffer[...] = setpoints
+                return
+
         for i, drone in enumerate(self.drones):
+            check_finite("setpoint", setpoints[i])
             drone.setpoint = setpoints[i]
 
+    @property
+    def setpoints(self) -> np.ndarray:
+        """Returns the shared `(num_drones, setpoint_dim)` setpoint buffer, where each row is a view of the i-th drone's setpoint.
+
+        Writing into this array sets the setpoints of all drones without any copies, but also bypasses the checks done by `set_all_setpoints`.
+        This is only available when all drones share the same setpoint shape, otherwise use `setpoint_groups`.
+
+        Returns:
+            np.ndarray:
+
+        """
+        groups = self.setpoint_groups
+        if len(groups) != 1:
+            raise ValueError(
+                f"Drones have setpoints of different shapes {list(groups.keys())}, use `setpoint_groups` instead."
+            )
+        return next(iter(groups.values()))[1]
+
+    @property
+    def setpoint_groups(self) -> dict[tuple[int, ...], tuple[np.ndarray, np.ndarray]]:
+        """Returns the shared setpoint buffers, grouped by setpoint shape.
+
+        Each group maps a setpoint shape to a tuple of `(indices, buffer)`, where `buffer[j]` is a view of the setpoint of drone `indices[j]`.
+
+        Returns:
+            dict[tuple[int, ...], tuple[np.ndarray, np.ndarray]]:
+
+        """
+        if self._setpoints_unbound:
+            self._bind_setpoint_buffers()
+        return self._setpoint_groups
+
+    def enable_profiling(self, reset: bool = True) -> None:
+        """Starts recording the wall time spent in each phase of `step`, see `profile_stats`.
+
+        Args:
+            reset (bool): whether to discard previously recorded statistics.
+
+        """
+        if reset or self._profiler is None:
+            self._profiler = StepProfiler()
+        self._profiling = True
+
+    def disable_profiling(self) -> None:
+        """Stops recording wall times, previously recorded statistics are kept until profiling is enabled again."""
+        self._profiling = False
+
+    def profile_stats(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Returns the wall time statistics recorded since `enable_profiling` was called.
+
+        This is a JSON serializable nested dictionary of `{phase: {group: {"calls", "total_time", "time_per_call"}}}`, with times in seconds.
+        Phases that involve drones are grouped by drone type, everything else is grouped under `"all"`.
+        The phases are:
+            - `step`: the whole call to `step`
+            - `control`: `update_control` on drones due for a control update
+            - `physics`: `update_physics`, or the batched fleet physics, which computes and applies forces
+            - `step_simulation`: PyBullet's `stepSimulation`
+            - `contacts`: splicing contact points into the contact arrays
+            - `state_readout`: reading and converting the base states of all armed drones
+            - `state`: `update_state` on each drone
+            - `camera`: `update_last` on drones due for a camera update
+
+        Returns:
+            dict[str, dict[str, dict[str, float]]]:
+
+        """
+        return dict() if self._profiler is None else self._profiler.stats()
+
     def step(self) -> None:
         """Steps the environment, this automatically handles physics and control looprates, one step is equivalent to one control loop step."""
+        profiler = self._profiler if self._profiler and self._profiling else None
+        profiler = profiler or _NULL_PROFILER
+        with profiler.phase("step"):
+            self._step(profiler)
+        self.aviary_steps += 1
+
+    def _step(self, profiler: StepProfiler | NullProfiler) -> None:
+        """The body of `step`, each phase of which is timed by the profiler.
+
+        Args:
+            profiler (StepProfiler | NullProfiler): records the wall time of each phase, or does nothing when profiling is off.
+
+        """
+        # drones may have changed setpoint shapes since the last step
+        if self._setpoints_unbound:
+            self._bind_setpoint_buffers()
+
         # compute rtf if we're rendering
         if self.render:
             elapsed = time.time() - self.now
@@ -504,28 +1256,162 @@ class Aviary(bullet_client.BulletClient):
                 )
 
         # reset collisions
-        self.contact_array &= False
+        self.contact_array.clear()
+
+        # an `update_physics` assigned onto a drone instance must not be skipped by the batched physics
+        fleet = self._fleet
+        if fleet is not None and any(
+            "update_physics" in vars(drone) for drone in self.armed_drones
+        ):
+            fleet = None
+        control_fleet = self._control_fleet
+        fleet_group = (
+            type(self.armed_drones[0]).__name__
+            if fleet is not None or control_fleet is not None
+            else "all"
+        )
 
         # step the environment enough times for one control loop of the slowest controller
         for _ in range(self.updates_per_step):
+            # only the drones due for a control or camera update on this physics step get one
+            substep = self.physics_steps % len(self._control_schedule)
+            control_drones = self._control_schedule[substep]
+            camera_drones = self._camera_schedule[substep]
+
             # update control and physics
-            [drone.update_control(self.physics_steps) for drone in self.armed_drones]
-            [drone.update_physics() for drone in self.armed_drones]
+            if control_fleet is not None:
+                with profiler.phase("control", fleet_group):
+                    control_fleet.update_control(control_drones, self.physics_steps)
+            else:
+                profiler.run_each(
+                    "control", control_drones, "update_control", self.physics_steps
+                )
+            [drone.check_command() for drone in control_drones]
+            if fleet is not None:
+                with profiler.phase("physics", fleet_group):
+                    fleet.update_physics()
+            else:
+                profiler.run_each("physics", self.armed_drones, "update_physics")
 
             # advance pybullet
-            self.stepSimulation()
+            with profiler.phase("step_simulation"):
+                self.stepSimulation()
 
-            # update states and camera
-            [drone.update_state() for drone in self.armed_drones]
-            [drone.update_last(self.physics_steps) for drone in self.armed_drones]
+            # splice out collisions, this is the only contact query per physics step
+            with profiler.phase("contacts"):
+                self._step_contacts.clear()
+                for collision in self.getContactPoints():
+                    self.contact_array.add(collision[1], collision[2])
+                    self._step_contacts.add(collision[1], collision[2])
 
-            # splice out collisions
-            for collision in self.getContactPoints():
-                self.contact_array[collision[1], collision[2]] = True
-                self.contact_array[collision[2], collision[1]] = True
+            # update states and camera
+            with profiler.phase("state_readout"):
+                self._update_fleet_states()
+            profiler.run_each("state", self.armed_drones, "update_state")
+            profiler.run_each(
+                "camera", camera_drones, "update_last", self.physics_steps
+            )
 
             # increment the number of physics steps
             self.physics_steps += 1
             self.elapsed_time = self.physics_steps / self.physics_hz
 
-        self.aviary_steps += 1
+    def step_many(
+        self,
+        num_steps: int,
+        record: bool = True,
+        until: None | Callable[[Aviary], bool] = None,
+    ) -> dict[str, np.ndarray]:
+        """Steps the environment `num_steps` times, optionally recording the trajectory of all drones.
+
+        The trajectory is written into preallocated buffers that are reused across calls, so nothing is allocated per step.
+        The returned arrays are views into these buffers and are overwritten by the next call to `step_many`, copy them if they need to be kept around.
+        Auxiliary states and setpoints of different sizes are padded with `np.nan` to the largest size in the fleet.
+
+        The returned dictionary contains:
+            - `states`: a `(steps, num_drones, 4, 3)` array of states
+            - `aux_states`: a `(steps, num_drones, max_aux_state_size)` array of auxiliary states
+            - `setpoints`: a `(steps, num_drones, max_setpoint_size)` array of setpoints
+            - `contacts`: a `(steps, num_drones)` boolean array of whether each drone was in contact with anything during each step
+
+        Args:
+            num_steps (int): the maximum number of times to call `step`.
+            record (bool): whether to record the trajectory, returns an empty dictionary if False.
+            until (None | Callable[[Aviary], bool]): an optional predicate called with the aviary after each step, stepping stops early once it returns True.
+
+        Returns:
+            dict[str, np.ndarray]: the recorded trajectory, of length equal to the number of steps taken.
+
+        """
+        if record:
+            self._allocate_trajectory(num_steps)
+
+        steps = 0
+        while steps < num_steps:
+            self.step()
+            if record:
+                self._record_trajectory(steps)
+            steps += 1
+
+            if until is not None and until(self):
+                break
+
+        if not record:
+            return dict()
+        return {key: buffer[:steps] for key, buffer in self._trajectory.items()}
+
+    def _allocate_trajectory(self, num_steps: int) -> None:
+        """Allocates the trajectory buffers for `step_many`, reusing the existing ones if they are large enough.
+
+        Args:
+            num_steps (int): the number of steps the buffers must be able to hold.
+
+        """
+        num_drones = len(self.drones)
+        shapes = dict(
+            states=(num_drones, 4, 3),
+            aux_states=(
+                num_drones,
+                max((drone.aux_state.size for drone in self.drones), default=0),
+            ),
+            setpoints=(
+                num_drones,
+                max((drone.setpoint.size for drone in self.drones), default=0),
+            ),
+            contacts=(num_drones,),
+        )
+
+        trajectory = getattr(self, "_trajectory", dict())
+        if trajectory and all(
+            trajectory[key].shape[1:] == shape for key, shape in shapes.items()
+        ):
+            if len(trajectory["states"]) >= num_steps:
+                return
+
+        self._trajectory: dict[str, np.ndarray] = {
+            key: (
+                np.zeros((num_steps, *shape), dtype=bool)
+                if key == "contacts"
+                else np.full((num_steps, *shape), np.nan, dtype=np.float64)
+            )
+            for key, shape in shapes.items()
+        }
+
+    def _record_trajectory(self, step: int) -> None:
+        """Writes the current states, auxiliary states, setpoints and contacts of all drones into the trajectory buffers.
+
+        Args:
+            step (int): the row of the trajectory buffers to write into.
+
+        """
+        self._trajectory["states"][step] = self._fleet_state
+        aux_states = self._trajectory["aux_states"][step]
+        setpoints = self._trajectory["setpoints"][step]
+        contacts = self._trajectory["contacts"][step]
+        for i, drone in enumerate(self.drones):
+            aux_size, setpoint_size = drone.aux_state.size, drone.setpoint.size
+            aux_states[i, :aux_size] = drone.aux_state.ravel()
+            aux_states[i, aux_size:] = np.nan
+            setpoints[i, :setpoint_size] = drone.setpoint.ravel()
+            setpoints[i, setpoint_size:] = np.nan
+            contacts[i] = self.contact_array.in_contact(drone.Id)
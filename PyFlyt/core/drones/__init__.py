@@ -1,5 +1,18 @@
 """Implementations of default drone models."""
 
-from .fixedwing import Fixedwing
-from .quadx import QuadX
-from .rocket import Rocket
+from typing import TYPE_CHECKING
+
+from PyFlyt.core.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .fixedwing import Fixedwing
+    from .quadx import QuadX
+    from .rocket import Rocket
+
+_MEMBERS = {
+    "Fixedwing": (".fixedwing", "Fixedwing"),
+    "QuadX": (".quadx", "QuadX"),
+    "Rocket": (".rocket", "Rocket"),
+}
+__all__ = list(_MEMBERS)
+__getattr__, __dir__ = lazy_imports(__name__, _MEMBERS)
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import numpy as np
-import yaml
 from pybullet_utils import bullet_client
 
 from PyFlyt.core.abstractions.base_drone import DroneClass
 from PyFlyt.core.abstractions.camera import Camera
 from PyFlyt.core.abstractions.lifting_surfaces import LiftingSurface, LiftingSurfaces
+from PyFlyt.core.abstractions.link_state_cache import LinkStateCache
 from PyFlyt.core.abstractions.motors import Motors
+from PyFlyt.core.utils.param_cache import derive_params
+from PyFlyt.core.utils.validation import check_bounds
 
 
 class Fixedwing(DroneClass):
@@ -33,6 +37,7 @@ class Fixedwing(DroneClass):
         camera_position_offset: np.ndarray = np.array([-3.0, 0.0, 1.0]),
         camera_fps: None | int = None,
         starting_velocity: np.ndarray = np.array([20.0, 0.0, 0.0]),
+        use_aero_tables: bool = False,
     ):
         """Creates a Fixedwing UAV and handles all relevant control and physics.
 
@@ -53,6 +58,7 @@ class Fixedwing(DroneClass):
             camera_position_offset (np.ndarray): offset position of the camera
             camera_fps (None | int): camera_fps
             starting_velocity (np.ndarray): vector representing the velocity at spawn
+            use_aero_tables (bool): whether to interpolate aerodynamic coefficients from precomputed tables instead of computing them analytically
 
         """
         super().__init__(
@@ -69,103 +75,99 @@ class Fixedwing(DroneClass):
         # constants
         self.starting_velocity = starting_velocity
 
-        """Reads fixedwing.yaml file and load UAV parameters"""
-        with open(self.param_path, "rb") as f:
-            # load all params from yaml
-            all_params = yaml.safe_load(f)
-
-            # all lifting surfaces
-            surfaces = list()
-            surfaces.append(
-                LiftingSurface(
-                    p=self.p,
-                    physics_period=self.physics_period,
-                    np_random=self.np_random,
-                    uav_id=self.Id,
-                    surface_id=3,
-                    lifting_unit=np.array([0.0, 0.0, 1.0]),
-                    forward_unit=np.array([1.0, 0.0, 0.0]),
-                    **all_params["left_wing_flapped_params"],
-                )
-            )
-            surfaces.append(
-                LiftingSurface(
-                    p=self.p,
-                    physics_period=self.physics_period,
-                    np_random=self.np_random,
-                    uav_id=self.Id,
-                    surface_id=4,
-                    lifting_unit=np.array([0.0, 0.0, 1.0]),
-                    forward_unit=np.array([1.0, 0.0, 0.0]),
-                    **all_params["right_wing_flapped_params"],
-                )
-            )
-            surfaces.append(
-                LiftingSurface(
-                    p=self.p,
-                    physics_period=self.physics_period,
-                    np_random=self.np_random,
-                    uav_id=self.Id,
-                    surface_id=1,
-                    lifting_unit=np.array([0.0, 0.0, 1.0]),
-                    forward_unit=np.array([1.0, 0.0, 0.0]),
-                    **all_params["horizontal_tail_params"],
-                )
+        # all params for the drone, parsed once per process and shared between drones
+        params = derive_params(self.param_path, self._derive_params)
+
+        # all lifting surfaces
+        surfaces = list()
+        surfaces.append(
+            LiftingSurface(
+                p=self.p,
+                physics_period=self.physics_period,
+                np_random=self.np_random,
+                uav_id=self.Id,
+                surface_id=3,
+                lifting_unit=np.array([0.0, 0.0, 1.0]),
+                forward_unit=np.array([1.0, 0.0, 0.0]),
+                **params["left_wing_flapped_params"],
             )
-            surfaces.append(
-                LiftingSurface(
-                    p=self.p,
-                    physics_period=self.physics_period,
-                    np_random=self.np_random,
-                    uav_id=self.Id,
-                    surface_id=2,
-                    lifting_unit=np.array([0.0, 1.0, 0.0]),
-                    forward_unit=np.array([1.0, 0.0, 0.0]),
-                    **all_params["vertical_tail_params"],
-                )
+        )
+        surfaces.append(
+            LiftingSurface(
+                p=self.p,
+                physics_period=self.physics_period,
+                np_random=self.np_random,
+                uav_id=self.Id,
+                surface_id=4,
+                lifting_unit=np.array([0.0, 0.0, 1.0]),
+                forward_unit=np.array([1.0, 0.0, 0.0]),
+                **params["right_wing_flapped_params"],
             )
-            surfaces.append(
-                LiftingSurface(
-                    p=self.p,
-                    physics_period=self.physics_period,
-                    np_random=self.np_random,
-                    uav_id=self.Id,
-                    surface_id=5,
-                    lifting_unit=np.array([0.0, 0.0, 1.0]),
-                    forward_unit=np.array([1.0, 0.0, 0.0]),
-                    **all_params["main_wing_params"],
-                )
+        )
+        surfaces.append(
+            LiftingSurface(
+                p=self.p,
+                physics_period=self.physics_period,
+                np_random=self.np_random,
+                uav_id=self.Id,
+                surface_id=1,
+                lifting_unit=np.array([0.0, 0.0, 1.0]),
+                forward_unit=np.array([1.0, 0.0, 0.0]),
+                **params["horizontal_tail_params"],
             )
-            self.lifting_surfaces = LiftingSurfaces(lifting_surfaces=surfaces)
-
-            # mapping for RPYT -> LeftAil, RightAil, HorStab, VertStab, MainWing, Motor
-            # signs for each control surface when under assist
-            self.surface_assist_ids = np.array([0, 0, 1, 1, 2, 3])
-            self.surface_assist_signs = np.array([1.0, -1.0, 1.0, -1.0, 0.0, 1.0])
-
-            # motor
-            motor_params = all_params["motor_params"]
-            tau = np.array([motor_params["tau"]])
-            max_rpm = np.array([1.0]) * np.sqrt(
-                (motor_params["total_thrust"]) / motor_params["thrust_coef"]
+        )
+        surfaces.append(
+            LiftingSurface(
+                p=self.p,
+                physics_period=self.physics_period,
+                np_random=self.np_random,
+                uav_id=self.Id,
+                surface_id=2,
+                lifting_unit=np.array([0.0, 1.0, 0.0]),
+                forward_unit=np.array([1.0, 0.0, 0.0]),
+                **params["vertical_tail_params"],
             )
-            thrust_coef = np.array([motor_params["thrust_coef"]])
-            torque_coef = np.array([motor_params["torque_coef"]])
-            thrust_unit = np.array([[1.0, 0.0, 0.0]])
-            noise_ratio = np.array([motor_params["noise_ratio"]])
-            self.motors = Motors(
+        )
+        surfaces.append(
+            LiftingSurface(
                 p=self.p,
                 physics_period=self.physics_period,
                 np_random=self.np_random,
                 uav_id=self.Id,
-                motor_ids=[0],
-                tau=tau,
-                max_rpm=max_rpm,
-                thrust_coef=thrust_coef,
-                torque_coef=torque_coef,
-                thrust_unit=thrust_unit,
-                noise_ratio=noise_ratio,
+                surface_id=5,
+                lifting_unit=np.array([0.0, 0.0, 1.0]),
+                forward_unit=np.array([1.0, 0.0, 0.0]),
+                **params["main_wing_params"],
             )
+        )
+        self.lifting_surfaces = LiftingSurfaces(lifting_surfaces=surfaces)
+        if use_aero_tables:
+            self.lifting_surfaces.use_aero_tables()
+
+        # mapping for RPYT -> LeftAil, RightAil, HorStab, VertStab, MainWing, Motor
+        # signs for each control surface when under assist
+        self.surface_assist_ids = np.array([0, 0, 1, 1, 2, 3])
+        self.surface_assist_signs = np.array([1.0, -1.0, 1.0, -1.0, 0.0, 1.0])
+
+        # motor
+        thrust_unit = np.array([[1.0, 0.0, 0.0]])
+        self.motors = Motors(
+            p=self.p,
+            physics_period=self.physics_period,
+            np_random=self.np_random,
+            uav_id=self.Id,
+            motor_ids=[0],
+            tau=params["tau"],
+            max_rpm=params["max_rpm"],
+            thrust_coef=params["thrust_coef"],
+            torque_coef=params["torque_coef"],
+            thrust_unit=thrust_unit,
+            noise_ratio=params["noise_ratio"],
+        )
+
+        # bounds on the controller output, all surfaces and the motor take [-1, 1]
+        self.cmd_low = np.full((6,), -1.0)
+        self.cmd_high = np.full((6,), 1.0)
 
         """ CAMERA """
         self.use_camera = use_camera
@@ -182,6 +184,12 @@ class Fixedwing(DroneClass):
                 is_tracking_camera=True,
             )
 
+        # all link states needed by the components are fetched together once per physics step
+        self.link_states = LinkStateCache(self.p, self.Id)
+        self.lifting_surfaces.use_link_state_cache(self.link_states)
+        if self.use_camera:
+            self.camera.use_link_state_cache(self.link_states)
+
         # compute camera fps parameters
         if camera_fps:
             assert (
@@ -191,6 +199,37 @@ class Fixedwing(DroneClass):
         else:
             self.physics_camera_ratio = 1
 
+    @staticmethod
+    def _derive_params(all_params: dict[str, Any]) -> dict[str, Any]:
+        """Computes the constants of a Fixedwing from its parameter file, see `derive_params`.
+
+        Args:
+            all_params (dict[str, Any]): the parsed parameter file.
+
+        Returns:
+            dict[str, Any]: motor constants, and the parameters of every lifting surface.
+
+        """
+        motor_params = all_params["motor_params"]
+        params: dict[str, Any] = dict(
+            tau=np.array([motor_params["tau"]]),
+            max_rpm=np.array([1.0])
+            * np.sqrt((motor_params["total_thrust"]) / motor_params["thrust_coef"]),
+            thrust_coef=np.array([motor_params["thrust_coef"]]),
+            torque_coef=np.array([motor_params["torque_coef"]]),
+            noise_ratio=np.array([motor_params["noise_ratio"]]),
+        )
+        for name in (
+            "left_wing_flapped_params",
+            "right_wing_flapped_params",
+            "horizontal_tail_params",
+            "vertical_tail_params",
+            "main_wing_params",
+        ):
+            params[name] = dict(all_params[name])
+
+        return params
+
     def reset(self) -> None:
         """Resets the vehicle to the initial state."""
         self.set_mode(0)
@@ -221,6 +260,10 @@ class Fixedwing(DroneClass):
 
         self.mode = mode
 
+        # for custom modes
+        if mode in self.registered_controllers.keys():
+            self.instanced_controllers[mode] = self.registered_controllers[mode]()
+
         if mode == -1:
             self.setpoint = np.zeros(6)
         elif mode == 0:
@@ -239,7 +282,7 @@ class Fixedwing(DroneClass):
 
         # full control over all surfaces
         if self.mode == -1:
-            self.cmd = self.setpoint
+            self.cmd = self.setpoint.copy()
             return
 
         # the default mode
@@ -255,8 +298,15 @@ class Fixedwing(DroneClass):
                 f"Don't have other modes aside from 0 and -1, received {self.mode}."
             )
 
-        # custom controllers run if any
-        self.cmd = self.instanced_controllers[self.mode].step(self.state, self.setpoint)
+        # custom controllers run if any, copied since a pass-through controller would alias the shared setpoint buffer
+        self.cmd = np.array(
+            self.instanced_controllers[self.mode].step(self.state, self.setpoint),
+            dtype=np.float64,
+        )
+
+    def check_command(self) -> None:
+        """Checks that the surface and motor commands are within [-1, 1]."""
+        check_bounds("cmd", self.cmd, self.cmd_low, self.cmd_high)
 
     def update_physics(self) -> None:
         """Updates the physics of the vehicle."""
@@ -266,24 +316,17 @@ class Fixedwing(DroneClass):
     def update_state(self) -> None:
         """Updates the current state of the UAV.
 
-        This includes: ang_vel, ang_pos, lin_vel, lin_pos.
+        The base state (ang_vel, ang_pos, lin_vel, lin_pos) and rotation are filled in beforehand by the `Aviary` for the whole fleet.
+        Outside of an `Aviary`, the drone reads its own base state instead.
         """
-        lin_pos, ang_pos = self.p.getBasePositionAndOrientation(self.Id)
-        lin_vel, ang_vel = self.p.getBaseVelocity(self.Id)
-
-        # express vels in local frame
-        rotation = np.array(self.p.getMatrixFromQuaternion(ang_pos)).reshape(3, 3).T
-        lin_vel = np.matmul(rotation, lin_vel)
-        ang_vel = np.matmul(rotation, ang_vel)
-
-        # ang_pos in euler form
-        ang_pos = self.p.getEulerFromQuaternion(ang_pos)
+        if not self._state_bound:
+            self.update_base_state()
 
-        # create the state
-        self.state = np.stack([ang_vel, ang_pos, lin_vel, lin_pos], axis=0)
+        # fetch all link states at once
+        self.link_states.update()
 
         # update all lifting surface velocities
-        self.lifting_surfaces.state_update(rotation)
+        self.lifting_surfaces.state_update(self.rotation)
 
         # update auxiliary information
         self.aux_state = np.concatenate(
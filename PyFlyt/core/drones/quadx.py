@@ -2,22 +2,40 @@
 
 from __future__ import annotations
 
-import math
+from typing import Any
 
 import numpy as np
-import yaml
 from pybullet_utils import bullet_client
 
 from PyFlyt.core.abstractions.base_controller import ControlClass
 from PyFlyt.core.abstractions.base_drone import DroneClass
 from PyFlyt.core.abstractions.boring_bodies import BoringBodies
 from PyFlyt.core.abstractions.camera import Camera
+from PyFlyt.core.abstractions.link_state_cache import LinkStateCache
 from PyFlyt.core.abstractions.motors import Motors
-from PyFlyt.core.abstractions.pid import PID
+from PyFlyt.core.drones.quadx_fleet import (
+    ANG_POS,
+    ANG_VEL,
+    LIN_POS,
+    LIN_VEL,
+    NUM_CONTROL_TERMS,
+    Z_POS,
+    Z_VEL,
+    QuadXFleet,
+    _jitted_quadx_control,
+)
+from PyFlyt.core.utils.param_cache import derive_params
+from PyFlyt.core.utils.validation import check_bounds
 
 
 class QuadX(DroneClass):
-    """QuadX instance that handles everything about a quadrotor in the X configuration."""
+    """QuadX instance that handles everything about a quadrotor in the X configuration.
+
+    Within an `Aviary`, the base state is read for the whole fleet at once into shared buffers, contacts come from the `Aviary`'s contact records, and fleets of QuadX drones have their physics and control batched through `QuadXFleet`.
+    The drone still works with a plain `BulletClient`, where it reads its own base state in `update_state` and queries PyBullet for contacts directly.
+    """
+
+    fleet_class = QuadXFleet
 
     def __init__(
         self,
@@ -36,6 +54,7 @@ class QuadX(DroneClass):
         camera_position_offset: np.ndarray = np.array([0.0, 0.0, 0.0]),
         camera_resolution: tuple[int, int] = (128, 128),
         camera_fps: None | int = None,
+        lumped_motors: bool = False,
     ):
         """Creates a drone in the QuadX configuration and handles all relevant control and physics.
 
@@ -55,6 +74,7 @@ class QuadX(DroneClass):
             camera_position_offset (np.ndarray): offset position of the camera
             camera_resolution (tuple[int, int]): camera_resolution
             camera_fps (None | int): camera_fps
+            lumped_motors (bool): whether to apply all motor forces as one wrench on the base, see `Motors`
 
         """
         super().__init__(
@@ -80,121 +100,97 @@ class QuadX(DroneClass):
             control commands are in the form of roll-pitch-yaw-thrust
         """
 
-        # All the params for the drone
-        with open(self.param_path, "rb") as f:
-            # load all params from yaml
-            all_params = yaml.safe_load(f)
-            motor_params = all_params["motor_params"]
-            drag_params = all_params["drag_params"]
-            ctrl_params = all_params["control_params"]
-
-            # motor thrust and torque constants
-            motor_ids = [0, 1, 2, 3]
-            thrust_coef = np.array([motor_params["thrust_coef"]] * 4)
-            torque_coef = np.array(
-                [
-                    -motor_params["torque_coef"],
-                    -motor_params["torque_coef"],
-                    +motor_params["torque_coef"],
-                    +motor_params["torque_coef"],
-                ]
-            )
-            thrust_unit = np.array(
-                [
-                    [0.0, 0.0, 1.0],
-                    [0.0, 0.0, 1.0],
-                    [0.0, 0.0, 1.0],
-                    [0.0, 0.0, 1.0],
-                ]
-            )
-            noise_ratio = np.array([1.0] * 4) * motor_params["noise_ratio"]
-            max_rpm = np.array([1.0] * 4) * np.sqrt(
-                (motor_params["total_thrust"]) / (4 * motor_params["thrust_coef"])
-            )
-            tau = np.array([1.0] * 4) * motor_params["tau"]
-            self.motors = Motors(
-                p=self.p,
-                physics_period=self.physics_period,
-                np_random=self.np_random,
-                uav_id=self.Id,
-                motor_ids=motor_ids,
-                tau=tau,
-                max_rpm=max_rpm,
-                thrust_coef=thrust_coef,
-                torque_coef=torque_coef,
-                thrust_unit=thrust_unit,
-                noise_ratio=noise_ratio,
-            )
-
-            # motor mapping from command to individual motors
-            self.motor_map = np.array(
-                [
-                    [-1.0, -1.0, -1.0, +1.0],
-                    [+1.0, +1.0, -1.0, +1.0],
-                    [+1.0, -1.0, +1.0, +1.0],
-                    [-1.0, +1.0, +1.0, +1.0],
-                ]
-            )
-
-            # pseudo drag coef
-            self.drag_coef_pqr = drag_params["drag_coef_pqr"]
+        # All the params for the drone, parsed once per process and shared between drones
+        params = derive_params(self.param_path, self._derive_params)
+
+        # motor thrust and torque constants
+        motor_ids = [0, 1, 2, 3]
+        thrust_unit = np.array(
+            [
+                [0.0, 0.0, 1.0],
+                [0.0, 0.0, 1.0],
+                [0.0, 0.0, 1.0],
+                [0.0, 0.0, 1.0],
+            ]
+        )
+        self.motors = Motors(
+            p=self.p,
+            physics_period=self.physics_period,
+            np_random=self.np_random,
+            uav_id=self.Id,
+            motor_ids=motor_ids,
+            tau=params["tau"],
+            max_rpm=params["max_rpm"],
+            thrust_coef=params["thrust_coef"],
+            torque_coef=params["torque_coef"],
+            thrust_unit=thrust_unit,
+            noise_ratio=params["noise_ratio"],
+            lumped=lumped_motors,
+        )
+        self.pwm_low = np.full((4,), -1.0)
+        self.pwm_high = np.full((4,), 1.0)
+        self._pwm = np.zeros((4,))
+
+        # motor mapping from command to individual motors
+        self.motor_map = np.array(
+            [
+                [-1.0, -1.0, -1.0, +1.0],
+                [+1.0, +1.0, -1.0, +1.0],
+                [+1.0, -1.0, +1.0, +1.0],
+                [-1.0, +1.0, +1.0, +1.0],
+            ]
+        )
 
-            # simulate the drag on the main body
-            self.body = BoringBodies(
-                p=self.p,
-                physics_period=self.physics_period,
-                np_random=self.np_random,
-                uav_id=self.Id,
-                body_ids=np.array([4]),
-                drag_coefs=np.array([[drag_params["drag_coef_xyz"]] * 3]),
-                normal_areas=np.array([[drag_params["drag_area_xyz"]] * 3]),
-            )
+        # pseudo drag coef
+        self.drag_coef_pqr = params["drag_coef_pqr"]
+
+        # simulate the drag on the main body
+        self.body = BoringBodies(
+            p=self.p,
+            physics_period=self.physics_period,
+            np_random=self.np_random,
+            uav_id=self.Id,
+            body_ids=np.array([4]),
+            drag_coefs=params["drag_coefs"],
+            normal_areas=params["normal_areas"],
+        )
 
-            # input: angular velocity command
-            # outputs: normalized body torque command
-            self.Kp_ang_vel = np.array(ctrl_params["ang_vel"]["kp"])
-            self.Ki_ang_vel = np.array(ctrl_params["ang_vel"]["ki"])
-            self.Kd_ang_vel = np.array(ctrl_params["ang_vel"]["kd"])
-            self.lim_ang_vel = np.array(ctrl_params["ang_vel"]["lim"])
-
-            # input: angular position command
-            # outputs: angular velocity command
-            self.Kp_ang_pos = np.array(ctrl_params["ang_pos"]["kp"])
-            self.Ki_ang_pos = np.array(ctrl_params["ang_pos"]["ki"])
-            self.Kd_ang_pos = np.array(ctrl_params["ang_pos"]["kd"])
-            self.lim_ang_pos = np.array(ctrl_params["ang_pos"]["lim"])
-
-            # input: linear velocity command
-            # outputs: angular position command
-            self.Kp_lin_vel = np.array(ctrl_params["lin_vel"]["kp"])
-            self.Ki_lin_vel = np.array(ctrl_params["lin_vel"]["ki"])
-            self.Kd_lin_vel = np.array(ctrl_params["lin_vel"]["kd"])
-            self.lim_lin_vel = np.array(ctrl_params["lin_vel"]["lim"])
-
-            # input: linear position command
-            # outputs: linear velocity
-            self.Kp_lin_pos = np.array(ctrl_params["lin_pos"]["kp"])
-            self.Ki_lin_pos = np.array(ctrl_params["lin_pos"]["ki"])
-            self.Kd_lin_pos = np.array(ctrl_params["lin_pos"]["kd"])
-            self.lim_lin_pos = np.array(ctrl_params["lin_pos"]["lim"])
-
-            # height controllers
-            z_pos_PID = PID(
-                np.array([ctrl_params["z_pos"]["kp"]]),
-                np.array([ctrl_params["z_pos"]["ki"]]),
-                np.array([ctrl_params["z_pos"]["kd"]]),
-                np.array([ctrl_params["z_pos"]["lim"]]),
-                self.control_period,
-            )
-            z_vel_PID = PID(
-                np.array([ctrl_params["z_vel"]["kp"]]),
-                np.array([ctrl_params["z_vel"]["ki"]]),
-                np.array([ctrl_params["z_vel"]["kd"]]),
-                np.array([ctrl_params["z_vel"]["lim"]]),
-                self.control_period,
-            )
-            self.z_PIDs = [z_vel_PID, z_pos_PID]
-            self.PIDs = []
+        # input: angular velocity command
+        # outputs: normalized body torque command
+        self.Kp_ang_vel, self.Ki_ang_vel, self.Kd_ang_vel, self.lim_ang_vel = params[
+            "ang_vel"
+        ]
+
+        # input: angular position command
+        # outputs: angular velocity command
+        self.Kp_ang_pos, self.Ki_ang_pos, self.Kd_ang_pos, self.lim_ang_pos = params[
+            "ang_pos"
+        ]
+
+        # input: linear velocity command
+        # outputs: angular position command
+        self.Kp_lin_vel, self.Ki_lin_vel, self.Kd_lin_vel, self.lim_lin_vel = params[
+            "lin_vel"
+        ]
+
+        # input: linear position command
+        # outputs: linear velocity
+        self.Kp_lin_pos, self.Ki_lin_pos, self.Kd_lin_pos, self.lim_lin_pos = params[
+            "lin_pos"
+        ]
+
+        # input: height position target
+        # outputs: z velocity command
+        self.Kp_z_pos, self.Ki_z_pos, self.Kd_z_pos, self.lim_z_pos = params["z_pos"]
+
+        # input: z velocity command
+        # outputs: normalized thrust command
+        self.Kp_z_vel, self.Ki_z_vel, self.Kd_z_vel, self.lim_z_vel = params["z_vel"]
+
+        # the whole cascade runs in one jitted kernel on flat arrays,
+        # gains are (kp, ki, kd, limits) and memory is (integral, previous error) for every controller term
+        self.control_gains = np.zeros((4, NUM_CONTROL_TERMS))
+        self.control_memory = np.zeros((2, NUM_CONTROL_TERMS))
 
         """ CAMERA """
         self.use_camera = use_camera
@@ -210,6 +206,12 @@ class QuadX(DroneClass):
                 camera_position_offset=camera_position_offset,
             )
 
+        # all link states needed by the components are fetched together once per physics step
+        self.link_states = LinkStateCache(self.p, self.Id)
+        self.body.use_link_state_cache(self.link_states)
+        if self.use_camera:
+            self.camera.use_link_state_cache(self.link_states)
+
         # compute camera fps parameters
         if camera_fps:
             assert (
@@ -219,16 +221,94 @@ class QuadX(DroneClass):
         else:
             self.physics_camera_ratio = 1
 
+    @staticmethod
+    def _derive_params(all_params: dict[str, Any]) -> dict[str, Any]:
+        """Computes the constants of a QuadX from its parameter file, see `derive_params`.
+
+        Args:
+            all_params (dict[str, Any]): the parsed parameter file.
+
+        Returns:
+            dict[str, Any]: motor and drag constants, and `(kp, ki, kd, limits)` for every controller.
+
+        """
+        motor_params = all_params["motor_params"]
+        drag_params = all_params["drag_params"]
+        ctrl_params = all_params["control_params"]
+
+        params: dict[str, Any] = dict(
+            thrust_coef=np.array([motor_params["thrust_coef"]] * 4),
+            torque_coef=np.array(
+                [
+                    -motor_params["torque_coef"],
+                    -motor_params["torque_coef"],
+                    +motor_params["torque_coef"],
+                    +motor_params["torque_coef"],
+                ]
+            ),
+            noise_ratio=np.array([1.0] * 4) * motor_params["noise_ratio"],
+            max_rpm=np.array([1.0] * 4)
+            * np.sqrt(
+                (motor_params["total_thrust"]) / (4 * motor_params["thrust_coef"])
+            ),
+            tau=np.array([1.0] * 4) * motor_params["tau"],
+            drag_coef_pqr=drag_params["drag_coef_pqr"],
+            drag_coefs=np.array([[drag_params["drag_coef_xyz"]] * 3]),
+            normal_areas=np.array([[drag_params["drag_area_xyz"]] * 3]),
+        )
+
+        # the height controllers have scalar gains in the file
+        for name in ("ang_vel", "ang_pos", "lin_vel", "lin_pos", "z_pos", "z_vel"):
+            params[name] = tuple(
+                np.array(ctrl_params[name][gain], dtype=np.float64).reshape(-1)
+                for gain in ("kp", "ki", "kd", "lim")
+            )
+
+        return params
+
+    @property
+    def pwm(self) -> np.ndarray:
+        """The motor commands of the drone, this is a view into the `QuadXFleet`'s motor command array when batched.
+
+        Returns:
+            np.ndarray:
+
+        """
+        return self._pwm
+
+    @pwm.setter
+    def pwm(self, pwm: np.ndarray) -> None:
+        """Writes the motor commands in place, so a fleet's view of them stays valid.
+
+        Args:
+            pwm (np.ndarray): (4,) motor commands
+
+        """
+        self._pwm[...] = pwm
+
+    def bind_pwm_buffer(self, pwm: np.ndarray) -> None:
+        """Binds the drone's motor commands to a view of a fleet's motor command array.
+
+        The current motor commands are copied into the new buffer.
+
+        Args:
+            pwm (np.ndarray): a (4,) view
+
+        """
+        pwm[...] = self._pwm
+        self._pwm = pwm
+
     def reset(self) -> None:
         """Resets the vehicle to the initial state."""
         self.set_mode(0)
         self.setpoint = np.zeros(4)
-        self.pwm = np.zeros(4)
+        self.pwm = 0.0
 
         self.p.resetBasePositionAndOrientation(self.Id, self.start_pos, self.start_orn)
         self.disable_artificial_damping()
         self.body.reset()
         self.motors.reset()
+        self.control_memory[...] = 0.0
 
     def set_mode(self, mode: int) -> None:
         """Sets the current flight mode of the vehicle.
@@ -289,88 +369,22 @@ class QuadX(DroneClass):
             self.setpoint = np.array([0.0, 0.0, 0.0, 0.0])
             self.setpoint[-1] = self.state[-1, -1]
 
-        # instantiate PIDs
-        if mode in [0, 2]:
-            ang_vel_PID = PID(
-                self.Kp_ang_vel,
-                self.Ki_ang_vel,
-                self.Kd_ang_vel,
-                self.lim_ang_vel,
-                self.control_period,
-            )
-            self.PIDs = [ang_vel_PID]
-        elif mode in [1, 3]:
-            ang_vel_PID = PID(
-                self.Kp_ang_vel,
-                self.Ki_ang_vel,
-                self.Kd_ang_vel,
-                self.lim_ang_vel,
-                self.control_period,
-            )
-            ang_pos_PID = PID(
-                self.Kp_ang_pos,
-                self.Ki_ang_pos,
-                self.Kd_ang_pos,
-                self.lim_ang_pos,
-                self.control_period,
-            )
-            self.PIDs = [ang_vel_PID, ang_pos_PID]
-        elif mode in [4, 5, 6]:
-            ang_vel_PID = PID(
-                self.Kp_ang_vel,
-                self.Ki_ang_vel,
-                self.Kd_ang_vel,
-                self.lim_ang_vel,
-                self.control_period,
-            )
-            ang_pos_PID = PID(
-                self.Kp_ang_pos[:2],
-                self.Ki_ang_pos[:2],
-                self.Kd_ang_pos[:2],
-                self.lim_ang_pos[:2],
-                self.control_period,
-            )
-            lin_vel_PID = PID(
-                self.Kp_lin_vel,
-                self.Ki_lin_vel,
-                self.Kd_lin_vel,
-                self.lim_lin_vel,
-                self.control_period,
-            )
-            self.PIDs = [ang_vel_PID, ang_pos_PID, lin_vel_PID]
-        elif mode == 7:
-            ang_vel_PID = PID(
-                self.Kp_ang_vel,
-                self.Ki_ang_vel,
-                self.Kd_ang_vel,
-                self.lim_ang_vel,
-                self.control_period,
-            )
-            ang_pos_PID = PID(
-                self.Kp_ang_pos,
-                self.Ki_ang_pos,
-                self.Kd_ang_pos,
-                self.lim_ang_pos,
-                self.control_period,
-            )
-            lin_vel_PID = PID(
-                self.Kp_lin_vel,
-                self.Ki_lin_vel,
-                self.Kd_lin_vel,
-                self.lim_lin_vel,
-                self.control_period,
-            )
-            lin_pos_PID = PID(
-                self.Kp_lin_pos,
-                self.Ki_lin_pos,
-                self.Kd_lin_pos,
-                self.lim_lin_pos,
-                self.control_period,
-            )
-            self.PIDs = [ang_vel_PID, ang_pos_PID, lin_vel_PID, lin_pos_PID]
-
-        for controller in self.PIDs:
-            controller.reset()
+        # load the gains, these are copied in place so that a bound fleet stays in sync
+        for offset, name in (
+            (ANG_VEL, "ang_vel"),
+            (ANG_POS, "ang_pos"),
+            (LIN_VEL, "lin_vel"),
+            (LIN_POS, "lin_pos"),
+            (Z_VEL, "z_vel"),
+            (Z_POS, "z_pos"),
+        ):
+            for row, prefix in enumerate(("Kp", "Ki", "Kd", "lim")):
+                values = getattr(self, f"{prefix}_{name}")
+                end = offset + len(values)
+                self.control_gains[row, offset:end] = values
+
+        # the height controllers persist across mode changes, everything else starts afresh
+        self.control_memory[:, :Z_VEL] = 0.0
 
     def register_controller(
         self,
@@ -409,88 +423,44 @@ class QuadX(DroneClass):
         if physics_step % self.physics_control_ratio != 0:
             return
 
-        # this is the thing we cascade down controllers
-        a_output = self.setpoint[:3].copy()
-        z_output = self.setpoint[-1].copy()
-        mode = self.mode
+        (mode, command) = self.control_command()
+        self.pwm = _jitted_quadx_control(
+            mode,
+            command,
+            self.state,
+            self.control_gains,
+            self.control_memory,
+            self.control_period,
+            self.motor_map,
+        )
 
-        # custom controllers run first if any
-        if self.mode in self.registered_controllers.keys():
-            custom_output = self.instanced_controllers[self.mode].step(
-                self.state, self.setpoint
-            )
-            assert custom_output.shape == (
-                4,
-            ), f"custom controller outputting wrong shape, expected (4, ) but got {custom_output.shape}."
+    def control_command(self) -> tuple[int, np.ndarray]:
+        """Returns the base flight mode and the command that the cascaded flight controller should track.
 
-            # splice things out to be passed along
-            a_output = custom_output[:3].copy()
-            z_output = custom_output[-1].copy().flatten()
-            mode = self.registered_base_modes[self.mode]
+        This is the setpoint, unless a custom controller is in use, in which case it is run and its output is returned along with its base mode.
+        The command is always a copy, so it never aliases the `Aviary`'s shared setpoint buffer.
 
-        # controller -1 means just direct to motor pwm commands
-        if mode == -1:
-            self.pwm = np.array([*a_output, z_output])
-            return
-
-        # base level controllers
-        if mode in [0, 2]:
-            a_output = self.PIDs[0].step(self.state[0], a_output)
-        elif mode in [1, 3]:
-            a_output = self.PIDs[1].step(self.state[1], a_output)
-            a_output = self.PIDs[0].step(self.state[0], a_output)
-        elif mode in [4, 5]:
-            a_output[:2] = self.PIDs[2].step(self.state[2][:2], a_output[:2])
-            a_output[:2] = np.array([-a_output[1], a_output[0]])
-            a_output[:2] = self.PIDs[1].step(self.state[1][:2], a_output[:2])
-            a_output = self.PIDs[0].step(self.state[0], a_output)
-        elif mode == 6:
-            c = math.cos(self.state[1, -1])
-            s = math.sin(self.state[1, -1])
-            rot_mat = np.array([[c, -s], [s, c]]).T
-            a_output[:2] = np.matmul(rot_mat, a_output[:2])
-
-            a_output[:2] = self.PIDs[2].step(self.state[2][:2], a_output[:2])
-            a_output[:2] = np.array([-a_output[1], a_output[0]])
-            a_output[:2] = self.PIDs[1].step(self.state[1][:2], a_output[:2])
-            a_output = self.PIDs[0].step(self.state[0], a_output)
-        elif mode == 7:
-            a_output[:2] = self.PIDs[3].step(self.state[3][:2], a_output[:2])
+        Returns:
+            tuple[int, np.ndarray]: the base flight mode and a (4,) command
+        """
+        if self.mode not in self.registered_controllers.keys():
+            return self.mode, self.setpoint.copy()
 
-            c = math.cos(self.state[1, -1])
-            s = math.sin(self.state[1, -1])
-            rot_mat = np.array([[c, -s], [s, c]]).T
-            a_output[:2] = np.matmul(rot_mat, a_output[:2])
+        # custom controllers run first if any
+        custom_output = self.instanced_controllers[self.mode].step(
+            self.state, self.setpoint
+        )
+        assert custom_output.shape == (
+            4,
+        ), f"custom controller outputting wrong shape, expected (4, ) but got {custom_output.shape}."
 
-            a_output[:2] = self.PIDs[2].step(self.state[2][:2], a_output[:2])
-            a_output = np.array([-a_output[1], a_output[0], a_output[2]])
-            a_output = self.PIDs[1].step(self.state[1], a_output)
-            a_output = self.PIDs[0].step(self.state[0], a_output)
+        return self.registered_base_modes[self.mode], np.array(
+            custom_output, dtype=np.float64
+        )
 
-        # height controllers
-        if mode == 0:
-            z_output = np.clip(z_output, 0.0, 1.0).flatten()
-        elif mode in [1, 5, 6]:
-            z_output = self.z_PIDs[0].step(self.state[2][-1].flatten(), z_output)
-            z_output = np.clip(z_output, 0, 1)
-        elif mode in [2, 3, 4, 7]:
-            z_output = self.z_PIDs[1].step(self.state[3][-1].flatten(), z_output)
-            z_output = self.z_PIDs[0].step(self.state[2][-1].flatten(), z_output)
-            z_output = np.clip(z_output, 0, 1)
-
-        # mix the commands according to motor mix
-        cmd = np.array([*a_output, *z_output])
-        self.pwm = np.matmul(self.motor_map, cmd)
-
-        # deal with motor saturations
-        # we want to maintain the output low and output high if possible
-        high, low = np.max(self.pwm), np.min(self.pwm)
-        if high != low:
-            pwm_max, pwm_min = min(high, 1.0), max(low, 0.05)
-            add = (pwm_min - low) / (pwm_max - low) * (pwm_max - self.pwm)
-            sub = (high - pwm_max) / (high - pwm_min) * (self.pwm - pwm_min)
-            self.pwm += add - sub
-        self.pwm = np.clip(self.pwm, 0.05, 1.0)
+    def check_command(self) -> None:
+        """Checks that the motor commands are within [-1, 1]."""
+        check_bounds("pwm", self.pwm, self.pwm_low, self.pwm_high)
 
     def update_physics(self) -> None:
         """Updates the physics of the vehicle."""
@@ -506,30 +476,23 @@ class QuadX(DroneClass):
         )
 
         # warning, the physics is funky for bounces
-        if len(self.p.getContactPoints()) == 0:
+        if not self._in_contact():
             self.p.applyExternalTorque(self.Id, -1, drag_pqr, self.p.LINK_FRAME)
 
     def update_state(self) -> None:
         """Updates the current state of the UAV.
 
-        This includes: ang_vel, ang_pos, lin_vel, lin_pos.
+        The base state (ang_vel, ang_pos, lin_vel, lin_pos) and rotation are filled in beforehand by the `Aviary` for the whole fleet.
+        Outside of an `Aviary`, the drone reads its own base state instead.
         """
-        lin_pos, ang_pos = self.p.getBasePositionAndOrientation(self.Id)
-        lin_vel, ang_vel = self.p.getBaseVelocity(self.Id)
+        if not self._state_bound:
+            self.update_base_state()
 
-        # express vels in local frame
-        rotation = np.array(self.p.getMatrixFromQuaternion(ang_pos)).reshape(3, 3).T
-        lin_vel = np.matmul(rotation, lin_vel)
-        ang_vel = np.matmul(rotation, ang_vel)
-
-        # ang_pos in euler form
-        ang_pos = self.p.getEulerFromQuaternion(ang_pos)
+        # fetch all link states at once
+        self.link_states.update()
 
         # update the main body
-        self.body.state_update(rotation)
-
-        # create the state
-        self.state = np.stack([ang_vel, ang_pos, lin_vel, lin_pos], axis=0)
+        self.body.state_update(self.rotation)
 
         # update auxiliary information
         self.aux_state = self.motors.get_states()
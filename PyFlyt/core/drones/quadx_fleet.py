@@ -0,0 +1,471 @@
+"""Batched physics and control for fleets of QuadX drones, and the QuadX flight controller kernel."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from PyFlyt.core.abstractions.motors import Motors
+from PyFlyt.core.utils.compile_helpers import jitter
+
+if TYPE_CHECKING:
+    from PyFlyt.core.drones.quadx import QuadX
+
+# nopython kernels cannot look up attributes of Python classes, so the shared kernel is bound at module level
+_jitted_lump_wrench = Motors._jitted_lump_wrench
+
+# offsets of each controller in the flat (4, 12) gain and (2, 12) memory arrays of the flight controller
+# gains are stacked as kp, ki, kd, limits and memory as integral, previous error
+ANG_VEL = 0
+ANG_POS = 3
+LIN_VEL = 6
+LIN_POS = 8
+Z_VEL = 10
+Z_POS = 11
+NUM_CONTROL_TERMS = 12
+
+
+@jitter
+def _jitted_pid(
+    gains: np.ndarray,
+    memory: np.ndarray,
+    index: int,
+    state: float,
+    setpoint: float,
+    period: float,
+) -> float:
+    """Steps one term of the flat flight controller, this is the same as `PID.step` for a single element.
+
+    Args:
+        gains (np.ndarray): (4, 12) kp, ki, kd and limits of all terms
+        memory (np.ndarray): (2, 12) integral and previous error of all terms, updated in place
+        index (int): index of the term
+        state (float): state
+        setpoint (float): setpoint
+        period (float): control period
+
+    Returns:
+        float:
+
+    """
+    limit = gains[3, index]
+    error = setpoint - state
+
+    proportional = gains[0, index] * error
+
+    integral = memory[0, index] + gains[1, index] * error * period
+    integral = min(max(integral, -limit), limit)
+    memory[0, index] = integral
+
+    derivative = gains[2, index] * (error - memory[1, index]) / period
+    memory[1, index] = error
+
+    return min(max(proportional + integral + derivative, -limit), limit)
+
+
+@jitter
+def _jitted_quadx_control(
+    mode: int,
+    command: np.ndarray,
+    state: np.ndarray,
+    gains: np.ndarray,
+    memory: np.ndarray,
+    period: float,
+    motor_map: np.ndarray,
+) -> np.ndarray:
+    """Runs the cascaded flight controller of a QuadX for one of the base flight modes, -1 to 7.
+
+    Args:
+        mode (int): base flight mode
+        command (np.ndarray): (4,) setpoint, or the output of a custom controller
+        state (np.ndarray): (4, 3) state of the drone
+        gains (np.ndarray): (4, 12) kp, ki, kd and limits of all controller terms
+        memory (np.ndarray): (2, 12) integral and previous error of all controller terms, updated in place
+        period (float): control period
+        motor_map (np.ndarray): (4, 4) mixing matrix from roll, pitch, yaw and thrust to motor commands
+
+    Returns:
+        np.ndarray: (4,) motor commands
+
+    """
+    pwm = np.empty((4,))
+
+    # controller -1 means just direct to motor pwm commands
+    if mode == -1:
+        pwm[:] = command
+        return pwm
+
+    # this is the thing we cascade down controllers
+    a0, a1, a2, z = command[0], command[1], command[2], command[3]
+
+    # linear position and velocity controllers output angular position setpoints
+    if mode >= 4:
+        if mode == 7:
+            a0 = _jitted_pid(gains, memory, LIN_POS, state[3, 0], a0, period)
+            a1 = _jitted_pid(gains, memory, LIN_POS + 1, state[3, 1], a1, period)
+
+        # ground frame to body frame using yaw
+        if mode >= 6:
+            c = math.cos(state[1, 2])
+            s = math.sin(state[1, 2])
+            a0, a1 = c * a0 + s * a1, -s * a0 + c * a1
+
+        a0 = _jitted_pid(gains, memory, LIN_VEL, state[2, 0], a0, period)
+        a1 = _jitted_pid(gains, memory, LIN_VEL + 1, state[2, 1], a1, period)
+        a0, a1 = -a1, a0
+
+    # angular position controllers output angular velocity setpoints, yaw is rate controlled in modes 4 to 6
+    if mode in (1, 3, 4, 5, 6, 7):
+        a0 = _jitted_pid(gains, memory, ANG_POS, state[1, 0], a0, period)
+        a1 = _jitted_pid(gains, memory, ANG_POS + 1, state[1, 1], a1, period)
+        if mode in (1, 3, 7):
+            a2 = _jitted_pid(gains, memory, ANG_POS + 2, state[1, 2], a2, period)
+
+    # angular velocity controllers output normalized torques
+    a0 = _jitted_pid(gains, memory, ANG_VEL, state[0, 0], a0, period)
+    a1 = _jitted_pid(gains, memory, ANG_VEL + 1, state[0, 1], a1, period)
+    a2 = _jitted_pid(gains, memory, ANG_VEL + 2, state[0, 2], a2, period)
+
+    # height controllers
+    if mode in (2, 3, 4, 7):
+        z = _jitted_pid(gains, memory, Z_POS, state[3, 2], z, period)
+    if mode != 0:
+        z = _jitted_pid(gains, memory, Z_VEL, state[2, 2], z, period)
+    z = min(max(z, 0.0), 1.0)
+
+    # mix the commands according to motor mix
+    for i in range(4):
+        pwm[i] = (motor_map[i, 0] * a0 + motor_map[i, 2] * a2) + (
+            motor_map[i, 1] * a1 + motor_map[i, 3] * z
+        )
+
+    # deal with motor saturations
+    # we want to maintain the output low and output high if possible
+    high, low = pwm.max(), pwm.min()
+    if high != low:
+        pwm_max, pwm_min = min(high, 1.0), max(low, 0.05)
+        add_ratio = (pwm_min - low) / (pwm_max - low)
+        sub_ratio = (high - pwm_max) / (high - pwm_min)
+        for i in range(4):
+            add = add_ratio * (pwm_max - pwm[i])
+            sub = sub_ratio * (pwm[i] - pwm_min)
+            pwm[i] += add - sub
+    for i in range(4):
+        pwm[i] = min(max(pwm[i], 0.05), 1.0)
+
+    return pwm
+
+
+@jitter
+def _jitted_fleet_control(
+    rows: np.ndarray,
+    modes: np.ndarray,
+    commands: np.ndarray,
+    states: np.ndarray,
+    gains: np.ndarray,
+    memory: np.ndarray,
+    periods: np.ndarray,
+    motor_maps: np.ndarray,
+) -> np.ndarray:
+    """Runs the flight controllers of some drones of a fleet.
+
+    Args:
+        rows (np.ndarray): (n,) rows of the drones to update in the fleet arrays
+        modes (np.ndarray): (n,) base flight modes
+        commands (np.ndarray): (n, 4) setpoints or custom controller outputs
+        states (np.ndarray): (n, 4, 3) states of the drones
+        gains (np.ndarray): (num_drones, 4, 12) controller gains of the fleet
+        memory (np.ndarray): (num_drones, 2, 12) controller memory of the fleet, updated in place
+        periods (np.ndarray): (num_drones,) control periods of the fleet
+        motor_maps (np.ndarray): (num_drones, 4, 4) motor mixing matrices of the fleet
+
+    Returns:
+        np.ndarray: (n, 4) motor commands
+
+    """
+    pwm = np.empty((rows.shape[0], 4))
+    for i in range(rows.shape[0]):
+        row = rows[i]
+        pwm[i] = _jitted_quadx_control(
+            modes[i],
+            commands[i],
+            states[i],
+            gains[row],
+            memory[row],
+            periods[row],
+            motor_maps[row],
+        )
+    return pwm
+
+
+class QuadXFleet:
+    """Runs `update_physics` and `update_control` for many `QuadX` drones at once.
+
+    The motor dynamics, motor noise, thrusts and torques, lumped motor wrenches, body drag and rotational drag of every drone are computed in one jitted kernel.
+    Only the calls that apply the resulting forces in PyBullet remain in Python.
+    This is numerically equivalent to calling `update_physics` on each drone in turn, including the order of random draws.
+
+    Likewise, the flight controllers of all drones due for a control update run in one jitted kernel.
+    The motor commands, motor throttles, drag body velocities, controller gains and controller memory of each drone are bound to rows of the fleet's arrays, so they stay in sync with the drones.
+    Angular velocities are read straight from the `Aviary`'s fleet state buffer, so the drones must belong to an `Aviary`.
+
+    Args:
+        drones (list[QuadX]): the drones to batch, these must share the same physics client and noise pool.
+
+    """
+
+    def __init__(self, drones: list[QuadX]):
+        """__init__.
+
+        Args:
+            drones (list[QuadX]): the drones to batch, these must share the same physics client and noise pool.
+
+        """
+        self.drones = drones
+        self.p = drones[0].p
+        self.noise_pool = drones[0].motors.noise_pool
+        self.strict = drones[0].motors.strict
+        self.physics_period = drones[0].physics_period
+        self.num_drones = len(drones)
+
+        # motor constants, these never change after spawning
+        motors = [drone.motors for drone in drones]
+        self.num_motors = motors[0].num_motors
+        self.tau = np.stack([m.tau for m in motors])
+        self.max_rpm = np.stack([m.max_rpm for m in motors])
+        self.thrust_unit = np.stack([m.thrust_unit[..., 0] for m in motors])
+        self.thrust_coef = np.stack([m.thrust_coef[..., 0] for m in motors])
+        self.torque_coef = np.stack([m.torque_coef[..., 0] for m in motors])
+        self.noise_ratio = np.stack([m.noise_ratio for m in motors])
+        self.noisy = np.array([m.noisy for m in motors])
+        self.num_noisy = int(np.sum(self.noisy))
+
+        # motor poses, only used by drones with lumped motors
+        self.lumped = np.array([m.lumped for m in motors])
+        self.link_rotations = np.zeros((self.num_drones, self.num_motors, 3, 3))
+        self.lever_arms = np.zeros((self.num_drones, self.num_motors, 3))
+        for i, m in enumerate(motors):
+            if m.lumped:
+                self.link_rotations[i] = m.link_rotations
+                self.lever_arms[i] = m.lever_arms
+
+        # drag constants
+        self.drag_coef_pqr = np.stack(
+            [
+                np.broadcast_to(np.asarray(drone.drag_coef_pqr, dtype=np.float64), (3,))
+                for drone in drones
+            ]
+        )
+        self.drag_consts = np.stack([drone.body.drag_consts for drone in drones])
+
+        # rows of the drones in the aviary's fleet state buffer
+        state_rows = {id(drone): i for i, drone in enumerate(self.p.drones)}
+        self.state_rows = np.array(
+            [state_rows[id(drone)] for drone in drones], dtype=np.int64
+        )
+
+        # runtime states, each drone's motor commands, throttles and drag body velocities become views into these
+        self.pwm = np.stack([drone.pwm for drone in drones])
+        self.throttle = np.stack([m.throttle for m in motors])
+        self.body_velocities = np.stack(
+            [drone.body.local_body_velocities for drone in drones]
+        )
+        for i, drone in enumerate(drones):
+            drone.bind_pwm_buffer(self.pwm[i])
+            drone.motors.throttle = self.throttle[i]
+            drone.body.local_body_velocities = self.body_velocities[i]
+
+        # flight controllers, each drone's gains and memory become views into these
+        self.rows = {id(drone): i for i, drone in enumerate(drones)}
+        self.control_periods = np.array([drone.control_period for drone in drones])
+        self.motor_maps = np.stack([drone.motor_map for drone in drones])
+        self.control_gains = np.stack([drone.control_gains for drone in drones])
+        self.control_memory = np.stack([drone.control_memory for drone in drones])
+        for i, drone in enumerate(drones):
+            drone.control_gains = self.control_gains[i]
+            drone.control_memory = self.control_memory[i]
+
+    def update_control(self, drones: list[QuadX], physics_step: int) -> None:
+        """Runs the flight controllers of some drones in the fleet, these must be due for a control update.
+
+        Drones with their own `update_control`, such as ones wrapped after spawning, are updated individually.
+
+        Args:
+            drones (list[QuadX]): the drones to update, a subset of the fleet.
+            physics_step (int): the current physics step
+
+        """
+        batch = []
+        for drone in drones:
+            if "update_control" in vars(drone):
+                drone.update_control(physics_step)
+            else:
+                batch.append(drone)
+        if not batch:
+            return
+
+        # custom controllers still run in Python, their outputs feed the base flight mode
+        (modes, commands) = zip(*[drone.control_command() for drone in batch])
+
+        rows = np.array([self.rows[id(drone)] for drone in batch], dtype=np.int64)
+        self.pwm[rows] = _jitted_fleet_control(
+            rows,
+            np.array(modes, dtype=np.int64),
+            np.array(commands, dtype=np.float64),
+            self.p.all_states[self.state_rows[rows]],
+            self.control_gains,
+            self.control_memory,
+            self.control_periods,
+            self.motor_maps,
+        )
+
+    def update_physics(self) -> None:
+        """Updates the physics of all drones in the fleet."""
+        if self.strict:
+            assert np.all(self.pwm >= -1.0) and np.all(
+                self.pwm <= 1.0
+            ), f"`{self.pwm=} has values out of bounds of -1.0 and 1.0.`"
+
+        # one draw per noisy drone, the same as each `Motors` component would do
+        noise = np.zeros((self.num_drones,))
+        if self.num_noisy:
+            noise[self.noisy] = self.noise_pool.normal(
+                self.num_motors, size=self.num_noisy
+            )
+
+        (thrust, torque, wrench, body_forces, drag_pqr) = self._jitted_fleet_physics(
+            self.pwm,
+            self.throttle,
+            noise,
+            self.physics_period,
+            self.tau,
+            self.max_rpm,
+            self.thrust_unit,
+            self.thrust_coef,
+            self.torque_coef,
+            self.noise_ratio,
+            self.lumped,
+            self.link_rotations,
+            self.lever_arms,
+            self.body_velocities,
+            self.drag_consts,
+            self.p.all_states,
+            self.state_rows,
+            self.drag_coef_pqr,
+        )
+
+        # apply the forces, this is the only per drone work left
+        # the bullet functions are looked up once, `BulletClient.__getattr__` is slow
+        apply_force = self.p.applyExternalForce
+        apply_torque = self.p.applyExternalTorque
+        in_contact = self.p.in_contact
+        link_frame = self.p.LINK_FRAME
+        for i, drone in enumerate(self.drones):
+            for body_id, force in zip(drone.body.body_ids, body_forces[i]):
+                apply_force(drone.Id, body_id, force, [0.0, 0.0, 0.0], link_frame)
+
+            if self.lumped[i]:
+                apply_force(drone.Id, -1, wrench[i, 0], [0.0, 0.0, 0.0], link_frame)
+                apply_torque(drone.Id, -1, wrench[i, 1], link_frame)
+            else:
+                for idx, thr, tor in zip(drone.motors.motor_ids, thrust[i], torque[i]):
+                    apply_force(drone.Id, idx, thr, [0.0, 0.0, 0.0], link_frame)
+                    apply_torque(drone.Id, idx, tor, link_frame)
+
+            # warning, the physics is funky for bounces
+            if not in_contact(drone.Id):
+                apply_torque(drone.Id, -1, drag_pqr[i], link_frame)
+
+    @staticmethod
+    @jitter
+    def _jitted_fleet_physics(
+        pwm: np.ndarray,
+        throttle: np.ndarray,
+        noise: np.ndarray,
+        physics_period: float,
+        tau: np.ndarray,
+        max_rpm: np.ndarray,
+        thrust_unit: np.ndarray,
+        thrust_coef: np.ndarray,
+        torque_coef: np.ndarray,
+        noise_ratio: np.ndarray,
+        lumped: np.ndarray,
+        link_rotations: np.ndarray,
+        lever_arms: np.ndarray,
+        body_velocities: np.ndarray,
+        drag_consts: np.ndarray,
+        states: np.ndarray,
+        state_rows: np.ndarray,
+        drag_coef_pqr: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Computes the motor and drag forces for a fleet of drones, updating `throttle` in place.
+
+        Args:
+            pwm (np.ndarray): (num_drones, num_motors) motor commands
+            throttle (np.ndarray): (num_drones, num_motors) current motor throttles, updated in place
+            noise (np.ndarray): (num_drones,) motor noise samples
+            physics_period (float): physics_period
+            tau (np.ndarray): (num_drones, num_motors) motor time constants
+            max_rpm (np.ndarray): (num_drones, num_motors) maximum motor rpms
+            thrust_unit (np.ndarray): (num_drones, num_motors, 3) thrust unit vectors
+            thrust_coef (np.ndarray): (num_drones, num_motors) thrust coefficients
+            torque_coef (np.ndarray): (num_drones, num_motors) torque coefficients
+            noise_ratio (np.ndarray): (num_drones, num_motors) motor noise ratios
+            lumped (np.ndarray): (num_drones,) whether each drone applies its motor forces as one wrench on the base
+            link_rotations (np.ndarray): (num_drones, num_motors, 3, 3) rotation matrices from each motor link frame to the base frame
+            lever_arms (np.ndarray): (num_drones, num_motors, 3) positions of each motor link in the base frame
+            body_velocities (np.ndarray): (num_drones, num_bodies, 3) local velocities of the drag bodies
+            drag_consts (np.ndarray): (num_drones, num_bodies, 3) drag constants of the drag bodies
+            states (np.ndarray): (num_states, 4, 3) the aviary's fleet state buffer
+            state_rows (np.ndarray): (num_drones,) rows of the drones in `states`
+            drag_coef_pqr (np.ndarray): (num_drones, 3) rotational drag coefficients
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]: motor thrusts, motor torques, lumped (force, torque) wrenches about the base, body drag forces and rotational drag torques
+
+        """
+        num_drones, num_motors = throttle.shape
+        thrust = np.zeros((num_drones, num_motors, 3))
+        torque = np.zeros((num_drones, num_motors, 3))
+        wrench = np.zeros((num_drones, 2, 3))
+        body_forces = np.zeros(body_velocities.shape)
+        drag_pqr = np.zeros((num_drones, 3))
+
+        for i in range(num_drones):
+            for j in range(num_motors):
+                # model the motor using first order ODE, y' = T/tau * (setpoint - y)
+                throttle[i, j] += (physics_period / tau[i, j]) * (
+                    pwm[i, j] - throttle[i, j]
+                )
+
+                # noise in the motor
+                throttle[i, j] += noise[i] * throttle[i, j] * noise_ratio[i, j]
+
+                # rpm to thrust and torque
+                rpm = throttle[i, j] * max_rpm[i, j]
+                for k in range(3):
+                    rpm_const = (rpm**2) * np.sign(rpm) * thrust_unit[i, j, k]
+                    thrust[i, j, k] = rpm_const * thrust_coef[i, j]
+                    torque[i, j, k] = rpm_const * torque_coef[i, j]
+
+            # combine the motors into one wrench about the base
+            if lumped[i]:
+                (wrench[i, 0], wrench[i, 1]) = _jitted_lump_wrench(
+                    thrust[i], torque[i], link_rotations[i], lever_arms[i]
+                )
+
+            # drag on the main bodies
+            for j in range(body_velocities.shape[1]):
+                for k in range(3):
+                    vel = body_velocities[i, j, k]
+                    body_forces[i, j, k] = -np.sign(vel) * drag_consts[i, j, k] * vel**2
+
+            # simulate rotational damping, `states[row, 0]` is the body frame angular velocity
+            row = state_rows[i]
+            for k in range(3):
+                ang_vel = states[row, 0, k]
+                drag_pqr[i, k] = -np.sign(ang_vel) * drag_coef_pqr[i, k] * (ang_vel**2)
+
+        return thrust, torque, wrench, body_forces, drag_pqr
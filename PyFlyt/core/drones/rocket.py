@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import numpy as np
-import yaml
 from pybullet_utils import bullet_client
 
 from PyFlyt.core.abstractions.base_drone import DroneClass
@@ -12,6 +13,9 @@ from PyFlyt.core.abstractions.boring_bodies import BoringBodies
 from PyFlyt.core.abstractions.camera import Camera
 from PyFlyt.core.abstractions.gimbals import Gimbals
 from PyFlyt.core.abstractions.lifting_surfaces import LiftingSurface, LiftingSurfaces
+from PyFlyt.core.abstractions.link_state_cache import LinkStateCache
+from PyFlyt.core.utils.param_cache import derive_params
+from PyFlyt.core.utils.validation import check_bounds
 
 
 class Rocket(DroneClass):
@@ -45,6 +49,8 @@ class Rocket(DroneClass):
         camera_position_offset: np.ndarray = np.array([-1.0, 0.0, 3.0]),
         camera_fps: None | int = None,
         starting_fuel_ratio: float = 0.05,
+        use_aero_tables: bool = False,
+        mass_update_tolerance: float = 0.0,
     ):
         """Creates a drone in the QuadX configuration and handles all relevant control and physics.
 
@@ -65,6 +71,8 @@ class Rocket(DroneClass):
             camera_position_offset (np.ndarray): offset position of the camera
             camera_fps (None | int): camera_fps
             starting_fuel_ratio (float): amount of fuel that the rocket has to beginwith
+            use_aero_tables (bool): whether to interpolate aerodynamic coefficients from precomputed tables instead of computing them analytically
+            mass_update_tolerance (float): how far the fuel tank mass in the physics engine may drift from the true fuel mass before it is updated, as a fraction of the full fuel mass
 
         """
         super().__init__(
@@ -81,122 +89,99 @@ class Rocket(DroneClass):
         # constants
         self.starting_fuel_ratio = starting_fuel_ratio
 
-        """Reads fixedwing.yaml file and load UAV parameters"""
-        with open(self.param_path, "rb") as f:
-            # load all params from yaml
-            all_params = yaml.safe_load(f)
-            booster_params = all_params["booster_params"]
-            body_params = all_params["body_params"]
-
-            # add the main body
-            self.bodies = BoringBodies(
-                p=self.p,
-                physics_period=self.physics_period,
-                np_random=self.np_random,
-                uav_id=self.Id,
-                body_ids=np.array([0]),
-                drag_coefs=np.array(
-                    [
-                        [
-                            body_params["drag_coef_x"],
-                            body_params["drag_coef_y"],
-                            body_params["drag_coef_z"],
-                        ]
-                    ]
-                ),
-                normal_areas=np.array(
-                    [
-                        [
-                            body_params["area_x"],
-                            body_params["area_y"],
-                            body_params["area_z"],
-                        ]
-                    ]
-                ),
-            )
+        # all params for the drone, parsed once per process and shared between drones
+        params = derive_params(self.param_path, self._derive_params)
+
+        # add the main body
+        self.bodies = BoringBodies(
+            p=self.p,
+            physics_period=self.physics_period,
+            np_random=self.np_random,
+            uav_id=self.Id,
+            body_ids=np.array([0]),
+            drag_coefs=params["drag_coefs"],
+            normal_areas=params["normal_areas"],
+        )
 
-            # add all finlets
-            surfaces = list()
-            for finlet_id in [0, 1]:
-                # x axis fins
-                surfaces.append(
-                    LiftingSurface(
-                        p=self.p,
-                        physics_period=self.physics_period,
-                        np_random=self.np_random,
-                        uav_id=self.Id,
-                        surface_id=finlet_id,
-                        lifting_unit=np.array([0.0, 1.0, 0.0]),
-                        forward_unit=np.array([0.0, 0.0, -1.0]),
-                        **all_params["finlet_params"],
-                    )
+        # add all finlets
+        surfaces = list()
+        for finlet_id in [0, 1]:
+            # x axis fins
+            surfaces.append(
+                LiftingSurface(
+                    p=self.p,
+                    physics_period=self.physics_period,
+                    np_random=self.np_random,
+                    uav_id=self.Id,
+                    surface_id=finlet_id,
+                    lifting_unit=np.array([0.0, 1.0, 0.0]),
+                    forward_unit=np.array([0.0, 0.0, -1.0]),
+                    **params["finlet_params"],
                 )
-            for finlet_id in [2, 3]:
-                # y axis fins
-                surfaces.append(
-                    LiftingSurface(
-                        p=self.p,
-                        physics_period=self.physics_period,
-                        np_random=self.np_random,
-                        uav_id=self.Id,
-                        surface_id=finlet_id,
-                        lifting_unit=np.array([1.0, 0.0, 0.0]),
-                        forward_unit=np.array([0.0, 0.0, -1.0]),
-                        **all_params["finlet_params"],
-                    )
+            )
+        for finlet_id in [2, 3]:
+            # y axis fins
+            surfaces.append(
+                LiftingSurface(
+                    p=self.p,
+                    physics_period=self.physics_period,
+                    np_random=self.np_random,
+                    uav_id=self.Id,
+                    surface_id=finlet_id,
+                    lifting_unit=np.array([1.0, 0.0, 0.0]),
+                    forward_unit=np.array([0.0, 0.0, -1.0]),
+                    **params["finlet_params"],
                 )
-            self.lifting_surfaces = LiftingSurfaces(lifting_surfaces=surfaces)
-
-            # mixing matrix to map finlet force command to finlet movement
-            # force_x, force_y, yaw
-            self.finlet_map = np.array(
-                [
-                    [+0.0, +1.0, +1.0],  # pos_x fin
-                    [+0.0, +1.0, -1.0],  # neg_x fin
-                    [+1.0, +0.0, -1.0],  # pos_y fin
-                    [+1.0, +0.0, +1.0],  # neg_y fin
-                ]
             )
+        self.lifting_surfaces = LiftingSurfaces(lifting_surfaces=surfaces)
+        if use_aero_tables:
+            self.lifting_surfaces.use_aero_tables()
+
+        # mixing matrix to map finlet force command to finlet movement
+        # force_x, force_y, yaw
+        self.finlet_map = np.array(
+            [
+                [+0.0, +1.0, +1.0],  # pos_x fin
+                [+0.0, +1.0, -1.0],  # neg_x fin
+                [+1.0, +0.0, -1.0],  # pos_y fin
+                [+1.0, +0.0, +1.0],  # neg_y fin
+            ]
+        )
 
-            # add the booster
-            self.boosters = Boosters(
-                p=self.p,
-                physics_period=self.physics_period,
-                np_random=self.np_random,
-                uav_id=self.Id,
-                booster_ids=np.array([1], dtype=int),
-                fueltank_ids=np.array([0], dtype=int),
-                tau=np.array([booster_params["booster_tau"]]),
-                total_fuel_mass=np.array([booster_params["total_fuel"]]),
-                max_fuel_rate=np.array([booster_params["max_fuel_rate"]]),
-                max_inertia=np.array(
-                    [
-                        [
-                            booster_params["inertia_ixx"],
-                            booster_params["inertia_iyy"],
-                            booster_params["inertia_izz"],
-                        ]
-                    ]
-                ),
-                min_thrust=np.array([booster_params["min_thrust"]]),
-                max_thrust=np.array([booster_params["max_thrust"]]),
-                thrust_unit=np.array([[0.0, 0.0, 1.0]]),
-                reignitable=np.array([booster_params["reignitable"]], dtype=bool),
-                noise_ratio=np.array([booster_params["noise_ratio"]]),
-            )
+        # add the booster
+        self.boosters = Boosters(
+            p=self.p,
+            physics_period=self.physics_period,
+            np_random=self.np_random,
+            uav_id=self.Id,
+            booster_ids=np.array([1], dtype=int),
+            fueltank_ids=np.array([0], dtype=int),
+            tau=params["booster_tau"],
+            total_fuel_mass=params["total_fuel_mass"],
+            max_fuel_rate=params["max_fuel_rate"],
+            max_inertia=params["max_inertia"],
+            min_thrust=params["min_thrust"],
+            max_thrust=params["max_thrust"],
+            thrust_unit=np.array([[0.0, 0.0, 1.0]]),
+            reignitable=params["reignitable"],
+            noise_ratio=params["noise_ratio"],
+            mass_update_tolerance=mass_update_tolerance,
+        )
 
-            # add the gimbal for the booster
-            self.booster_gimbal = Gimbals(
-                p=self.p,
-                physics_period=self.physics_period,
-                np_random=self.np_random,
-                gimbal_unit_1=np.array([[1.0, 0.0, 0.0]]),
-                gimbal_unit_2=np.array([[0.0, 1.0, 0.0]]),
-                gimbal_tau=np.array([booster_params["gimbal_tau"]]),
-                gimbal_range_degrees=np.array(
-                    [[booster_params["gimbal_range_degrees"]] * 2]
-                ),
-            )
+        # add the gimbal for the booster
+        self.booster_gimbal = Gimbals(
+            p=self.p,
+            physics_period=self.physics_period,
+            np_random=self.np_random,
+            gimbal_unit_1=np.array([[1.0, 0.0, 0.0]]),
+            gimbal_unit_2=np.array([[0.0, 1.0, 0.0]]),
+            gimbal_tau=params["gimbal_tau"],
+            gimbal_range_degrees=params["gimbal_range_degrees"],
+        )
+
+        # bounds on the controller output, finlets and gimbals take [-1, 1], ignition and throttle take [0, 1]
+        self.cmd_low = np.array([-1.0, -1.0, -1.0, -1.0, 0.0, 0.0, -1.0, -1.0])
+        self.cmd_high = np.full((8,), 1.0)
 
         """ CAMERA """
         self.use_camera = use_camera
@@ -213,6 +198,13 @@ class Rocket(DroneClass):
                 is_tracking_camera=True,
             )
 
+        # all link states needed by the components are fetched together once per physics step
+        self.link_states = LinkStateCache(self.p, self.Id)
+        self.bodies.use_link_state_cache(self.link_states)
+        self.lifting_surfaces.use_link_state_cache(self.link_states)
+        if self.use_camera:
+            self.camera.use_link_state_cache(self.link_states)
+
         # compute camera fps parameters
         if camera_fps:
             assert (
@@ -222,6 +214,62 @@ class Rocket(DroneClass):
         else:
             self.physics_camera_ratio = 1
 
+    @staticmethod
+    def _derive_params(all_params: dict[str, Any]) -> dict[str, Any]:
+        """Computes the constants of a Rocket from its parameter file, see `derive_params`.
+
+        Args:
+            all_params (dict[str, Any]): the parsed parameter file.
+
+        Returns:
+            dict[str, Any]: booster, gimbal and body drag constants, and the parameters of the finlets.
+
+        """
+        booster_params = all_params["booster_params"]
+        body_params = all_params["body_params"]
+
+        return dict(
+            drag_coefs=np.array(
+                [
+                    [
+                        body_params["drag_coef_x"],
+                        body_params["drag_coef_y"],
+                        body_params["drag_coef_z"],
+                    ]
+                ]
+            ),
+            normal_areas=np.array(
+                [
+                    [
+                        body_params["area_x"],
+                        body_params["area_y"],
+                        body_params["area_z"],
+                    ]
+                ]
+            ),
+            finlet_params=dict(all_params["finlet_params"]),
+            booster_tau=np.array([booster_params["booster_tau"]]),
+            total_fuel_mass=np.array([booster_params["total_fuel"]]),
+            max_fuel_rate=np.array([booster_params["max_fuel_rate"]]),
+            max_inertia=np.array(
+                [
+                    [
+                        booster_params["inertia_ixx"],
+                        booster_params["inertia_iyy"],
+                        booster_params["inertia_izz"],
+                    ]
+                ]
+            ),
+            min_thrust=np.array([booster_params["min_thrust"]]),
+            max_thrust=np.array([booster_params["max_thrust"]]),
+            reignitable=np.array([booster_params["reignitable"]], dtype=bool),
+            noise_ratio=np.array([booster_params["noise_ratio"]]),
+            gimbal_tau=np.array([booster_params["gimbal_tau"]]),
+            gimbal_range_degrees=np.array(
+                [[booster_params["gimbal_range_degrees"]] * 2]
+            ),
+        )
+
     def reset(self) -> None:
         """Resets the vehicle to the initial state."""
         self.set_mode(0)
@@ -274,8 +322,15 @@ class Rocket(DroneClass):
                 f"Don't have other modes aside from 0, received {self.mode}."
             )
 
-        # custom controllers run if any
-        self.cmd = self.instanced_controllers[self.mode].step(self.state, self.setpoint)
+        # custom controllers run if any, copied since a pass-through controller would alias the shared setpoint buffer
+        self.cmd = np.array(
+            self.instanced_controllers[self.mode].step(self.state, self.setpoint),
+            dtype=np.float64,
+        )
+
+    def check_command(self) -> None:
+        """Checks that the finlet and gimbal commands are within [-1, 1], and the ignition and throttle commands are within [0, 1]."""
+        check_bounds("cmd", self.cmd, self.cmd_low, self.cmd_high)
 
     def update_physics(self) -> None:
         """Updates the physics of the vehicle."""
@@ -300,27 +355,20 @@ class Rocket(DroneClass):
     def update_state(self) -> None:
         """Updates the current state of the UAV.
 
-        This includes: ang_vel, ang_pos, lin_vel, lin_pos.
+        The base state (ang_vel, ang_pos, lin_vel, lin_pos) and rotation are filled in beforehand by the `Aviary` for the whole fleet.
+        Outside of an `Aviary`, the drone reads its own base state instead.
         """
-        lin_pos, ang_pos = self.p.getBasePositionAndOrientation(self.Id)
-        lin_vel, ang_vel = self.p.getBaseVelocity(self.Id)
-
-        # express vels in local frame
-        rotation = np.array(self.p.getMatrixFromQuaternion(ang_pos)).reshape(3, 3).T
-        lin_vel = np.matmul(rotation, lin_vel)
-        ang_vel = np.matmul(rotation, ang_vel)
-
-        # ang_pos in euler form
-        ang_pos = self.p.getEulerFromQuaternion(ang_pos)
+        if not self._state_bound:
+            self.update_base_state()
 
-        # create the state
-        self.state = np.stack([ang_vel, ang_pos, lin_vel, lin_pos], axis=0)
+        # fetch all link states at once
+        self.link_states.update()
 
         # update all bodies, which is just the booster here
-        self.bodies.state_update(rotation)
+        self.bodies.state_update(self.rotation)
 
         # update all lifting surface velocities
-        self.lifting_surfaces.state_update(rotation)
+        self.lifting_surfaces.state_update(self.rotation)
 
         # update auxiliary information
         self.aux_state = np.concatenate(
@@ -0,0 +1,189 @@
+"""A pool of loaded drone bodies that are parked and handed out again instead of being reloaded."""
+
+from __future__ import annotations
+
+import bisect
+from typing import Any
+
+import numpy as np
+from pybullet_utils import bullet_client
+
+# where parked bodies are kept, far below the floor
+_PARKING_POSITION = (0.0, 0.0, -1000.0)
+
+
+class BodyPool:
+    """Keeps drone bodies loaded in the simulation so that they can be reused instead of parsing their URDF and meshes again.
+
+    Bodies are keyed by the path of their URDF, so any drone type, including custom ones registered through `drone_type_mappings`, can be pooled.
+    A released body is parked: it is moved far out of the world, all its collisions are disabled, and its base is made static by zeroing its mass.
+    When a parked body is acquired again, its pose, velocities, joint states, collision filters, dynamics and link colors are restored to those it was loaded with.
+
+    Args:
+        p (bullet_client.BulletClient): PyBullet physics client ID.
+
+    """
+
+    def __init__(self, p: bullet_client.BulletClient):
+        """__init__.
+
+        Args:
+            p (bullet_client.BulletClient): PyBullet physics client ID.
+
+        """
+        self.p = p
+
+        # parked bodies of each URDF, sorted so that the lowest IDs are handed out first, as they would be in a fresh world
+        self.parked: dict[str, list[int]] = dict()
+
+        # the URDF and the properties as loaded of every body owned by the pool
+        self._paths: dict[int, str] = dict()
+        self._defaults: dict[int, dict[str, Any]] = dict()
+
+    def owns(self, body_id: int) -> bool:
+        """Whether a body was loaded by the pool, parked or not.
+
+        Args:
+            body_id (int): ID of the body.
+
+        Returns:
+            bool:
+
+        """
+        return body_id in self._paths
+
+    def is_parked(self, body_id: int) -> bool:
+        """Whether a body is currently parked.
+
+        Args:
+            body_id (int): ID of the body.
+
+        Returns:
+            bool:
+
+        """
+        return body_id in self.parked.get(self._paths.get(body_id, ""), ())
+
+    @property
+    def num_parked(self) -> int:
+        """The number of parked bodies across all URDFs.
+
+        Returns:
+            int:
+
+        """
+        return sum(len(bodies) for bodies in self.parked.values())
+
+    def acquire(
+        self,
+        urdf_path: str,
+        position: np.ndarray,
+        orientation: np.ndarray,
+    ) -> int:
+        """Hands out a parked body loaded from the given URDF, or loads a new one if none are parked.
+
+        Args:
+            urdf_path (str): path to the URDF of the body.
+            position (np.ndarray): `(3,)` position to place the body at.
+            orientation (np.ndarray): `(4,)` orientation quaternion to place the body at.
+
+        Returns:
+            int: ID of the body.
+
+        """
+        parked = self.parked.get(urdf_path)
+        if not parked:
+            return self._load(urdf_path, position, orientation)
+
+        body_id = parked.pop(0)
+        defaults = self._defaults[body_id]
+
+        # dynamics first, the base is only dynamic again once its mass is back
+        for link_id, dynamics in defaults["dynamics"].items():
+            self.p.changeDynamics(body_id, link_id, **dynamics)
+        for link_id, color in defaults["colors"].items():
+            self.p.changeVisualShape(body_id, link_id, rgbaColor=color)
+        for link_id in range(-1, defaults["num_joints"]):
+            self.p.setCollisionFilterGroupMask(body_id, link_id, 1, -1)
+
+        self.p.resetBasePositionAndOrientation(body_id, position, orientation)
+        self.p.resetBaseVelocity(body_id, [0.0, 0.0, 0.0], [0.0, 0.0, 0.0])
+        for joint_id in range(defaults["num_joints"]):
+            self.p.resetJointState(body_id, joint_id, 0.0, 0.0)
+
+        return body_id
+
+    def release(self, body_id: int) -> None:
+        """Parks a body so that it can be handed out again by `acquire`, bodies not owned by the pool are removed instead.
+
+        Args:
+            body_id (int): ID of the body.
+
+        """
+        if not self.owns(body_id):
+            self.p.removeBody(body_id)
+            return
+        if self.is_parked(body_id):
+            return
+
+        for link_id in range(-1, self._defaults[body_id]["num_joints"]):
+            self.p.setCollisionFilterGroupMask(body_id, link_id, 0, 0)
+        self.p.changeDynamics(body_id, -1, mass=0.0)
+        self.p.resetBasePositionAndOrientation(
+            body_id, _PARKING_POSITION, (0.0, 0.0, 0.0, 1.0)
+        )
+        self.p.resetBaseVelocity(body_id, [0.0, 0.0, 0.0], [0.0, 0.0, 0.0])
+
+        bisect.insort(self.parked[self._paths[body_id]], body_id)
+
+    def clear(self) -> None:
+        """Forgets all bodies, call this when the bodies have been destroyed, such as after `resetSimulation`."""
+        self.parked.clear()
+        self._paths.clear()
+        self._defaults.clear()
+
+    def _load(
+        self,
+        urdf_path: str,
+        position: np.ndarray,
+        orientation: np.ndarray,
+    ) -> int:
+        """Loads a new body and records its properties as loaded.
+
+        Args:
+            urdf_path (str): path to the URDF of the body.
+            position (np.ndarray): `(3,)` position to place the body at.
+            orientation (np.ndarray): `(4,)` orientation quaternion to place the body at.
+
+        Returns:
+            int: ID of the body.
+
+        """
+        body_id = self.p.loadURDF(
+            urdf_path,
+            basePosition=position,
+            baseOrientation=orientation,
+            useFixedBase=False,
+            flags=self.p.URDF_USE_INERTIA_FROM_FILE,
+        )
+
+        num_joints = self.p.getNumJoints(body_id)
+        dynamics = dict()
+        for link_id in range(-1, num_joints):
+            info = self.p.getDynamicsInfo(body_id, link_id)
+            dynamics[link_id] = dict(
+                mass=info[0],
+                lateralFriction=info[1],
+                localInertiaDiagonal=info[2],
+                restitution=info[5],
+                rollingFriction=info[6],
+                spinningFriction=info[7],
+            )
+        colors = {shape[1]: shape[7] for shape in self.p.getVisualShapeData(body_id)}
+
+        self._paths[body_id] = urdf_path
+        self._defaults[body_id] = dict(
+            num_joints=num_joints, dynamics=dynamics, colors=colors
+        )
+        self.parked.setdefault(urdf_path, [])
+        return body_id
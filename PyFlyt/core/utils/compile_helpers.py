@@ -1,16 +1,127 @@
 """Common checks."""
 
+from __future__ import annotations
+
+import os
 import warnings
-from typing import Callable
+from typing import Any, Callable
 
-import numba as nb
 import pybullet as p
 from gymnasium.utils import colorize
 
+try:
+    import numba as nb
+except ImportError:
+    nb = None
+
+JIT_ENABLED = nb is not None and os.environ.get("PYFLYT_DISABLE_JIT", "0") in (
+    "",
+    "0",
+)
+"""Whether kernels are compiled with numba, set `PYFLYT_DISABLE_JIT=1` to run them as plain NumPy."""
+
+CACHE_DIR = os.environ.get("PYFLYT_CACHE_DIR", "")
+"""Where compiled kernels are cached on disk, defaults to numba's own choice of location."""
+
+JITTED_FUNCTIONS: list[Any] = []
+"""Every kernel that went through `jitter`, in order of definition."""
+
 
 def jitter(func: Callable, **kwargs):
-    """Jits a function."""
-    return nb.njit(func, **kwargs)
+    """Jits a function, caching the compiled machine code on disk.
+
+    If numba is unavailable or `PYFLYT_DISABLE_JIT=1` is set, the function is returned as is.
+    Compiled kernels are cached under `PYFLYT_CACHE_DIR` if it is set, otherwise wherever numba caches by default.
+    """
+    if not JIT_ENABLED:
+        JITTED_FUNCTIONS.append(func)
+        return func
+
+    kwargs.setdefault("cache", True)
+
+    # numba picks the cache location when the dispatcher is built, only point it elsewhere for our kernels
+    numba_cache_dir = nb.config.CACHE_DIR
+    if CACHE_DIR:
+        nb.config.CACHE_DIR = CACHE_DIR
+    try:
+        dispatcher = nb.njit(func, **kwargs)
+    finally:
+        nb.config.CACHE_DIR = numba_cache_dir
+
+    JITTED_FUNCTIONS.append(dispatcher)
+    return dispatcher
+
+
+def compiled_signatures() -> dict[str, int]:
+    """Counts the compiled signatures of every kernel defined so far.
+
+    Returns:
+        dict[str, int]: the number of compiled signatures of each kernel, keyed by qualified name, kernels only called from other kernels may have none when their callers are loaded from the cache.
+
+    """
+    return {
+        func.__qualname__: len(getattr(func, "signatures", ()))
+        for func in JITTED_FUNCTIONS
+    }
+
+
+def warmup() -> dict[str, int]:
+    """Compiles every kernel in `PyFlyt.core` by stepping small simulations that touch each of them.
+
+    With the on-disk cache this only needs to happen once per install, after which it is a cheap way to load all kernels up front instead of on the first step of an environment.
+    Kernels of the environment packages are warmed up by `PyFlyt.warmup`, as the core does not depend on them.
+
+    Returns:
+        dict[str, int]: the number of compiled signatures of each kernel, see `compiled_signatures`.
+
+    """
+    import numpy as np
+
+    from PyFlyt.core.abstractions.pid import PID
+    from PyFlyt.core.aviary import Aviary
+
+    # the generic PID controller for custom drones
+    PID(np.ones(1), np.ones(1), np.ones(1), np.ones(1), 1.0).step(
+        np.zeros(1), np.ones(1)
+    )
+
+    # quadx fleets go through the fleet kernels, step every flight mode
+    env = Aviary(
+        start_pos=np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 1.0]]),
+        start_orn=np.zeros((2, 3)),
+        drone_type="quadx",
+        render=False,
+    )
+    for mode in range(8):
+        env.set_mode(mode)
+        env.set_all_setpoints(np.zeros((2, 4)))
+        env.step()
+    env.disconnect()
+
+    # a mixed aviary with a wind field, tabulated aerodynamics, lumped motors, gimbals, and boosters
+    def wind_field(time: float, position: np.ndarray) -> np.ndarray:
+        return np.ones_like(position)
+
+    env = Aviary(
+        start_pos=np.array([[0.0, 0.0, 1.0], [3.0, 0.0, 1.0], [6.0, 0.0, 1.0]]),
+        start_orn=np.zeros((3, 3)),
+        drone_type=["quadx", "fixedwing", "rocket"],
+        drone_options=[
+            dict(lumped_motors=True),
+            dict(use_aero_tables=True),
+            dict(use_aero_tables=True),
+        ],
+        render=False,
+    )
+    env.register_wind_field_function(wind_field)
+    env.set_setpoint(0, np.zeros(4))
+    env.set_setpoint(1, np.zeros(4))
+    env.set_setpoint(2, np.array([0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0]))
+    for _ in range(4):
+        env.step()
+    env.disconnect()
+
+    return compiled_signatures()
 
 
 def check_numpy():
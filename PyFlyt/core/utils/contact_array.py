@@ -0,0 +1,308 @@
+"""A sparse representation of contacts between bodies in the simulation."""
+
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+import numpy as np
+
+_NO_CONTACTS: frozenset[int] = frozenset()
+
+
+class ContactArray:
+    """Sparse, symmetric record of which bodies are in contact with each other.
+
+    This stands in for a dense `(num_bodies, num_bodies)` boolean array, which gets expensive to clear and reallocate in worlds with many bodies.
+    Only the pairs of bodies in contact are stored, along with a per-body adjacency for fast lookups.
+    Indexing semantics follow those of the dense array, so `contact_array[n, m]`, `contact_array[n]` and `contact_array[ids].sum(-1)` all work as before.
+    Contacts are always symmetric, setting `contact_array[n, m]` also sets `contact_array[m, n]`.
+
+    Args:
+        num_bodies (int): the number of registered bodies, this sets the length of each row when indexing.
+
+    """
+
+    def __init__(self, num_bodies: int = 0):
+        """__init__.
+
+        Args:
+            num_bodies (int): the number of registered bodies, this sets the length of each row when indexing.
+
+        """
+        self.num_bodies = num_bodies
+        self._pairs: set[tuple[int, int]] = set()
+        self._adjacency: dict[int, set[int]] = dict()
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """The shape of the equivalent dense array.
+
+        Returns:
+            tuple[int, int]:
+
+        """
+        return (self.num_bodies, self.num_bodies)
+
+    @property
+    def pairs(self) -> set[tuple[int, int]]:
+        """All `(n, m)` pairs of bodies in contact, where `n <= m`.
+
+        Returns:
+            set[tuple[int, int]]:
+
+        """
+        return self._pairs
+
+    def register(self, num_bodies: int) -> None:
+        """Grows the array to accommodate newly spawned bodies, this does not reallocate anything.
+
+        Args:
+            num_bodies (int): the new number of bodies
+
+        """
+        self.num_bodies = max(self.num_bodies, num_bodies)
+
+    def add(self, body_a: int, body_b: int) -> None:
+        """Records a contact between two bodies.
+
+        Args:
+            body_a (int): body_a
+            body_b (int): body_b
+
+        """
+        self._pairs.add((body_a, body_b) if body_a <= body_b else (body_b, body_a))
+        self._adjacency.setdefault(body_a, set()).add(body_b)
+        self._adjacency.setdefault(body_b, set()).add(body_a)
+        if body_a >= self.num_bodies or body_b >= self.num_bodies:
+            self.num_bodies = max(body_a, body_b) + 1
+
+    def remove(self, body_a: int, body_b: int) -> None:
+        """Removes the record of a contact between two bodies, if any.
+
+        Args:
+            body_a (int): body_a
+            body_b (int): body_b
+
+        """
+        self._pairs.discard((body_a, body_b) if body_a <= body_b else (body_b, body_a))
+        for body, other in ((body_a, body_b), (body_b, body_a)):
+            if body in self._adjacency:
+                self._adjacency[body].discard(other)
+                if not self._adjacency[body]:
+                    del self._adjacency[body]
+
+    def remove_body(self, body_id: int) -> None:
+        """Removes the records of all contacts involving a body, such as when it is removed from the simulation.
+
+        Args:
+            body_id (int): body_id
+
+        """
+        for other in self._adjacency.pop(body_id, _NO_CONTACTS):
+            self._pairs.discard(
+                (body_id, other) if body_id <= other else (other, body_id)
+            )
+            if other != body_id:
+                self._adjacency[other].discard(body_id)
+                if not self._adjacency[other]:
+                    del self._adjacency[other]
+
+    def clear(self) -> None:
+        """Removes all contacts, this only touches the contacts that exist."""
+        self._pairs.clear()
+        self._adjacency.clear()
+
+    def contacts_of(self, body_id: int) -> set[int] | frozenset[int]:
+        """Returns the IDs of all bodies in contact with the given body.
+
+        Args:
+            body_id (int): body_id
+
+        Returns:
+            set[int] | frozenset[int]: do not modify this in place.
+
+        """
+        return self._adjacency.get(body_id, _NO_CONTACTS)
+
+    def in_contact(self, body_id: int) -> bool:
+        """Returns whether the given body is in contact with anything.
+
+        Args:
+            body_id (int): body_id
+
+        Returns:
+            bool:
+
+        """
+        return body_id in self._adjacency
+
+    def any(self, axis: Any = None, out: Any = None, **kwargs) -> Any:
+        """Checks whether there are any contacts at all.
+
+        This is also what numpy calls for `np.any` on the contact array.
+
+        Args:
+            axis (Any): if provided, falls back to the dense implementation.
+            out (Any): if provided, falls back to the dense implementation.
+            **kwargs: if provided, falls back to the dense implementation.
+
+        Returns:
+            Any:
+
+        """
+        if axis is None and out is None and not kwargs:
+            return bool(self._pairs)
+        return np.any(self.__array__(), axis=axis, out=out, **kwargs)
+
+    def copy(self) -> ContactArray:
+        """Returns a copy of this contact array.
+
+        Returns:
+            ContactArray:
+
+        """
+        other = ContactArray(self.num_bodies)
+        other._pairs = self._pairs.copy()
+        other._adjacency = {k: v.copy() for k, v in self._adjacency.items()}
+        return other
+
+    def _row(self, body_id: int) -> np.ndarray:
+        """Returns the dense row of contacts for a single body.
+
+        Args:
+            body_id (int): body_id
+
+        Returns:
+            np.ndarray:
+
+        """
+        row = np.zeros((self.num_bodies,), dtype=bool)
+        contacts = self._adjacency.get(body_id)
+        if contacts:
+            row[list(contacts)] = True
+        return row
+
+    def __getitem__(self, key: Any) -> Any:
+        """Indexes the contact array as though it were a dense boolean array.
+
+        Args:
+            key (Any): key
+
+        Returns:
+            Any:
+
+        """
+        # single element, `contact_array[n, m]`
+        if (
+            isinstance(key, tuple)
+            and len(key) == 2
+            and isinstance(key[0], (int, np.integer))
+            and isinstance(key[1], (int, np.integer))
+        ):
+            return int(key[1]) in self._adjacency.get(int(key[0]), _NO_CONTACTS)
+
+        # single row, `contact_array[n]`
+        if isinstance(key, (int, np.integer)):
+            return self._row(int(key))
+
+        # many rows, `contact_array[ids]`
+        if isinstance(key, (list, np.ndarray)) and np.asarray(key).ndim == 1:
+            key = np.asarray(key)
+            if key.dtype == bool:
+                key = np.flatnonzero(key)
+            rows = np.zeros((len(key), self.num_bodies), dtype=bool)
+            for i, body_id in enumerate(key):
+                contacts = self._adjacency.get(int(body_id))
+                if contacts:
+                    rows[i, list(contacts)] = True
+            return rows
+
+        # anything else, just do it densely
+        return self.__array__()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Sets or clears a single contact via `contact_array[n, m] = value`.
+
+        Args:
+            key (Any): key
+            value (Any): value
+
+        """
+        if not (
+            isinstance(key, tuple)
+            and len(key) == 2
+            and isinstance(key[0], (int, np.integer))
+            and isinstance(key[1], (int, np.integer))
+        ):
+            raise TypeError(
+                f"Only single contacts can be set via `contact_array[n, m]`, got {key}."
+            )
+
+        if value:
+            self.add(int(key[0]), int(key[1]))
+        else:
+            self.remove(int(key[0]), int(key[1]))
+
+    def __iand__(self, other: Any) -> ContactArray:
+        """Supports the `contact_array &= False` idiom for clearing all contacts.
+
+        Args:
+            other (Any): must be False
+
+        Returns:
+            ContactArray:
+
+        """
+        if other is not False and other != 0:
+            raise TypeError(
+                f"Only `&= False` is supported for clearing the contact array, got {other}."
+            )
+        self.clear()
+        return self
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        """Iterates over the dense rows.
+
+        Returns:
+            Iterator[np.ndarray]:
+
+        """
+        return (self._row(i) for i in range(self.num_bodies))
+
+    def __len__(self) -> int:
+        """Length of the equivalent dense array.
+
+        Returns:
+            int:
+
+        """
+        return self.num_bodies
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        """Materializes the equivalent dense array, this is slow for many bodies.
+
+        Args:
+            dtype (Any): dtype
+            copy (Any): unused, the dense array is always a new array
+
+        Returns:
+            np.ndarray:
+
+        """
+        dense = np.zeros(self.shape, dtype=bool)
+        if self._pairs:
+            pairs = np.array(list(self._pairs))
+            dense[pairs[:, 0], pairs[:, 1]] = True
+            dense[pairs[:, 1], pairs[:, 0]] = True
+        return dense if dtype is None else dense.astype(dtype)
+
+    def __repr__(self) -> str:
+        """__repr__.
+
+        Returns:
+            str:
+
+        """
+        return (
+            f"ContactArray(num_bodies={self.num_bodies}, pairs={sorted(self._pairs)})"
+        )
@@ -0,0 +1,44 @@
+"""Module level `__getattr__` and `__dir__` for packages that import their members on first use."""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable
+
+
+def lazy_imports(
+    package: str, members: dict[str, tuple[str, str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Builds the `__getattr__` and `__dir__` of a package whose members are imported on first access.
+
+    Example:
+        In the `__init__.py` of a package:
+        >>> _MEMBERS = {"Aviary": (".aviary", "Aviary")}
+        >>> __all__ = list(_MEMBERS)
+        >>> __getattr__, __dir__ = lazy_imports(__name__, _MEMBERS)
+
+    Args:
+        package (str): the `__name__` of the package.
+        members (dict[str, tuple[str, str]]): maps each public name to the module, relative to the package, and the attribute in that module.
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: the `__getattr__` and `__dir__` of the package.
+
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        if name not in members:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        module, attribute = members[name]
+        value = getattr(importlib.import_module(module, package), attribute)
+
+        # later lookups hit the package namespace directly
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *members})
+
+    return __getattr__, __dir__
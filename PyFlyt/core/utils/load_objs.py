@@ -2,10 +2,36 @@
 
 from __future__ import annotations
 
+from typing import Callable, Hashable
+
 import numpy as np
 from pybullet_utils import bullet_client
 
 
+def _cached_shape(
+    env: bullet_client.BulletClient, key: Hashable, create: Callable[[], int]
+) -> int:
+    """Creates a shape once per environment, and returns the same shape for every later request with the same key.
+
+    Only environments that hold a `shape_cache`, such as the `Aviary`, cache shapes, as the cache must be cleared whenever `resetSimulation` destroys the shapes.
+
+    Args:
+        env (Aviary): env
+        key (Hashable): the kind, file and scale of the shape
+        create (Callable[[], int]): creates the shape and returns its ID
+
+    Returns:
+        int: ID of the shape
+
+    """
+    cache: None | dict[Hashable, int] = getattr(env, "shape_cache", None)
+    if cache is None:
+        return create()
+    if key not in cache:
+        cache[key] = create()
+    return cache[key]
+
+
 def loadOBJ(
     env: bullet_client.BulletClient,
     fileName: str = "null",
@@ -48,12 +74,69 @@ def loadOBJ(
     return body_id
 
 
+def load_objs_batch(
+    env: bullet_client.BulletClient,
+    basePositions: list[list[float]] | np.ndarray,
+    fileName: str = "null",
+    visualId: int = -1,
+    collisionId: int = -1,
+    baseMass: float = 0.0,
+    meshScale: list[float] | np.ndarray = [1.0, 1.0, 1.0],
+    baseOrientation: list[float] | np.ndarray = [0.0, 0.0, 0.0],
+) -> list[int]:
+    """Loads many instances of the same object into the environment in one go, such as the trees of a forest.
+
+    All instances share one visual and one collision shape and the same orientation, and are created in a single `createMultiBody` call.
+    New bodies are registered with the environment once at the end, rather than once per instance as with `loadOBJ`.
+
+    Args:
+        env (Aviary): env
+        basePositions (list[list[float]] | np.ndarray): an `(n, 3)` array of positions, one per instance
+        fileName (str): fileName
+        visualId (int): visualId
+        collisionId (int): collisionId
+        baseMass (float): baseMass
+        meshScale (list[float] | np.ndarray): meshScale
+        baseOrientation (list[float] | np.ndarray): baseOrientation
+
+    Returns:
+        list[int]: IDs of the new bodies, in the order of `basePositions`
+
+    """
+    basePositions = np.asarray(basePositions, dtype=np.float64)
+    assert (
+        basePositions.ndim == 2 and basePositions.shape[-1] == 3
+    ), f"basePositions must be shape (n, 3), got {basePositions.shape}."
+    if len(basePositions) == 0:
+        return []
+
+    if len(baseOrientation) == 3:
+        baseOrientation = env.getQuaternionFromEuler(baseOrientation)
+
+    if visualId == -1:
+        visualId = obj_visual(env, fileName, meshScale)
+
+    body_ids = env.createMultiBody(
+        baseMass=baseMass,
+        baseVisualShapeIndex=int(visualId),
+        baseCollisionShapeIndex=int(collisionId),
+        baseOrientation=baseOrientation,
+        batchPositions=basePositions.tolist(),
+    )
+
+    # the client does not track bodies created in a batch until told to
+    env.syncBodyInfo()
+    env.register_all_new_bodies()
+
+    return list(body_ids)
+
+
 def obj_visual(
     env: bullet_client.BulletClient,
     fileName: str,
     meshScale: list[float] | np.ndarray = [1.0, 1.0, 1.0],
 ):
-    """Loads an object visual model.
+    """Loads an object visual model, this is only created once per file and scale in environments with a `shape_cache`.
 
     Args:
         env (Aviary): env
@@ -61,12 +144,16 @@ def obj_visual(
         meshScale (list[float] | np.ndarray): meshScale
 
     """
-    return env.createVisualShape(
-        shapeType=env.GEOM_MESH,
-        fileName=fileName,
-        rgbaColor=[1, 1, 1, 1],
-        specularColor=[0.0, 0.0, 0.0],
-        meshScale=meshScale,
+    return _cached_shape(
+        env,
+        ("visual", fileName, tuple(np.asarray(meshScale, dtype=np.float64).tolist())),
+        lambda: env.createVisualShape(
+            shapeType=env.GEOM_MESH,
+            fileName=fileName,
+            rgbaColor=[1, 1, 1, 1],
+            specularColor=[0.0, 0.0, 0.0],
+            meshScale=meshScale,
+        ),
     )
 
 
@@ -76,7 +163,7 @@ def obj_collision(
     meshScale: list[float] | np.ndarray = [1.0, 1.0, 1.0],
     concave: bool = False,
 ):
-    """Loads an object collision model.
+    """Loads an object collision model, this is only created once per file, scale and concavity in environments with a `shape_cache`.
 
     Args:
         env (Aviary): env
@@ -85,15 +172,23 @@ def obj_collision(
         concave (bool): Whether the object should use concave trimesh, do not use this for dynamic/moving objects
 
     """
-    return (
-        env.createCollisionShape(
-            shapeType=env.GEOM_MESH,
-            fileName=fileName,
-            meshScale=meshScale,
-            flags=env.GEOM_FORCE_CONCAVE_TRIMESH,
-        )
-        if concave
-        else env.createCollisionShape(
-            shapeType=env.GEOM_MESH, fileName=fileName, meshScale=meshScale
-        )
+    return _cached_shape(
+        env,
+        (
+            "concave_collision" if concave else "collision",
+            fileName,
+            tuple(np.asarray(meshScale, dtype=np.float64).tolist()),
+        ),
+        lambda: (
+            env.createCollisionShape(
+                shapeType=env.GEOM_MESH,
+                fileName=fileName,
+                meshScale=meshScale,
+                flags=env.GEOM_FORCE_CONCAVE_TRIMESH,
+            )
+            if concave
+            else env.createCollisionShape(
+                shapeType=env.GEOM_MESH, fileName=fileName, meshScale=meshScale
+            )
+        ),
     )
@@ -0,0 +1,87 @@
+"""A pool of pre-generated random normals shared by the components of a simulation."""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+class NoisePool:
+    """Hands out standard normals from large blocks drawn from a random number generator.
+
+    Drawing a handful of random numbers from a `np.random.Generator` has a fixed overhead that dwarfs the cost of the draw itself.
+    This pool instead draws `block_size` standard normals at a time and hands out slices of the block, refilling lazily when it runs out.
+    The values handed out are the same stream of standard normals that the generator would have produced, so results stay reproducible under the same seed.
+
+    `normal` mirrors the signature of `np.random.Generator.normal`, so the pool can be used in place of the generator for drawing noise.
+
+    Args:
+        np_random (np.random.Generator): the random number generator to draw from.
+        block_size (int): the number of standard normals to draw at a time.
+
+    """
+
+    def __init__(self, np_random: np.random.Generator, block_size: int = 4096):
+        """__init__.
+
+        Args:
+            np_random (np.random.Generator): the random number generator to draw from.
+            block_size (int): the number of standard normals to draw at a time.
+
+        """
+        assert block_size > 0, f"`block_size` must be more than 0, got {block_size}."
+        self.np_random = np_random
+        self.block_size = block_size
+        self.reset()
+
+    def reset(self) -> None:
+        """Discards all pre-generated values, the next draw refills the pool from the generator."""
+        self._block = np.zeros((0,))
+        self._cursor = 0
+
+    def _refill(self, size: int) -> None:
+        """Draws a new block, keeping any values that have not been handed out yet.
+
+        Args:
+            size (int): the minimum number of values that must be available after refilling.
+
+        """
+        cursor = self._cursor
+        remaining = self._block[cursor:]
+        new_block = self.np_random.standard_normal(
+            max(self.block_size, size - len(remaining))
+        )
+        self._block = np.concatenate([remaining, new_block])
+        self._cursor = 0
+
+    def standard_normal(self, size: int) -> np.ndarray:
+        """Returns the next `size` standard normals from the pool.
+
+        Args:
+            size (int): size
+
+        Returns:
+            np.ndarray: a `(size,)` array, this is a view into the pool and must not be modified in place.
+
+        """
+        if self._cursor + size > len(self._block):
+            self._refill(size)
+
+        start, end = self._cursor, self._cursor + size
+        values = self._block[start:end]
+        self._cursor = end
+        return values
+
+    def normal(self, loc: float = 0.0, size: None | int = None) -> float | np.ndarray:
+        """Draws from a normal distribution with unit scale, matching the normal draws of `np.random.Generator` with the same mean and size.
+
+        Args:
+            loc (float): mean of the distribution.
+            size (None | int): number of samples, a single float is returned if None.
+
+        Returns:
+            float | np.ndarray:
+
+        """
+        if size is None:
+            return loc + float(self.standard_normal(1)[0])
+        return loc + self.standard_normal(size)
@@ -0,0 +1,122 @@
+"""A process-wide cache of drone parameter files, and of the constants derived from them."""
+
+from __future__ import annotations
+
+import copy
+import os
+from typing import Any, Callable, TypeVar
+
+import numpy as np
+import yaml
+
+T = TypeVar("T")
+
+# (path, modification time, size) -> parsed parameter file
+_PARSED_PARAMS: dict[tuple[str, int, int], dict[str, Any]] = dict()
+
+# (path, modification time, size, derive function) -> derived constants
+_DERIVED_PARAMS: dict[tuple[str, int, int, Callable], Any] = dict()
+
+
+def _file_key(path: str) -> tuple[str, int, int]:
+    """Identifies a version of a file, editing the file invalidates everything cached from it.
+
+    Args:
+        path (str): path to the file.
+
+    Returns:
+        tuple[str, int, int]: absolute path, modification time in nanoseconds, and size in bytes.
+
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _parsed_params(path: str) -> dict[str, Any]:
+    """Parses a parameter file, or returns the cached result if the file has not changed since.
+
+    Args:
+        path (str): path to the `.yaml` file.
+
+    Returns:
+        dict[str, Any]: the shared parsed parameters, these must not be modified.
+
+    """
+    key = _file_key(path)
+    if key not in _PARSED_PARAMS:
+        # drop whatever was cached from older versions of this file
+        for cache in (_PARSED_PARAMS, _DERIVED_PARAMS):
+            for stale_key in [k for k in cache if k[0] == key[0]]:
+                del cache[stale_key]
+
+        with open(path, "rb") as f:
+            _PARSED_PARAMS[key] = yaml.safe_load(f)
+
+    return _PARSED_PARAMS[key]
+
+
+def _freeze(value: T) -> T:
+    """Marks all arrays in a nest of dicts, lists and tuples as read-only.
+
+    Args:
+        value (T): derived constants.
+
+    Returns:
+        T: the same constants.
+
+    """
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _freeze(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _freeze(item)
+    return value
+
+
+def load_params(path: str) -> dict[str, Any]:
+    """Loads a drone parameter file, only parsing it again if it was modified since the last load.
+
+    Args:
+        path (str): path to the `.yaml` file.
+
+    Returns:
+        dict[str, Any]: a copy of the parameters that the caller is free to modify.
+
+    """
+    return copy.deepcopy(_parsed_params(path))
+
+
+def derive_params(path: str, derive: Callable[[dict[str, Any]], T]) -> T:
+    """Computes constants from a drone parameter file once, and shares them with every later drone built from the same file.
+
+    Example:
+        >>> def _derive_params(all_params: dict[str, Any]) -> dict[str, np.ndarray]:
+        >>>     motor_params = all_params["motor_params"]
+        >>>     return dict(tau=np.array([motor_params["tau"]]))
+        >>>
+        >>> params = derive_params(self.param_path, _derive_params)
+
+    Args:
+        path (str): path to the `.yaml` file.
+        derive (Callable[[dict[str, Any]], T]): computes the constants from the parsed parameters, this must be a pure function that does not modify its input.
+
+    Returns:
+        T: the shared constants, all arrays in them are read-only.
+
+    """
+    key = (*_file_key(path), derive)
+    if key not in _DERIVED_PARAMS:
+        params = _parsed_params(path)
+        _DERIVED_PARAMS[key] = _freeze(derive(params))
+
+    return _DERIVED_PARAMS[key]
+
+
+def clear_param_cache() -> None:
+    """Drops all cached parameters, the next load parses every file again."""
+    _PARSED_PARAMS.clear()
+    _DERIVED_PARAMS.clear()
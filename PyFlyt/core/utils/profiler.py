@@ -0,0 +1,176 @@
+"""Wall time instrumentation for the phases of `Aviary.step`."""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from typing import Any, Callable, ContextManager, Sequence
+
+
+class _PhaseTimer:
+    """Times the body of a `with` block against a phase of a `StepProfiler`."""
+
+    __slots__ = ("profiler", "phase", "group", "start")
+
+    def __init__(self, profiler: StepProfiler, phase: str, group: str):
+        """__init__.
+
+        Args:
+            profiler (StepProfiler): the profiler to record to
+            phase (str): name of the phase
+            group (str): name of the group within the phase
+
+        """
+        self.profiler = profiler
+        self.phase = phase
+        self.group = group
+
+    def __enter__(self) -> None:
+        """Starts the timer."""
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Records the time since the timer was started.
+
+        Args:
+            *exc_info (Any): exception info, if any
+
+        """
+        self.profiler.lap(self.phase, self.start, self.group)
+
+
+class StepProfiler:
+    """Accumulates call counts and wall times for each phase of `Aviary.step`, grouped by drone type.
+
+    Phases that run once for the whole simulation, such as `stepSimulation`, are grouped under `"all"`.
+    """
+
+    def __init__(self):
+        """__init__."""
+        self._calls: dict[tuple[str, str], int] = dict()
+        self._times: dict[tuple[str, str], float] = dict()
+
+    def record(self, phase: str, group: str, elapsed: float) -> None:
+        """Records one call of a phase.
+
+        Args:
+            phase (str): name of the phase
+            group (str): name of the group within the phase, usually the drone type
+            elapsed (float): wall time taken in seconds
+
+        """
+        key = (phase, group)
+        self._calls[key] = self._calls.get(key, 0) + 1
+        self._times[key] = self._times.get(key, 0.0) + elapsed
+
+    def lap(self, phase: str, start: float, group: str = "all") -> float:
+        """Records the time since `start` against a phase and returns the current time for the next lap.
+
+        Args:
+            phase (str): name of the phase
+            start (float): the `time.perf_counter` at the start of the phase
+            group (str): name of the group within the phase
+
+        Returns:
+            float: the current `time.perf_counter`
+
+        """
+        now = time.perf_counter()
+        self.record(phase, group, now - start)
+        return now
+
+    def phase(self, phase: str, group: str = "all") -> ContextManager[None]:
+        """Times the body of a `with` block against a phase.
+
+        Args:
+            phase (str): name of the phase
+            group (str): name of the group within the phase
+
+        Returns:
+            ContextManager[None]:
+
+        """
+        return _PhaseTimer(self, phase, group)
+
+    def run_each(
+        self, phase: str, drones: Sequence[Any], method: str, *args: Any
+    ) -> None:
+        """Calls a method on each drone, timing each call against the drone's type.
+
+        Args:
+            phase (str): name of the phase
+            drones (Sequence[Any]): drones to call the method on
+            method (str): name of the method
+            *args (Any): arguments to the method
+
+        """
+        for drone in drones:
+            start = time.perf_counter()
+            getattr(drone, method)(*args)
+            self.lap(phase, start, type(drone).__name__)
+
+    def run(self, phase: str, group: str, function: Callable[[], Any]) -> None:
+        """Calls a function, timing it against a phase.
+
+        Args:
+            phase (str): name of the phase
+            group (str): name of the group within the phase
+            function (Callable[[], Any]): function to call
+
+        """
+        start = time.perf_counter()
+        function()
+        self.lap(phase, start, group)
+
+    def stats(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Returns the accumulated statistics as a JSON serializable dictionary.
+
+        This is a nested dictionary of `{phase: {group: {"calls", "total_time", "time_per_call"}}}`, with times in seconds.
+
+        Returns:
+            dict[str, dict[str, dict[str, float]]]:
+
+        """
+        stats: dict[str, dict[str, dict[str, float]]] = dict()
+        for (phase, group), calls in self._calls.items():
+            total_time = self._times[(phase, group)]
+            stats.setdefault(phase, dict())[group] = dict(
+                calls=calls,
+                total_time=total_time,
+                time_per_call=total_time / calls,
+            )
+        return stats
+
+
+class NullProfiler:
+    """Stands in for a `StepProfiler` while profiling is off, running every phase untimed at next to no cost."""
+
+    _NO_TIMER: ContextManager[None] = contextlib.nullcontext()
+
+    def phase(self, phase: str, group: str = "all") -> ContextManager[None]:
+        """Runs the body of a `with` block untimed.
+
+        Args:
+            phase (str): name of the phase
+            group (str): name of the group within the phase
+
+        Returns:
+            ContextManager[None]:
+
+        """
+        return self._NO_TIMER
+
+    def run_each(
+        self, phase: str, drones: Sequence[Any], method: str, *args: Any
+    ) -> None:
+        """Calls a method on each drone.
+
+        Args:
+            phase (str): name of the phase
+            drones (Sequence[Any]): drones to call the method on
+            method (str): name of the method
+            *args (Any): arguments to the method
+
+        """
+        for drone in drones:
+            getattr(drone, method)(*args)
@@ -0,0 +1,75 @@
+"""Cheap checks for setpoints and controller outputs at the boundaries of the simulation."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from PyFlyt.core.utils.compile_helpers import jitter
+
+
+@jitter
+def _jitted_all_finite(values: np.ndarray) -> bool:
+    """Returns whether all values are finite.
+
+    Args:
+        values (np.ndarray): 1D array of values
+
+    Returns:
+        bool:
+
+    """
+    for i in range(values.shape[0]):
+        if not np.isfinite(values[i]):
+            return False
+    return True
+
+
+@jitter
+def _jitted_all_within(values: np.ndarray, low: np.ndarray, high: np.ndarray) -> bool:
+    """Returns whether all values are within their bounds, NaNs are never within bounds.
+
+    Args:
+        values (np.ndarray): 1D array of values
+        low (np.ndarray): 1D array of lower bounds
+        high (np.ndarray): 1D array of upper bounds
+
+    Returns:
+        bool:
+
+    """
+    for i in range(values.shape[0]):
+        if not (low[i] <= values[i] <= high[i]):
+            return False
+    return True
+
+
+def check_finite(name: str, values: np.ndarray) -> None:
+    """Raises a ValueError if any values are NaN or infinite.
+
+    Args:
+        name (str): name of the values for the error message
+        values (np.ndarray): values
+
+    """
+    flat = np.ravel(np.asarray(values, dtype=np.float64))
+    if not _jitted_all_finite(flat):
+        raise ValueError(f"`{name}` must be finite, got {values}.")
+
+
+def check_bounds(
+    name: str, values: np.ndarray, low: np.ndarray, high: np.ndarray
+) -> None:
+    """Raises a ValueError if any values are outside `[low, high]`, or are NaN.
+
+    Args:
+        name (str): name of the values for the error message
+        values (np.ndarray): values
+        low (np.ndarray): flat array of lower bounds, the same size as `values`
+        high (np.ndarray): flat array of upper bounds, the same size as `values`
+
+    """
+    flat = np.ravel(np.asarray(values, dtype=np.float64))
+    if flat.shape != low.shape or not _jitted_all_within(flat, low, high):
+        raise ValueError(
+            f"`{name}` must be of size {low.shape[0]} with values between {low} and {high}, got {values}."
+        )
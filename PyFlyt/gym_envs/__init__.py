@@ -1,8 +1,18 @@
 """Registers PyFlyt environments into Gymnasium."""
 
+from typing import TYPE_CHECKING
+
 from gymnasium.envs.registration import register
 
-from PyFlyt.gym_envs.utils.flatten_waypoint_env import FlattenWaypointEnv
+from PyFlyt.core.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from PyFlyt.gym_envs.utils.flatten_waypoint_env import FlattenWaypointEnv
+
+# environments are only imported by `gymnasium.make`, through their entry points
+_MEMBERS = {"FlattenWaypointEnv": (".utils.flatten_waypoint_env", "FlattenWaypointEnv")}
+__all__ = list(_MEMBERS)
+__getattr__, __dir__ = lazy_imports(__name__, _MEMBERS)
 
 # QuadX Envs
 register(
@@ -29,6 +29,7 @@ class FixedwingBaseEnv(gymnasium.Env):
         agent_hz: int = 30,
         render_mode: None | Literal["human", "rgb_array"] = None,
         render_resolution: tuple[int, int] = (480, 480),
+        snapshot_resets: bool = False,
     ):
         """__init__.
 
@@ -42,6 +43,7 @@ class FixedwingBaseEnv(gymnasium.Env):
             agent_hz (int): agent_hz
             render_mode (None | Literal["human", "rgb_array"]): render_mode
             render_resolution (tuple[int, int]): render_resolution
+            snapshot_resets (bool): whether to soft reset the world and restore the drones from a snapshot taken after the first stabilization, instead of rebuilding and stabilizing it every episode. Every episode then starts from the same stabilized state regardless of seed.
 
         """
         if 120 % agent_hz != 0:
@@ -57,6 +59,7 @@ class FixedwingBaseEnv(gymnasium.Env):
             )
         self.render_mode = render_mode
         self.render_resolution = render_resolution
+        self.snapshot_resets = snapshot_resets
 
         """GYMNASIUM STUFF"""
         # attitude size increases by 1 for quaternion
@@ -130,10 +133,6 @@ class FixedwingBaseEnv(gymnasium.Env):
         """The first half of the reset function."""
         super().reset(seed=seed)
 
-        # if we already have an env, disconnect from it
-        if hasattr(self, "env"):
-            self.env.disconnect()
-
         self.step_count = 0
         self.termination = False
         self.truncation = False
@@ -157,19 +156,52 @@ class FixedwingBaseEnv(gymnasium.Env):
         )
         drone_options["camera_fps"] = int(120 / self.env_step_ratio)
 
-        # init env
-        self.env = Aviary(
-            start_pos=self.start_pos,
-            start_orn=self.start_orn,
-            drone_type="fixedwing",
-            render=self.render_mode == "human",
-            drone_options=drone_options,
-            np_random=self.np_random,
-        )
+        # reuse the last episode's world if possible, keeping a single shared generator
+        if self.snapshot_resets and self._can_reuse_aviary(drone_options):
+            self.env.reseed(self.np_random)
+            self.np_random = self.env.np_random
+            self.env.reset(soft=True)
+        else:
+            # if we already have an env, disconnect from it
+            if hasattr(self, "env"):
+                self.env.disconnect()
+
+            # init env
+            self.env = Aviary(
+                start_pos=self.start_pos,
+                start_orn=self.start_orn,
+                drone_type="fixedwing",
+                render=self.render_mode == "human",
+                drone_options=drone_options,
+                np_random=self.np_random,
+            )
+            self._aviary_options = drone_options
+            self._aviary_num_bodies = self.env.getNumBodies()
 
         if self.render_mode == "human":
             self.camera_parameters = self.env.getDebugVisualizerCamera()
 
+    def _can_reuse_aviary(self, drone_options: dict[str, Any]) -> bool:
+        """Checks whether the last episode's aviary can be soft reset instead of rebuilt.
+
+        This requires that nothing but the drones is left in the world, and that the drones use the same options as before.
+
+        Args:
+            drone_options (dict[str, Any]): drone options for the coming episode.
+
+        Returns:
+            bool:
+
+        """
+        if not hasattr(self, "env") or not self.env.isConnected():
+            return False
+        if self.env.getNumBodies() != self._aviary_num_bodies:
+            return False
+        return drone_options.keys() == self._aviary_options.keys() and all(
+            np.array_equal(value, self._aviary_options[key])
+            for key, value in drone_options.items()
+        )
+
     def end_reset(
         self, seed: None | int = None, options: None | dict[str, Any] = dict()
     ) -> None:
@@ -180,9 +212,13 @@ class FixedwingBaseEnv(gymnasium.Env):
         # set flight mode
         self.env.set_mode(self.flight_mode)
 
-        # wait for env to stabilize
-        for _ in range(10):
-            self.env.step()
+        # wait for env to stabilize, with `snapshot_resets` this is cached for worlds holding nothing but the drones,
+        # anything else spawned in by the task may be randomized per episode
+        if self.snapshot_resets and self.env.getNumBodies() == self._aviary_num_bodies:
+            self.env.stabilize(10)
+        else:
+            for _ in range(10):
+                self.env.step()
 
         self.compute_state()
 
@@ -230,7 +266,7 @@ class FixedwingBaseEnv(gymnasium.Env):
             self.truncation |= True
 
         # collision
-        if np.any(self.env.contact_array):
+        if self.env.contact_array.any():
             self.reward = -100.0
             self.info["collision"] = True
             self.termination |= True
@@ -28,6 +28,7 @@ class FixedwingWaypointsEnv(FixedwingBaseEnv):
         agent_hz (int): looprate of the agent to environment interaction.
         render_mode (None | Literal["human", "rgb_array"]): render_mode
         render_resolution (tuple[int, int]): render_resolution
+        snapshot_resets (bool): whether every episode after the first restores the same stabilized world from a snapshot instead of rebuilding it.
 
     """
 
@@ -43,6 +44,7 @@ class FixedwingWaypointsEnv(FixedwingBaseEnv):
         agent_hz: int = 30,
         render_mode: None | Literal["human", "rgb_array"] = None,
         render_resolution: tuple[int, int] = (480, 480),
+        snapshot_resets: bool = False,
     ):
         """__init__.
 
@@ -57,6 +59,7 @@ class FixedwingWaypointsEnv(FixedwingBaseEnv):
             agent_hz (int): looprate of the agent to environment interaction.
             render_mode (None | Literal["human", "rgb_array"]): render_mode
             render_resolution (tuple[int, int]): render_resolution
+            snapshot_resets (bool): whether every episode after the first restores the same stabilized world from a snapshot instead of rebuilding it.
 
         """
         super().__init__(
@@ -68,6 +71,7 @@ class FixedwingWaypointsEnv(FixedwingBaseEnv):
             agent_hz=agent_hz,
             render_mode=render_mode,
             render_resolution=render_resolution,
+            snapshot_resets=snapshot_resets,
         )
 
         # define waypoints
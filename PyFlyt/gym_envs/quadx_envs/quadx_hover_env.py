@@ -24,6 +24,7 @@ class QuadXHoverEnv(QuadXBaseEnv):
         agent_hz (int): looprate of the agent to environment interaction.
         render_mode (None | Literal["human", "rgb_array"]): render_mode
         render_resolution (tuple[int, int]): render_resolution.
+        snapshot_resets (bool): whether every episode after the first restores the same stabilized world from a snapshot instead of rebuilding it.
 
     """
 
@@ -37,6 +38,7 @@ class QuadXHoverEnv(QuadXBaseEnv):
         agent_hz: int = 40,
         render_mode: None | Literal["human", "rgb_array"] = None,
         render_resolution: tuple[int, int] = (480, 480),
+        snapshot_resets: bool = False,
     ):
         """__init__.
 
@@ -49,6 +51,7 @@ class QuadXHoverEnv(QuadXBaseEnv):
             agent_hz (int): looprate of the agent to environment interaction.
             render_mode (None | Literal["human", "rgb_array"]): render_mode
             render_resolution (tuple[int, int]): render_resolution.
+            snapshot_resets (bool): whether every episode after the first restores the same stabilized world from a snapshot instead of rebuilding it.
 
         """
         super().__init__(
@@ -59,6 +62,7 @@ class QuadXHoverEnv(QuadXBaseEnv):
             agent_hz=agent_hz,
             render_mode=render_mode,
             render_resolution=render_resolution,
+            snapshot_resets=snapshot_resets,
         )
 
         """GYMNASIUM STUFF"""
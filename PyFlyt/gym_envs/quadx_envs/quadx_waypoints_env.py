@@ -30,6 +30,7 @@ class QuadXWaypointsEnv(QuadXBaseEnv):
         agent_hz (int): looprate of the agent to environment interaction.
         render_mode (None | Literal["human", "rgb_array"]): render_mode
         render_resolution (tuple[int, int]): render_resolution.
+        snapshot_resets (bool): whether every episode after the first restores the same stabilized world from a snapshot instead of rebuilding it.
 
     """
 
@@ -47,6 +48,7 @@ class QuadXWaypointsEnv(QuadXBaseEnv):
         agent_hz: int = 30,
         render_mode: None | Literal["human", "rgb_array"] = None,
         render_resolution: tuple[int, int] = (480, 480),
+        snapshot_resets: bool = False,
     ):
         """__init__.
 
@@ -63,6 +65,7 @@ class QuadXWaypointsEnv(QuadXBaseEnv):
             agent_hz (int): looprate of the agent to environment interaction.
             render_mode (None | Literal["human", "rgb_array"]): render_mode
             render_resolution (tuple[int, int]): render_resolution.
+            snapshot_resets (bool): whether every episode after the first restores the same stabilized world from a snapshot instead of rebuilding it.
 
         """
         super().__init__(
@@ -74,6 +77,7 @@ class QuadXWaypointsEnv(QuadXBaseEnv):
             agent_hz=agent_hz,
             render_mode=render_mode,
             render_resolution=render_resolution,
+            snapshot_resets=snapshot_resets,
         )
 
         # define waypoints
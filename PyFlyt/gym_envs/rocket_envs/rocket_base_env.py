@@ -308,11 +308,10 @@ class RocketBaseEnv(gymnasium.Env):
         # mask collisions if any
         collision_array = self.env.contact_array.copy()
         for i, j in zip(collision_ignore_mask[1:], collision_ignore_mask[:-1]):
-            collision_array[i, j] = False
-            collision_array[j, i] = False
+            collision_array.remove(i, j)
 
         # fatal collision or below ground
-        if np.any(collision_array) or self.env.state(0)[-1, -1] < 0.0:
+        if collision_array.any() or self.env.state(0)[-1, -1] < 0.0:
             self.info["fatal_collision"] = True
             self.termination |= True
 
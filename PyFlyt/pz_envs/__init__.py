@@ -1,6 +1,21 @@
 """Imports all PZ envs."""
 
-from .fixedwing_envs.ma_fixedwing_dogfight_env import (
-    MAFixedwingDogfightEnv as MAFixedwingDogfightEnvV2,
-)
-from .quadx_envs.ma_quadx_hover_env import MAQuadXHoverEnv as MAQuadXHoverEnvV2
+from typing import TYPE_CHECKING
+
+from PyFlyt.core.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .fixedwing_envs.ma_fixedwing_dogfight_env import (
+        MAFixedwingDogfightEnv as MAFixedwingDogfightEnvV2,
+    )
+    from .quadx_envs.ma_quadx_hover_env import MAQuadXHoverEnv as MAQuadXHoverEnvV2
+
+_MEMBERS = {
+    "MAFixedwingDogfightEnvV2": (
+        ".fixedwing_envs.ma_fixedwing_dogfight_env",
+        "MAFixedwingDogfightEnv",
+    ),
+    "MAQuadXHoverEnvV2": (".quadx_envs.ma_quadx_hover_env", "MAQuadXHoverEnv"),
+}
+__all__ = list(_MEMBERS)
+__getattr__, __dir__ = lazy_imports(__name__, _MEMBERS)
@@ -670,7 +670,10 @@ class MAFixedwingDogfightEnv(MAFixedwingBaseEnv):
         self.accumulated_terminations |= zero_healths
 
         # collision, override reward, not add
-        collisions = self.aviary.contact_array[self.drone_ids].sum(axis=-1) > 0
+        collisions = np.array(
+            [self.aviary.contact_array.in_contact(i) for i in self.drone_ids],
+            dtype=bool,
+        )
         self.accumulated_terminations |= collisions
         self.accumulated_rewards[collisions] = -1000.0
         self.healths[collisions] = 0.0
@@ -31,6 +31,7 @@ class MAQuadXBaseEnv(ParallelEnv):
         angle_representation: str = "euler",
         agent_hz: int = 40,
         render_mode: None | str = None,
+        snapshot_resets: bool = False,
     ):
         """__init__.
 
@@ -43,6 +44,7 @@ class MAQuadXBaseEnv(ParallelEnv):
             angle_representation (str): angle_representation
             agent_hz (int): agent_hz
             render_mode (None | str): render_mode
+            snapshot_resets (bool): whether to soft reset the world and restore the drones from a snapshot taken after the first stabilization, instead of rebuilding and stabilizing it every episode. Every episode then starts from the same stabilized state regardless of seed.
 
         """
         if 120 % agent_hz != 0:
@@ -57,6 +59,7 @@ class MAQuadXBaseEnv(ParallelEnv):
                 render_mode in self.metadata["render_modes"]
             ), f"Invalid render mode {render_mode}, only {self.metadata['render_modes']} allowed."
         self.render_mode = render_mode is not None
+        self.snapshot_resets = snapshot_resets
 
         """SPACES"""
         # attitude size increases by 1 for quaternion
@@ -212,11 +215,19 @@ class MAQuadXBaseEnv(ParallelEnv):
             None:
 
         """
+        self.step_count = 0
+        self.agents = self.possible_agents[:]
+
+        # reuse the last episode's world if possible
+        if self.snapshot_resets and self._can_reuse_aviary(drone_options):
+            if seed:
+                self.aviary.reseed(np.random.default_rng(seed))
+            self.aviary.reset(soft=True)
+            return
+
         # if we already have an env, disconnect from it
         if hasattr(self, "aviary"):
             self.aviary.disconnect()
-        self.step_count = 0
-        self.agents = self.possible_agents[:]
 
         # rebuild the environment
         self.aviary = Aviary(
@@ -227,6 +238,41 @@ class MAQuadXBaseEnv(ParallelEnv):
             drone_options=drone_options,
             seed=seed,
         )
+        self._aviary_options = drone_options
+        self._aviary_num_bodies = self.aviary.getNumBodies()
+
+    def _can_reuse_aviary(
+        self, drone_options: None | dict[str, Any] | Sequence[dict[str, Any]]
+    ) -> bool:
+        """Checks whether the last episode's aviary can be soft reset instead of rebuilt.
+
+        This requires that nothing but the drones is left in the world, and that the drones use the same options as before.
+
+        Args:
+            drone_options (None | dict[str, Any] | Sequence[dict[str, Any]]): drone options for the coming episode.
+
+        Returns:
+            bool:
+
+        """
+        if not hasattr(self, "aviary") or not self.aviary.isConnected():
+            return False
+        if self.aviary.getNumBodies() != self._aviary_num_bodies:
+            return False
+
+        # compare per drone, a single dict applies to all drones
+        def as_list(options):
+            if isinstance(options, Sequence):
+                return [option or dict() for option in options]
+            return [options or dict()]
+
+        new_options = as_list(drone_options)
+        old_options = as_list(self._aviary_options)
+        return len(new_options) == len(old_options) and all(
+            new.keys() == old.keys()
+            and all(np.array_equal(value, old[key]) for key, value in new.items())
+            for new, old in zip(new_options, old_options)
+        )
 
     def end_reset(
         self, seed: None | int = None, options: None | dict[str, Any] = dict()
@@ -238,9 +284,16 @@ class MAQuadXBaseEnv(ParallelEnv):
         # set flight mode
         self.aviary.set_mode(self.flight_mode)
 
-        # wait for env to stabilize
-        for _ in range(10):
-            self.aviary.step()
+        # wait for env to stabilize, with `snapshot_resets` this is cached for worlds holding nothing but the drones,
+        # anything else spawned in by the task may be randomized per episode
+        if (
+            self.snapshot_resets
+            and self.aviary.getNumBodies() == self._aviary_num_bodies
+        ):
+            self.aviary.stabilize(10)
+        else:
+            for _ in range(10):
+                self.aviary.step()
         self.update_states()
 
     def update_states(self) -> None:
@@ -26,6 +26,7 @@ class MAQuadXHoverEnv(MAQuadXBaseEnv):
         angle_representation (Literal["euler", "quaternion"]): can be "euler" or "quaternion".
         agent_hz (int): looprate of the agent to environment interaction.
         render_mode (None | str): can be "human" or None.
+        snapshot_resets (bool): whether every episode after the first restores the same stabilized world from a snapshot instead of rebuilding it.
 
     """
 
@@ -49,6 +50,7 @@ class MAQuadXHoverEnv(MAQuadXBaseEnv):
         angle_representation: Literal["euler", "quaternion"] = "quaternion",
         agent_hz: int = 40,
         render_mode: None | str = None,
+        snapshot_resets: bool = False,
     ):
         """__init__.
 
@@ -62,6 +64,7 @@ class MAQuadXHoverEnv(MAQuadXBaseEnv):
             angle_representation (Literal["euler", "quaternion"]): can be "euler" or "quaternion".
             agent_hz (int): looprate of the agent to environment interaction.
             render_mode (None | str): can be "human" or None.
+            snapshot_resets (bool): whether every episode after the first restores the same stabilized world from a snapshot instead of rebuilding it.
 
         """
         super().__init__(
@@ -73,6 +76,7 @@ class MAQuadXHoverEnv(MAQuadXBaseEnv):
             angle_representation=angle_representation,
             agent_hz=agent_hz,
             render_mode=render_mode,
+            snapshot_resets=snapshot_resets,
         )
         self.sparse_reward = sparse_reward
 
@@ -178,7 +182,7 @@ class MAQuadXHoverEnv(MAQuadXBaseEnv):
         info = dict()
 
         # collision
-        if np.any(self.aviary.contact_array[self.aviary.drones[agent_id].Id]):
+        if self.aviary.contact_array.in_contact(self.aviary.drones[agent_id].Id):
             reward -= 100.0
             info["collision"] = True
             term |= True
@@ -156,7 +156,7 @@ class RocketBrick(DroneClass):
 
         # the default mode
         if self.mode == 0:
-            self.cmd = self.setpoint
+            self.cmd = self.setpoint.copy()
             return
 
         # otherwise, check that we have a custom controller
@@ -165,8 +165,11 @@ class RocketBrick(DroneClass):
                 f"Don't have other modes aside from 0, received {self.mode}."
             )
 
-        # custom controllers run if any
-        self.cmd = self.instanced_controllers[self.mode].step(self.state, self.setpoint)
+        # custom controllers run if any, copied since a pass-through controller would alias the shared setpoint buffer
+        self.cmd = np.array(
+            self.instanced_controllers[self.mode].step(self.state, self.setpoint),
+            dtype=np.float64,
+        )
 
     def update_physics(self) -> None:
         """Updates the physics of the vehicle."""
@@ -2,12 +2,39 @@
 
 from __future__ import annotations
 
+import copy
+import json
+import os
+import pickle
+import subprocess
+import sys
+
 import numpy as np
+import pybullet
 import pytest
 from custom_uavs.rocket_brick import RocketBrick
-
-from PyFlyt.core import Aviary
-from PyFlyt.core.abstractions import ControlClass, WindFieldClass
+from pybullet_utils import bullet_client
+
+import PyFlyt
+from PyFlyt.core import Aviary, load_objs_batch, obj_collision, obj_visual
+from PyFlyt.core.abstractions import (
+    PID,
+    AeroTable,
+    ControlClass,
+    Gimbals,
+    Motors,
+    WindFieldClass,
+)
+from PyFlyt.core.abstractions.lifting_surfaces import (
+    _jitted_compute_aero_data,
+    _jitted_compute_aoa_freestream,
+    _jitted_compute_force_torque,
+)
+from PyFlyt.core.drones import QuadX
+from PyFlyt.core.utils import compile_helpers
+from PyFlyt.core.utils.contact_array import ContactArray
+from PyFlyt.core.utils.noise_pool import NoisePool
+from PyFlyt.core.utils.param_cache import derive_params, load_params
 
 
 def test_simple_spawn():
@@ -192,6 +219,32 @@ def test_custom_controller():
     env.disconnect()
 
 
+def test_pid_copy():
+    """Tests that PID controllers carry their internal state through pickling and deepcopies."""
+    controller = PID(
+        np.array([1.0, 2.0]),
+        np.array([0.5, 0.5]),
+        np.array([0.1, 0.1]),
+        np.array([10.0, 10.0]),
+        0.01,
+    )
+    for _ in range(10):
+        controller.step(np.zeros(2), np.ones(2))
+
+    for clone_fn in (copy.deepcopy, lambda c: pickle.loads(pickle.dumps(c))):
+        clone = clone_fn(controller)
+        assert np.array_equal(clone._integral, controller._integral)
+        assert not np.shares_memory(clone._integral, controller._integral)
+        assert np.array_equal(
+            clone.step(np.zeros(2), np.ones(2)),
+            controller.step(np.zeros(2), np.ones(2)),
+        )
+        assert np.array_equal(
+            clone.step(-np.ones(2), np.ones(2)),
+            controller.step(-np.ones(2), np.ones(2)),
+        )
+
+
 def test_custom_uav():
     """Tests spawning in a custom UAV."""
     # the starting position and orientations
@@ -222,6 +275,11 @@ def test_custom_uav():
         if i > 100:
             env.set_all_setpoints(np.array([[1.0, 1.0]]))
 
+    # the command is a copy, writing new setpoints only takes effect on the next control update
+    assert not np.shares_memory(env.drones[0].cmd, env.drones[0].setpoint)
+    env.set_all_setpoints(np.array([[0.0, 0.0]]))
+    assert np.array_equal(env.drones[0].cmd, [1.0, 1.0])
+
     env.disconnect()
 
 
@@ -259,6 +317,731 @@ def test_mixed_drones():
     env.disconnect()
 
 
+def test_fleet_states():
+    """Tests that the fleet state buffer is shared with the drones and matches PyBullet."""
+    # the starting position and orientations
+    start_pos = np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 1.0]])
+    start_orn = np.array([[0.1, -0.2, 0.3], [0.0, 0.0, 1.0]])
+
+    # environment setup
+    env = Aviary(
+        start_pos=start_pos, start_orn=start_orn, render=False, drone_type="quadx"
+    )
+    all_states = env.all_states
+    assert all_states.shape == (2, 4, 3)
+
+    env.set_mode(7)
+    env.set_all_setpoints(np.array([[1.0, 1.0, 0.5, 2.0], [0.0, -1.0, 0.0, 1.0]]))
+    snapshot = env.save_snapshot("fleet")
+    for _ in range(2):
+        for i in range(50):
+            env.step()
+
+        # the buffer is updated in place and the drones hold views into it
+        assert env.all_states is all_states
+        for drone, state in zip(env.drones, all_states):
+            assert np.shares_memory(drone.state, all_states)
+            lin_pos, quaternion = env.getBasePositionAndOrientation(drone.Id)
+            lin_vel, ang_vel = env.getBaseVelocity(drone.Id)
+            rotation = np.array(env.getMatrixFromQuaternion(quaternion)).reshape(3, 3).T
+            expected = np.stack(
+                [
+                    rotation @ ang_vel,
+                    env.getEulerFromQuaternion(quaternion),
+                    rotation @ lin_vel,
+                    lin_pos,
+                ]
+            )
+            assert np.allclose(state, expected)
+            assert np.allclose(drone.rotation, rotation)
+
+        # and stay bound after restoring a snapshot
+        assert env.restore_snapshot(snapshot)
+
+    env.disconnect()
+
+
+def test_setpoint_buffers():
+    """Tests that drone setpoints are views into shared setpoint buffers, grouped by shape."""
+    # the starting position and orientations
+    start_pos = np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [0.0, 0.0, 5.0]])
+    start_orn = np.zeros_like(start_pos)
+
+    # environment setup
+    env = Aviary(
+        start_pos=start_pos,
+        start_orn=start_orn,
+        render=False,
+        drone_type=["quadx", "quadx", "fixedwing"],
+    )
+
+    # the two quadx share a buffer, the fixedwing is in a group of its own
+    env.set_mode([7, 7, 0])
+    groups = env.setpoint_groups
+    indices, buffer = groups[(4,)]
+    assert np.all(indices == [0, 1, 2])
+    buffer[...] = 1.0
+    assert all(np.all(drone.setpoint == 1.0) for drone in env.drones)
+
+    # switching the fixedwing to direct surface control changes its setpoint size
+    env.drones[2].set_mode(-1)
+    env.step()
+    groups = env.setpoint_groups
+    assert np.all(groups[(4,)][0] == [0, 1])
+    assert np.all(groups[(6,)][0] == [2])
+    with pytest.raises(ValueError):
+        env.setpoints
+
+    # batched writes go straight to the drones
+    env.set_setpoint(2, np.zeros(6))
+    setpoints = np.array([[0.0, 0.0, 0.0, 2.0], [1.0, 1.0, 0.0, 2.0]])
+    groups[(4,)][1][...] = setpoints
+    for _ in range(500):
+        env.step()
+    assert np.allclose(env.state(0)[-1], setpoints[0, [0, 1, 3]], atol=0.2)
+    assert np.allclose(env.state(1)[-1], setpoints[1, [0, 1, 3]], atol=0.2)
+
+    # commands never alias the shared buffers, even from controllers that pass the setpoint through
+    class PassThrough(ControlClass):
+        """A custom controller that outputs its setpoint."""
+
+        def reset(self):
+            """Nothing to reset."""
+            pass
+
+        def step(self, state: np.ndarray, setpoint: np.ndarray):
+            """Returns the setpoint itself.
+
+            Args:
+                state (np.ndarray): Current state of the UAV
+                setpoint (np.ndarray): Desired setpoint
+
+            """
+            return setpoint
+
+    for drone, base_mode in zip(env.drones, [7, 7, 0]):
+        drone.register_controller(
+            controller_id=8, controller_constructor=PassThrough, base_mode=base_mode
+        )
+        drone.set_mode(8)
+    assert not np.shares_memory(
+        env.drones[0].control_command()[1], env.drones[0].setpoint
+    )
+    env.drones[0].set_mode(0)
+    assert not np.shares_memory(
+        env.drones[0].control_command()[1], env.drones[0].setpoint
+    )
+    env.drones[0].set_mode(8)
+
+    env.step()
+    fixedwing = env.drones[2]
+    assert not np.shares_memory(fixedwing.cmd, fixedwing.setpoint)
+    cmd = fixedwing.cmd.copy()
+    env.set_setpoint(2, np.full(6, 0.5))
+    assert np.array_equal(fixedwing.cmd, cmd)
+
+    env.disconnect()
+
+
+def test_update_schedule():
+    """Tests that drones running at different looprates only get updated when they are due."""
+    # the starting position and orientations
+    start_pos = np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 1.0]])
+    start_orn = np.zeros_like(start_pos)
+
+    # environment setup, the first drone runs control at half the rate of the second
+    env = Aviary(
+        start_pos=start_pos,
+        start_orn=start_orn,
+        render=False,
+        drone_type="quadx",
+        drone_options=[
+            dict(control_hz=120, use_camera=True, camera_fps=60),
+            dict(control_hz=240),
+        ],
+    )
+
+    # count the calls to each drone
+    counts = np.zeros((2, 2), dtype=int)
+
+    def counted(method, i, j):
+        def wrapper(*args, **kwargs):
+            counts[i, j] += 1
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    for i, drone in enumerate(env.drones):
+        drone.update_control = counted(drone.update_control, i, 0)
+        drone.update_last = counted(drone.update_last, i, 1)
+
+    for _ in range(120):
+        env.step()
+
+    # 1 second of simulation
+    assert np.all(counts == [[120, 60], [240, 0]])
+
+    env.disconnect()
+
+
+def test_quadx_fleet():
+    """Tests that batched QuadX physics and control matches updating each drone individually."""
+    # the starting position and orientations
+    start_pos = np.array([[x, y, 1.0] for x in range(3) for y in range(3)])
+    start_orn = np.zeros_like(start_pos)
+    setpoints = np.random.default_rng(0).uniform(-1.0, 1.0, size=(9, 4))
+    setpoints[:, -1] += 2.0
+
+    states = []
+    for batched in [True, False]:
+        env = Aviary(
+            start_pos=start_pos,
+            start_orn=start_orn,
+            render=False,
+            drone_type="quadx",
+            seed=42,
+        )
+        assert env._fleet is not None and env._control_fleet is not None
+        if not batched:
+            env._fleet = None
+            env._control_fleet = None
+
+        # drones in every flight mode
+        env.set_mode([*range(8), 7])
+        env.set_all_setpoints(setpoints)
+        for _ in range(200):
+            env.step()
+
+        states.append(env.all_states.copy())
+        env.disconnect()
+
+    assert np.array_equal(states[0], states[1])
+
+
+def test_quadx_fleet_views():
+    """Tests that the drones view the fleet's runtime arrays, including after resets and restores, with lumped motors and disarmed drones."""
+    start_pos = np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [2.0, 0.0, 1.0]])
+    start_orn = np.zeros_like(start_pos)
+
+    states = []
+    for batched in [True, False]:
+        env = Aviary(
+            start_pos=start_pos,
+            start_orn=start_orn,
+            render=False,
+            drone_type="quadx",
+            drone_options=dict(lumped_motors=True),
+            seed=42,
+        )
+        env.set_armed([True, False, True])
+        env.set_mode(7)
+        env.set_all_setpoints(np.array([[1.0, 1.0, 0.0, 2.0]] * 3))
+        if not batched:
+            env._fleet = None
+            env._control_fleet = None
+
+        for _ in range(50):
+            env.step()
+        states.append(env.all_states.copy())
+
+        if batched:
+            snapshot = env.save_snapshot("views")
+            for _ in range(10):
+                env.step()
+            assert env.restore_snapshot(snapshot)
+            env.reset(soft=True)
+            env.set_armed([True, False, True])
+
+            # the fleet only covers the armed drones, and reads their rows of the state buffer
+            fleet = env._fleet
+            assert fleet is not None and fleet.num_drones == 2
+            assert np.array_equal(fleet.state_rows, [0, 2])
+            for i, drone in enumerate(env.armed_drones):
+                assert np.shares_memory(drone.pwm, fleet.pwm[i])
+                assert np.shares_memory(drone.motors.throttle, fleet.throttle[i])
+                assert np.shares_memory(
+                    drone.body.local_body_velocities, fleet.body_velocities[i]
+                )
+            env.step()
+            for i, drone in enumerate(env.armed_drones):
+                assert np.array_equal(drone.pwm, fleet.pwm[i])
+                assert np.any(drone.motors.throttle)
+
+        env.disconnect()
+
+    assert np.array_equal(states[0], states[1])
+
+
+def test_quadx_fleet_overrides():
+    """Tests that drones overriding `update_physics` are never batched past their override."""
+    calls = []
+
+    class DraggyQuadX(QuadX):
+        """A QuadX with some extra physics."""
+
+        def update_physics(self) -> None:
+            """Counts the calls on top of the usual physics."""
+            calls.append(self.Id)
+            super().update_physics()
+
+    start_pos = np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 1.0]])
+    start_orn = np.zeros_like(start_pos)
+
+    # overriding on the class
+    env = Aviary(
+        start_pos=start_pos,
+        start_orn=start_orn,
+        render=False,
+        drone_type="draggy",
+        drone_type_mappings=dict(draggy=DraggyQuadX),
+    )
+    assert env._fleet is None and env._control_fleet is None
+    env.step()
+    assert len(calls) == 2 * env.updates_per_step
+    env.disconnect()
+
+    # overriding on an instance, after the fleet was built
+    calls.clear()
+    env = Aviary(
+        start_pos=start_pos, start_orn=start_orn, render=False, drone_type="quadx"
+    )
+    assert env._fleet is not None
+    drone = env.drones[0]
+    drone.update_physics = lambda: (
+        calls.append(drone.Id),
+        QuadX.update_physics(drone),
+    )
+    env.step()
+    assert calls == [drone.Id] * env.updates_per_step
+    env.disconnect()
+
+
+def test_quadx_without_aviary():
+    """Tests that a QuadX keeps its own state up to date when used with a plain bullet client."""
+    p = bullet_client.BulletClient(pybullet.DIRECT)
+    p.setGravity(0.0, 0.0, -9.81)
+    drone = QuadX(
+        p,
+        start_pos=np.array([0.0, 0.0, 1.0]),
+        start_orn=np.zeros(3),
+        physics_hz=240,
+        np_random=np.random.default_rng(0),
+    )
+    drone.reset()
+    drone.update_state()
+
+    # with no thrust, the drone falls and its state follows along
+    for step in range(100):
+        drone.update_control(step)
+        drone.update_physics()
+        p.stepSimulation()
+        drone.update_state()
+        position, quaternion = p.getBasePositionAndOrientation(drone.Id)
+        assert np.allclose(drone.state[-1], position)
+        assert np.allclose(drone.quaternion, quaternion)
+
+    assert drone.state[-1, -1] < 0.9
+    assert drone.state[2, -1] < 0.0
+    p.disconnect()
+
+
+def test_step_many():
+    """Tests stepping many times with trajectory recording and early termination."""
+    # the starting position and orientations
+    start_pos = np.array([[0.0, 0.0, 1.0], [0.0, 0.0, 10.0]])
+    start_orn = np.zeros_like(start_pos)
+
+    # environment setup
+    env = Aviary(
+        start_pos=start_pos,
+        start_orn=start_orn,
+        render=False,
+        drone_type=["quadx", "fixedwing"],
+        drone_options=[dict(), dict(starting_velocity=np.array([0.0, 0.0, 0.0]))],
+    )
+
+    trajectory = env.step_many(50)
+    assert trajectory["states"].shape == (50, 2, 4, 3)
+    assert trajectory["contacts"].shape == (50, 2)
+    assert np.array_equal(trajectory["states"][-1], env.all_states)
+    assert np.array_equal(trajectory["aux_states"][-1, 0, :4], env.aux_state(0))
+    assert np.all(np.isnan(trajectory["setpoints"][:, 0, 4:]))
+    assert env.aviary_steps == 50
+
+    # the quadx has no thrust, so it should eventually hit the floor
+    trajectory = env.step_many(
+        500, until=lambda aviary: aviary.in_contact(aviary.drones[0].Id)
+    )
+    assert len(trajectory["states"]) < 500
+    assert trajectory["contacts"][-1, 0]
+
+    assert env.step_many(10, record=False) == dict()
+
+    env.disconnect()
+
+
+def test_validation():
+    """Tests that bad setpoints and controller outputs are caught without strict mode."""
+    # the starting position and orientations
+    start_pos = np.array([[0.0, 0.0, 1.0], [0.0, 1.0, 10.0]])
+    start_orn = np.zeros_like(start_pos)
+
+    for strict in (False, True):
+        env = Aviary(
+            start_pos=start_pos,
+            start_orn=start_orn,
+            render=False,
+            drone_type=["quadx", "rocket"],
+            strict=strict,
+        )
+        assert env.drones[0].motors.strict == strict
+        assert env.drones[1].boosters.strict == strict
+
+        # setpoints are checked when they are set
+        with pytest.raises(ValueError):
+            env.set_setpoint(0, np.array([0.0, 0.0, np.nan, 0.0]))
+
+        # controller outputs are checked once per control step
+        env.drones[0].set_mode(-1)
+        env.set_setpoint(0, np.array([0.0, 0.0, 0.0, 2.0]))
+        with pytest.raises(ValueError):
+            env.step()
+
+        env.disconnect()
+
+
+def test_lumped_motors():
+    """Tests that lumped motor wrenches are equivalent to applying forces per motor link.
+
+    PyBullet applies per link forces using stale link poses, so these are refreshed for the per link path.
+    """
+    # the starting position and orientations
+    start_pos = np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 1.0]])
+    start_orn = np.array([[0.1, 0.2, 0.3], [0.0, 0.0, 0.0]])
+    setpoints = np.array([[0.3, -0.2, 0.1, 0.8], [0.0, 0.0, 0.3, 0.5]])
+
+    trajectories = []
+    for lumped in (False, True):
+        env = Aviary(
+            start_pos=start_pos,
+            start_orn=start_orn,
+            render=False,
+            drone_type="quadx",
+            drone_options=dict(lumped_motors=lumped),
+            seed=42,
+        )
+
+        # refresh link poses before the per link forces get applied
+        if not lumped:
+            env._fleet = None
+            for drone in env.drones:
+
+                def refreshed(pwm, rotation=None, drone=drone):
+                    for idx in drone.motors.motor_ids:
+                        env.getLinkState(drone.Id, idx, computeForwardKinematics=True)
+                    Motors.physics_update(drone.motors, pwm, rotation)
+
+                drone.motors.physics_update = refreshed
+
+        env.set_mode(0)
+        env.set_all_setpoints(setpoints)
+        trajectories.append(env.step_many(200)["states"].copy())
+        env.disconnect()
+
+    assert np.allclose(trajectories[0], trajectories[1], atol=1e-10)
+
+
+def test_lifting_surfaces():
+    """Tests that the batched kernel matches the per-surface aerodynamic model, and that each surface reads its state from the batch."""
+    env = Aviary(
+        start_pos=np.array([[0.0, 0.0, 10.0]]),
+        start_orn=np.zeros((1, 3)),
+        render=False,
+        drone_type="fixedwing",
+        drone_options=dict(starting_velocity=np.array([20.0, 0.0, 0.0])),
+        seed=42,
+    )
+    env.set_setpoint(0, np.array([0.3, -0.5, 0.2, 0.7]))
+    env.step_many(20)
+    surfaces = env.drones[0].lifting_surfaces
+
+    # each surface reads its own row of the batched state
+    assert np.any(surfaces.actuation != 0.0)
+    for i, surface in enumerate(surfaces.surfaces):
+        assert surface.actuation == surfaces.actuation[i]
+        assert surface.get_states() == surfaces.get_states()[i]
+        assert np.all(
+            surface.local_surface_velocity == surfaces.local_surface_velocities[i]
+        )
+
+    # one batched update against the model of each surface
+    cmd = np.linspace(-1.0, 1.0, len(surfaces.surfaces))
+    actuation = surfaces.actuation.copy()
+    forces, torques = surfaces._jitted_physics_update(
+        cmd,
+        surfaces.actuation.copy(),
+        surfaces.local_surface_velocities,
+        surfaces.physics_period,
+        surfaces.cmd_tau,
+        surfaces.lift_units,
+        surfaces.drag_units,
+        surfaces.torque_units,
+        surfaces.aspect,
+        surfaces.flap_to_chord,
+        surfaces.aero_tau,
+        surfaces.deflection_limit,
+        surfaces.eta,
+        surfaces.Cl_alpha_3D,
+        surfaces.alpha_stall_P_base,
+        surfaces.alpha_0_base,
+        surfaces.alpha_stall_N_base,
+        surfaces.Cd_0,
+        surfaces.half_rho,
+        surfaces.area,
+        surfaces.chord,
+        surfaces.use_tables,
+        surfaces.table_alphas,
+        surfaces.table_actuations,
+        surfaces.table_coefficients,
+    )
+    for i, surface in enumerate(surfaces.surfaces):
+        surface_actuation = actuation[i] + (
+            surface.physics_period / surface.cmd_tau
+        ) * (cmd[i] - actuation[i])
+        alpha, freestream_speed = _jitted_compute_aoa_freestream(
+            surface.local_surface_velocity, surface.lift_unit, surface.drag_unit
+        )
+        Cl, Cd, CM = _jitted_compute_aero_data(
+            alpha,
+            *surface.aero_params()[:3],
+            surface_actuation,
+            *surface.aero_params()[3:],
+        )
+        force, torque = _jitted_compute_force_torque(
+            alpha,
+            freestream_speed,
+            Cl,
+            Cd,
+            CM,
+            surface.half_rho,
+            surface.area,
+            surface.chord,
+            surface.lift_unit,
+            surface.drag_unit,
+            surface.torque_unit,
+        )
+        assert np.allclose(forces[i], force)
+        assert np.allclose(torques[i], torque)
+
+    env.disconnect()
+
+
+def test_link_state_cache():
+    """Tests that reading link states from the shared cache matches fetching them in each component."""
+    trajectories = []
+    for cached in (True, False):
+        env = Aviary(
+            start_pos=np.array([[0.0, 0.0, 10.0], [0.0, 5.0, 10.0]]),
+            start_orn=np.zeros((2, 3)),
+            render=False,
+            drone_type=["fixedwing", "rocket"],
+            drone_options=[
+                dict(starting_velocity=np.array([20.0, 0.0, 0.0])),
+                dict(),
+            ],
+            seed=42,
+        )
+        env.register_wind_field_function(lambda time, position: np.sin(position + time))
+
+        # the rocket booster is both a drag body and a finlet, so it is only fetched once
+        rocket = env.drones[1]
+        assert len(rocket.link_states.link_ids) == len(
+            set(rocket.bodies.body_ids) | set(rocket.lifting_surfaces.surface_ids)
+        )
+
+        if not cached:
+            for drone in env.drones:
+                for component in ("bodies", "lifting_surfaces"):
+                    if hasattr(drone, component):
+                        getattr(drone, component).link_state_cache = None
+
+        env.set_setpoint(0, np.array([0.3, -0.5, 0.2, 0.7]))
+        env.set_setpoint(1, np.array([0.2, -0.3, 0.1, 1.0, 0.8, 0.3, -0.2]))
+        trajectories.append(env.step_many(200)["states"].copy())
+        env.disconnect()
+
+    assert np.array_equal(trajectories[0], trajectories[1])
+
+
+def test_aero_tables(tmp_path):
+    """Tests tabulated aerodynamics against the analytic model, and loading and sharing of tables."""
+    env = Aviary(
+        start_pos=np.array([[0.0, 0.0, 10.0]]),
+        start_orn=np.zeros((1, 3)),
+        render=False,
+        drone_type="fixedwing",
+        drone_options=dict(use_aero_tables=True),
+    )
+    surfaces = env.drones[0].lifting_surfaces
+    assert surfaces.use_tables
+
+    # the left and right flapped wings are identical, so they share a table
+    tables = [surface.aero_table for surface in surfaces.surfaces]
+    assert tables[0] is tables[1]
+    assert all(table.max_error["Cl"] < 0.5 for table in tables)
+
+    # tables reproduce the analytic model on the grid points
+    params = surfaces.surfaces[0].aero_params()
+    alpha, actuation = tables[0].alphas[400], tables[0].actuations[5]
+    expected = _jitted_compute_aero_data(alpha, *params[:3], actuation, *params[3:])
+    assert np.allclose(tables[0].interpolate(alpha, actuation), expected)
+
+    # tables survive a round trip to disk
+    path = str(tmp_path / "table.npz")
+    tables[0].save(path)
+    loaded = AeroTable.load(path)
+    assert np.array_equal(loaded.coefficients, tables[0].coefficients)
+    surfaces.use_aero_tables([loaded] + [None] * (len(tables) - 1))
+    assert surfaces.surfaces[0].aero_table is loaded
+    assert loaded.max_error == tables[0].max_error
+
+    # switching back to the analytic model
+    surfaces.use_analytic_aero()
+    assert not surfaces.use_tables
+
+    env.disconnect()
+
+
+def test_booster_mass_updates():
+    """Tests that the fuel tank mass in bullet stays within the mass update tolerance of the true fuel mass."""
+    for tolerance in (0.0, 0.01):
+        env = Aviary(
+            start_pos=np.array([[0.0, 0.0, 10.0]]),
+            start_orn=np.zeros((1, 3)),
+            render=False,
+            drone_type="rocket",
+            drone_options=dict(
+                starting_fuel_ratio=1.0, mass_update_tolerance=tolerance
+            ),
+            seed=42,
+        )
+        boosters = env.drones[0].boosters
+
+        # ignite the booster
+        env.set_setpoint(0, np.array([0.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0]))
+        for _ in range(100):
+            env.step()
+            true_mass = boosters.ratio_fuel_remaining * boosters.total_fuel_mass
+            bullet_mass = env.getDynamicsInfo(
+                env.drones[0].Id, int(boosters.fueltank_ids[0])
+            )[0]
+            drift = abs(true_mass[0] - bullet_mass) / boosters.total_fuel_mass[0]
+
+            if tolerance == 0.0:
+                assert drift == 0.0
+            else:
+                assert drift <= tolerance
+            assert boosters.mass_drift[0] <= boosters.max_mass_drift <= tolerance
+
+        # some updates must have been skipped for a nonzero tolerance
+        if tolerance > 0.0:
+            assert boosters.max_mass_drift > 0.0
+
+        env.disconnect()
+
+
+def test_gimbals():
+    """Tests the fused gimbal rotations against the axis-angle formula, and that rotations are reused while the gimbals are still."""
+    env = Aviary(
+        start_pos=np.array([[0.0, 0.0, 1.0]]),
+        start_orn=np.zeros((1, 3)),
+        render=False,
+        drone_type="quadx",
+    )
+    gimbal_unit_1 = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+    gimbal_unit_2 = np.array([[0.0, 1.0, 0.0], [1.0, 0.0, 0.0]])
+    gimbals = Gimbals(
+        p=env,
+        physics_period=1.0 / 240.0,
+        np_random=env.np_random,
+        gimbal_unit_1=gimbal_unit_1.copy(),
+        gimbal_unit_2=gimbal_unit_2.copy(),
+        gimbal_tau=np.array([0.01, 0.05]),
+        gimbal_range_degrees=np.array([[10.0, 20.0], [30.0, 40.0]]),
+        rotation_tolerance=1e-6,
+    )
+    gimbals.reset()
+
+    def axis_angle(axis: np.ndarray, angle: float) -> np.ndarray:
+        w = np.cross(np.eye(3), axis)
+        return np.eye(3) + np.sin(angle) * w + (1.0 - np.cos(angle)) * (w @ w)
+
+    command = np.array([[0.5, -1.0], [1.0, 0.3]])
+    for _ in range(500):
+        rotation = gimbals.compute_rotation(command)
+        angles = gimbals.rotation_state * gimbals.gimbal_range_radians
+        for i in range(2):
+            expected = axis_angle(gimbal_unit_1[i], angles[i, 0]) @ axis_angle(
+                gimbal_unit_2[i], angles[i, 1]
+            )
+            np.testing.assert_allclose(rotation[i], expected, atol=1e-12)
+
+    # the gimbals have settled, so the rotations are kept within tolerance
+    assert np.all(np.abs(gimbals.gimbal_state - command) < 1e-6)
+    rotation_state = gimbals.rotation_state.copy()
+    gimbals.compute_rotation(command)
+    assert np.array_equal(gimbals.rotation_state, rotation_state)
+
+    env.disconnect()
+
+
+def test_profiling():
+    """Tests that profiling records every phase of step per drone type."""
+    # the starting position and orientations
+    start_pos = np.array([[0.0, 0.0, 1.0], [0.0, 1.0, 1.0], [0.0, 2.0, 10.0]])
+    start_orn = np.zeros_like(start_pos)
+
+    # environment setup
+    env = Aviary(
+        start_pos=start_pos,
+        start_orn=start_orn,
+        render=False,
+        drone_type=["quadx", "quadx", "fixedwing"],
+        drone_options=[dict(), dict(), dict(starting_velocity=np.zeros(3))],
+    )
+
+    # nothing is recorded until profiling is enabled
+    env.step()
+    assert env.profile_stats() == dict()
+
+    env.enable_profiling()
+    for _ in range(10):
+        env.step()
+    stats = env.profile_stats()
+
+    physics_steps = 10 * env.updates_per_step
+    assert stats["step"]["all"]["calls"] == 10
+    assert stats["step_simulation"]["all"]["calls"] == physics_steps
+    assert stats["physics"]["QuadX"]["calls"] == 2 * physics_steps
+    assert stats["state"]["Fixedwing"]["calls"] == physics_steps
+    assert stats["control"]["QuadX"]["calls"] == 2 * 10
+    for phase in ("contacts", "state_readout"):
+        assert phase in stats
+    for groups in stats.values():
+        for group in groups.values():
+            assert group["time_per_call"] * group["calls"] == pytest.approx(
+                group["total_time"]
+            )
+
+    # disabling keeps the statistics around
+    env.disable_profiling()
+    env.step()
+    assert env.profile_stats() == stats
+    json.dumps(stats)
+
+    env.disconnect()
+
+
 @pytest.mark.parametrize(
     "model",
     ["fixedwing", "rocket"],
@@ -338,3 +1121,523 @@ def test_custom_wind(model: str):
         env.step()
 
     env.disconnect()
+
+
+def test_soft_reset():
+    """Tests resetting the aviary in place without rebuilding the world."""
+    # the starting position and orientations
+    start_pos = np.array([[-1.0, 0.0, 1.0], [1.0, 0.0, 1.0]])
+    start_orn = np.zeros_like(start_pos)
+
+    # environment setup
+    env = Aviary(
+        start_pos=start_pos, start_orn=start_orn, render=False, drone_type="quadx"
+    )
+    drone_ids = [drone.Id for drone in env.drones]
+    num_bodies = env.getNumBodies()
+
+    # fly around for a bit
+    env.set_mode(7)
+    env.set_all_setpoints(np.array([[1.0, 1.0, 0.0, 2.0], [-1.0, 1.0, 0.0, 2.0]]))
+    for i in range(100):
+        env.step()
+
+    # soft reset to new starting positions, the same bodies must be reused
+    new_start_pos = np.array([[0.0, -1.0, 2.0], [0.0, 1.0, 2.0]])
+    env.reset(start_pos=new_start_pos, soft=True)
+    assert [drone.Id for drone in env.drones] == drone_ids
+    assert env.getNumBodies() == num_bodies
+    assert env.physics_steps == 0
+    for i in range(env.num_drones):
+        assert np.allclose(env.state(i)[-1], new_start_pos[i])
+        assert np.allclose(env.state(i)[0], 0.0)
+        assert np.allclose(env.aux_state(i), 0.0)
+
+    # changing the number of drones falls back to a full rebuild
+    env.reset(start_pos=new_start_pos[:1], start_orn=start_orn[:1], soft=True)
+    assert len(env.drones) == 1
+    assert np.allclose(env.state(0)[-1], new_start_pos[0])
+
+    env.set_mode(7)
+    for i in range(100):
+        env.step()
+
+    env.disconnect()
+
+
+def test_body_pool():
+    """Tests that full resets with a body pool park and reuse drone bodies, including those of custom drones."""
+    start_pos = np.array([[-1.0, 0.0, 1.0], [1.0, 0.0, 1.0], [0.0, 2.0, 1.0]])
+    start_orn = np.zeros_like(start_pos)
+
+    # environment setup
+    env = Aviary(
+        start_pos=start_pos,
+        start_orn=start_orn,
+        render=False,
+        drone_type=["quadx", "fixedwing", "rocket_brick"],
+        drone_type_mappings=dict(rocket_brick=RocketBrick),
+        use_body_pool=True,
+    )
+    drone_ids = [drone.Id for drone in env.drones]
+    num_bodies = env.getNumBodies()
+
+    # anything that is not a drone is removed on reset, the floor is kept
+    obstacle_id = env.loadURDF("sphere2.urdf", basePosition=[5.0, 0.0, 1.0])
+    for _ in range(100):
+        env.step()
+
+    # the same bodies are handed back to the same drones, as good as new
+    env.reset()
+    assert [drone.Id for drone in env.drones] == drone_ids
+    assert env.getNumBodies() == num_bodies
+    assert not env.body_pool.owns(obstacle_id)
+    assert env.body_pool.num_parked == 0
+    for i in range(env.num_drones):
+        assert np.allclose(env.state(i)[-1], start_pos[i])
+        assert np.allclose(env.state(i)[0], 0.0)
+
+    # resets are reproducible
+    trajectories = []
+    for _ in range(2):
+        env.reset()
+        env.np_random.bit_generator.state = np.random.default_rng(
+            42
+        ).bit_generator.state
+        env.noise_pool.reset()
+        env.set_setpoint(0, np.array([1.0, 1.0, 0.0, 2.0]))
+        for _ in range(100):
+            env.step()
+        trajectories.append(env.all_states)
+    assert np.array_equal(*trajectories)
+    env.disconnect()
+
+    # fewer drones leave the spare bodies parked and still, more drones take them back
+    env = Aviary(
+        start_pos=start_pos[:2],
+        start_orn=start_orn[:2],
+        render=False,
+        drone_type="quadx",
+        use_body_pool=True,
+    )
+    drone_ids = [drone.Id for drone in env.drones]
+    env.reset(start_pos=start_pos[:1], start_orn=start_orn[:1])
+    assert env.body_pool.num_parked == 1
+    assert env.body_pool.is_parked(drone_ids[1])
+    parked_position = env.getBasePositionAndOrientation(drone_ids[1])[0]
+    env.set_mode(7)
+    for _ in range(100):
+        env.step()
+    assert env.getBasePositionAndOrientation(drone_ids[1])[0] == parked_position
+    assert not env.in_contact(drone_ids[1])
+
+    env.reset(start_pos=start_pos[:2], start_orn=start_orn[:2])
+    assert [drone.Id for drone in env.drones] == drone_ids
+    assert env.body_pool.num_parked == 0
+    env.set_mode(7)
+    for _ in range(100):
+        env.step()
+    assert all(np.allclose(env.state(i)[-1], start_pos[i], atol=0.1) for i in range(2))
+    env.disconnect()
+
+
+@pytest.mark.parametrize("use_body_pool", [False, True])
+def test_spawn_remove_drone(use_body_pool: bool):
+    """Tests spawning and removing drones in a running simulation."""
+    env = Aviary(
+        start_pos=np.array([[0.0, 0.0, 1.0], [2.0, 0.0, 1.0]]),
+        start_orn=np.zeros((2, 3)),
+        render=False,
+        drone_type="quadx",
+        use_body_pool=use_body_pool,
+    )
+    env.set_mode(7)
+    for _ in range(10):
+        env.step()
+    removed_id = env.drones[0].Id
+    state = env.state(1).copy()
+
+    # remove a drone in contact with the floor, the others keep their states and remain batched
+    env.contact_array[env.planeId, removed_id] = True
+    env.remove_drone(0)
+    assert len(env.drones) == len(env.armed_drones) == 1
+    assert env.all_states.shape == (1, 4, 3)
+    assert np.array_equal(env.state(0), state)
+    assert not env.contact_array.in_contact(removed_id)
+    assert env._fleet is not None
+    assert env.body_pool is None or env.body_pool.is_parked(removed_id)
+
+    # spawn a drone with a slower looprate, every step then spans one of its control loops
+    index = env.spawn_drone(
+        "fixedwing", np.array([0.0, 0.0, 10.0]), np.zeros(3), dict(control_hz=60)
+    )
+    assert index == 1
+    assert len(env.drones) == len(env.armed_drones) == 2
+    assert np.allclose(env.state(index)[-1], [0.0, 0.0, 10.0])
+    assert env.updates_per_step == env.physics_hz // 60
+    env.remove_drone(index)
+    assert env.updates_per_step == env.physics_hz // 120
+
+    # spawned drones fly, and reuse parked bodies when pooled
+    index = env.spawn_drone("quadx", np.array([-2.0, 0.0, 1.0]), np.zeros(3))
+    assert env.body_pool is None or env.drones[index].Id == removed_id
+    env.drones[index].set_mode(7)
+    env.set_setpoint(index, np.array([-2.0, 1.0, 0.0, 2.0]))
+    for _ in range(500):
+        env.step()
+    assert np.allclose(env.state(index)[-1], [-2.0, 1.0, 2.0], atol=0.1)
+
+    # a full reset restores the spawn configuration
+    env.reset()
+    assert [type(drone).__name__ for drone in env.drones] == ["QuadX", "QuadX"]
+    env.disconnect()
+
+
+@pytest.mark.parametrize("use_body_pool", [False, True])
+def test_load_objs_batch(use_body_pool: bool):
+    """Tests spawning many obstacles at once from shared, cached shapes."""
+    env = Aviary(
+        start_pos=np.array([[0.0, 0.0, 1.0]]),
+        start_orn=np.zeros((1, 3)),
+        render=False,
+        drone_type="quadx",
+        use_body_pool=use_body_pool,
+    )
+
+    # identical meshes are only created once
+    collision_id = obj_collision(env, "duck.obj")
+    assert obj_collision(env, "duck.obj") == collision_id
+    assert obj_collision(env, "duck.obj", meshScale=[2.0, 2.0, 2.0]) != collision_id
+    assert obj_collision(env, "duck.obj", concave=True) != collision_id
+    visual_id = obj_visual(env, "duck.obj")
+    assert obj_visual(env, "duck.obj") == visual_id
+
+    # all instances are spawned where asked and registered for collisions
+    positions = np.stack([np.arange(100.0), np.zeros(100), np.zeros(100)], axis=-1)
+    num_bodies = env.getNumBodies()
+    body_ids = load_objs_batch(
+        env, positions, fileName="duck.obj", collisionId=collision_id
+    )
+    assert len(body_ids) == 100
+    assert env.getNumBodies() == num_bodies + 100
+    assert env.contact_array.num_bodies > max(body_ids)
+    for body_id, position in zip(body_ids, positions):
+        assert np.allclose(env.getBasePositionAndOrientation(body_id)[0], position)
+    assert load_objs_batch(env, np.zeros((0, 3)), fileName="duck.obj") == []
+
+    # shapes only outlive resets that keep them alive
+    env.reset()
+    assert bool(env.shape_cache) == use_body_pool
+    load_objs_batch(
+        env,
+        positions,
+        fileName="duck.obj",
+        collisionId=obj_collision(env, "duck.obj"),
+    )
+    for _ in range(10):
+        env.step()
+    env.disconnect()
+
+
+def test_snapshots():
+    """Tests caching and restoring a stabilized world."""
+    # the starting position and orientations
+    start_pos = np.array([[0.0, 0.0, 1.0]])
+    start_orn = np.array([[0.0, 0.0, 0.0]])
+
+    # environment setup
+    env = Aviary(
+        start_pos=start_pos, start_orn=start_orn, render=False, drone_type="quadx"
+    )
+
+    # nothing to restore yet
+    assert not env.restore_snapshot()
+
+    # stabilize and snapshot
+    env.set_mode(7)
+    for i in range(10):
+        env.step()
+    env.save_snapshot()
+    saved_state = env.state(0).copy()
+    saved_physics_steps = env.physics_steps
+
+    # go somewhere else, then restore through a soft reset
+    env.set_setpoint(0, np.array([1.0, 1.0, 0.0, 2.0]))
+    for i in range(100):
+        env.step()
+    env.reset(soft=True)
+    assert not env.restore_snapshot()
+    env.set_mode(7)
+    assert env.restore_snapshot()
+    assert np.allclose(env.state(0), saved_state)
+    assert env.physics_steps == saved_physics_steps
+    assert env.drones[0].mode == 7
+
+    # the snapshot is reusable
+    for i in range(100):
+        env.step()
+    assert env.restore_snapshot()
+    assert np.allclose(env.state(0), saved_state)
+
+    # a different flight mode or setpoint is never overwritten by a restore
+    env.reset(soft=True)
+    env.set_mode(0)
+    assert not env.restore_snapshot()
+    env.set_mode(7)
+    env.set_setpoint(0, np.array([0.5, 0.0, 0.0, 1.0]))
+    assert not env.restore_snapshot()
+    assert env.drones[0].mode == 7
+    assert np.all(env.drones[0].setpoint == np.array([0.5, 0.0, 0.0, 1.0]))
+
+    # different spawns have different snapshots
+    env.reset(start_pos=np.array([[1.0, 1.0, 1.0]]), soft=True)
+    assert not env.restore_snapshot()
+
+    # full resets invalidate everything
+    env.reset(start_pos=start_pos)
+    assert not env.restore_snapshot()
+
+    env.disconnect()
+
+
+def test_stabilize():
+    """Tests that stabilize only skips its steps for the same spawn, flight mode, and setpoint, and settles using the live generator."""
+    env = Aviary(
+        start_pos=np.array([[0.0, 0.0, 1.0]]),
+        start_orn=np.array([[0.0, 0.0, 0.0]]),
+        render=False,
+        drone_type="quadx",
+        seed=1,
+    )
+
+    # the first call runs the steps, the second restores them
+    env.set_mode(0)
+    assert not env.stabilize(10)
+    settled_state = env.all_states.copy()
+    env.reset(soft=True)
+    env.set_mode(0)
+    assert env.stabilize(10)
+    assert np.all(env.all_states == settled_state)
+
+    # changing the flight mode and setpoint runs the steps again, and keeps them
+    env.reset(soft=True)
+    env.set_mode(7)
+    env.set_setpoint(0, np.array([0.0, 0.0, 0.0, 1.0]))
+    assert not env.stabilize(10)
+    assert env.drones[0].mode == 7
+    assert np.all(env.drones[0].setpoint == np.array([0.0, 0.0, 0.0, 1.0]))
+
+    # the settled state depends on the seed
+    states = []
+    for seed in (1, 2):
+        env.clear_snapshots()
+        env.reset(soft=True)
+        env.set_mode(0)
+        env.reseed(np.random.default_rng(seed))
+        assert not env.stabilize(10)
+        states.append(env.all_states.copy())
+    assert not np.all(states[0] == states[1])
+
+    env.disconnect()
+
+
+def test_contacts():
+    """Tests the per physics step contact queries."""
+    # the starting position and orientations
+    start_pos = np.array([[0.0, 0.0, 0.5], [5.0, 0.0, 5.0]])
+    start_orn = np.zeros_like(start_pos)
+
+    # environment setup
+    env = Aviary(
+        start_pos=start_pos, start_orn=start_orn, render=False, drone_type="quadx"
+    )
+
+    # nothing has touched anything yet
+    assert not env.in_contact(env.drones[0].Id)
+    assert len(env.contacts_of(env.planeId)) == 0
+
+    # the first drone drops to the floor with no thrust, the second one holds position
+    env.set_mode([0, 7])
+    for i in range(200):
+        env.step()
+
+    assert env.in_contact(env.drones[0].Id)
+    assert env.planeId in env.contacts_of(env.drones[0].Id)
+    assert env.drones[0].Id in env.contacts_of(env.planeId)
+    assert env.contact_array[env.planeId, env.drones[0].Id]
+    assert not env.in_contact(env.drones[1].Id)
+
+    env.disconnect()
+
+
+def test_contact_array():
+    """Tests that the sparse contact array indexes the same as the dense equivalent."""
+    contacts = ContactArray(5)
+    dense = np.zeros((5, 5), dtype=bool)
+    for i, j in [(0, 1), (3, 1), (2, 2)]:
+        contacts.add(i, j)
+        dense[i, j] = dense[j, i] = True
+
+    assert np.all(np.asarray(contacts) == dense)
+    assert np.all(contacts[1] == dense[1])
+    assert np.all(contacts[[0, 3, 4]].sum(-1) == dense[[0, 3, 4]].sum(-1))
+    assert contacts[1, 3] and contacts[3, 1] and not contacts[0, 4]
+    assert contacts.contacts_of(1) == {0, 3}
+    assert np.any(contacts) and contacts.any()
+
+    # registering more bodies keeps existing contacts
+    contacts.register(10)
+    assert contacts.shape == (10, 10)
+    assert contacts[0, 1]
+
+    # copies are independent
+    masked = contacts.copy()
+    masked[0, 1] = False
+    masked.remove(1, 3)
+    assert not masked.in_contact(1)
+    assert contacts.in_contact(1)
+
+    contacts &= False
+    assert not np.any(contacts)
+
+
+def test_noise_pool():
+    """Tests that the noise pool hands out the same stream as the generator it draws from."""
+    pool = NoisePool(np.random.default_rng(42), block_size=7)
+    reference = np.random.default_rng(42)
+
+    # scalar draws, and array draws straddling block boundaries
+    for size in (None, 3, None, 5, 20, 1):
+        expected = reference.normal(4.0, size=size)
+        assert np.array_equal(pool.normal(4.0, size=size), expected)
+
+    # noiseless motors never draw from the pool
+    env = Aviary(
+        start_pos=np.array([[0.0, 0.0, 1.0]]),
+        start_orn=np.zeros((1, 3)),
+        render=False,
+        drone_type="quadx",
+    )
+    assert env.drones[0].motors.noise_pool is env.noise_pool
+    env.drones[0].motors.noisy = False
+    env._fleet = None
+    env.noise_pool.reset()
+    env.step()
+    assert env.noise_pool._cursor == 0
+    env.disconnect()
+
+
+def test_param_cache(tmp_path):
+    """Tests that parameter files are parsed once, and parsed again when they change."""
+    path = tmp_path / "params.yaml"
+    path.write_text("motor_params:\n  tau: 0.01\n")
+
+    calls = []
+
+    def derive(all_params):
+        calls.append(all_params)
+        return dict(tau=np.array([all_params["motor_params"]["tau"]]))
+
+    # copies are handed out for loads, derived constants are shared and read-only
+    params = load_params(str(path))
+    params["motor_params"]["tau"] = 1.0
+    assert load_params(str(path))["motor_params"]["tau"] == 0.01
+    derived = derive_params(str(path), derive)
+    assert derive_params(str(path), derive) is derived
+    assert len(calls) == 1
+    with pytest.raises(ValueError):
+        derived["tau"][0] = 1.0
+
+    # editing the file invalidates everything cached from it
+    path.write_text("motor_params:\n  tau: 0.02\n")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000_000))
+    assert derive_params(str(path), derive)["tau"][0] == 0.02
+    assert len(calls) == 2
+
+    # drones built from the same file share their constants
+    env = Aviary(
+        start_pos=np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 1.0]]),
+        start_orn=np.zeros((2, 3)),
+        render=False,
+        drone_type="quadx",
+    )
+    assert env.drones[0].Kp_ang_vel is env.drones[1].Kp_ang_vel
+    assert env.drones[0].motors.max_rpm is env.drones[1].motors.max_rpm
+    env.disconnect()
+
+
+def test_warmup():
+    """Tests that warming up compiles every kernel that is called from Python."""
+    signatures = PyFlyt.warmup()
+    assert len(signatures) == len(compile_helpers.JITTED_FUNCTIONS)
+
+    # kernels only called from other kernels are linked into their callers when loaded from the cache
+    for name in (
+        "Aviary._compute_fleet_states",
+        "QuadXFleet._jitted_fleet_physics",
+        "_jitted_fleet_control",
+        "Motors._jitted_compute_thrust_torque",
+        "Motors._jitted_lump_wrench",
+        "LiftingSurfaces._jitted_physics_update",
+        "_jitted_tabulate_aero_data",
+        "Gimbals._jitted_compute_rotation",
+        "Boosters._jitted_mass_update_mask",
+        "_jitted_all_finite",
+        "_jitted_all_within",
+        "MAFixedwingBaseEnv._jitted_compute_unit_rotation_forward",
+    ):
+        assert signatures[name] > 0, name
+
+    # the core warmup stays within the core
+    script = (
+        "import sys\n"
+        "from PyFlyt.core.utils.compile_helpers import warmup\n"
+        "warmup()\n"
+        "assert not any(m.startswith(('PyFlyt.pz_envs', 'PyFlyt.gym_envs', 'pettingzoo')) for m in sys.modules)\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_kernel_cache(tmp_path):
+    """Tests that compiled kernels are cached under `PYFLYT_CACHE_DIR`."""
+    script = (
+        "import numpy as np\n"
+        "from PyFlyt.core.utils.validation import check_finite\n"
+        "check_finite('values', np.zeros(3))\n"
+    )
+    env = dict(os.environ, PYFLYT_CACHE_DIR=str(tmp_path))
+    subprocess.run([sys.executable, "-c", script], env=env, check=True)
+
+    cached = [path.name for path in tmp_path.rglob("*.nbi")]
+    assert any("_jitted_all_finite" in name for name in cached), cached
+
+
+def test_jit_fallback(tmp_path):
+    """Tests that the plain NumPy kernels follow the same trajectories as the compiled ones."""
+    script = (
+        "import sys\n"
+        "import numpy as np\n"
+        "from PyFlyt.core import Aviary\n"
+        "env = Aviary(\n"
+        "    start_pos=np.array([[0.0, 0.0, 1.0], [3.0, 0.0, 1.0], [6.0, 0.0, 1.0]]),\n"
+        "    start_orn=np.zeros((3, 3)),\n"
+        "    drone_type=['quadx', 'fixedwing', 'rocket'],\n"
+        "    drone_options=[{}, dict(use_aero_tables=True), {}],\n"
+        "    render=False,\n"
+        "    seed=1,\n"
+        ")\n"
+        "env.set_setpoint(0, np.array([1.0, 1.0, 0.0, 2.0]))\n"
+        "env.set_setpoint(1, np.array([0.1, 0.1, 0.0, 0.8]))\n"
+        "env.set_setpoint(2, np.array([0.1, 0.1, 0.0, 1.0, 1.0, 0.0, 0.0]))\n"
+        "for _ in range(100):\n"
+        "    env.step()\n"
+        "np.save(sys.argv[1], env.all_states)\n"
+    )
+    for disable_jit in ("0", "1"):
+        env = dict(os.environ, PYFLYT_DISABLE_JIT=disable_jit)
+        output = str(tmp_path / f"states_{disable_jit}.npy")
+        subprocess.run([sys.executable, "-c", script, output], env=env, check=True)
+
+    assert np.allclose(
+        np.load(tmp_path / "states_0.npy"), np.load(tmp_path / "states_1.npy")
+    )
@@ -1,6 +1,8 @@
 """Tests the API compatibility of all PyFlyt Gymnasium Envs."""
 
 import itertools
+import subprocess
+import sys
 import warnings
 
 import gymnasium as gym
@@ -12,6 +14,9 @@ from gymnasium.utils.env_checker import check_env, data_equivalence
 import PyFlyt.gym_envs  # noqa
 from PyFlyt.gym_envs import FlattenWaypointEnv
 
+# seconds that `import PyFlyt.gym_envs` may take on top of importing gymnasium
+_IMPORT_TIME_BUDGET = 0.1
+
 # waypoint envs
 _WAYPOINT_ENV_CONFIGS = []
 for env_name, angle_representation, sparse_reward in itertools.product(
@@ -112,6 +117,51 @@ def test_seeding(env_config):
     env_2.close()
 
 
+@pytest.mark.parametrize(
+    "env_name",
+    [
+        "PyFlyt/QuadX-Hover-v4",
+        "PyFlyt/QuadX-Waypoints-v4",
+        "PyFlyt/Fixedwing-Waypoints-v3",
+    ],
+)
+def test_snapshot_resets(env_name):
+    """Test that `snapshot_resets` restores the first stabilized world on later resets instead of stepping it."""
+    env = gym.make(env_name, snapshot_resets=True)
+
+    # play out one episode, then count all aviary steps taken by the next reset
+    env.reset(seed=1)
+    aviary = env.unwrapped.env
+    settled_state = aviary.all_states.copy()
+    for _ in range(50):
+        env.step(env.action_space.sample())
+    aviary_step = aviary.step
+    num_steps = 0
+
+    def counting_step():
+        nonlocal num_steps
+        num_steps += 1
+        aviary_step()
+
+    aviary.step = counting_step
+    env.reset(seed=42)
+    assert env.unwrapped.env is aviary
+    assert num_steps == 0
+
+    # every later episode starts from the first episode's stabilized state, regardless of seed
+    assert np.all(aviary.all_states == settled_state)
+
+    # by default, each reset rebuilds and stabilizes the world with its own seed
+    env_1 = gym.make(env_name)
+    env_1.reset(seed=1)
+    aviary_1 = env_1.unwrapped.env
+    env_1.reset(seed=1)
+    assert env_1.unwrapped.env is not aviary_1
+
+    env.close()
+    env_1.close()
+
+
 @pytest.mark.parametrize("env_config", _WAYPOINT_ENV_CONFIGS)
 @pytest.mark.parametrize("context_length", [2, 8])
 def test_flatten_env(env_config, context_length):
@@ -154,3 +204,25 @@ def test_render(env_config, render_mode):
         ), f"Expected 4 channels in the rendered image, got {frame.shape[-1]}."
 
     env.close()
+
+
+def test_import_time():
+    """Tests that registering the environments stays cheap, the simulation is only loaded by `gym.make`."""
+    script = (
+        "import sys, time\n"
+        "import gymnasium\n"
+        "start = time.perf_counter()\n"
+        "import PyFlyt.gym_envs\n"
+        "print(time.perf_counter() - start)\n"
+        "heavy = ('pybullet', 'pybullet_data', 'numba', 'yaml', 'PyFlyt.core.aviary')\n"
+        "print(','.join(name for name in heavy if name in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    import_time, loaded = result.stdout.splitlines()
+
+    assert not loaded, f"`import PyFlyt.gym_envs` loaded {loaded}."
+    assert (
+        float(import_time) < _IMPORT_TIME_BUDGET
+    ), f"`import PyFlyt.gym_envs` took {import_time}s, the budget is {_IMPORT_TIME_BUDGET}s."